@@ -72,6 +72,9 @@ def run_migrations_online() -> None:
         context.configure(
             connection=connection,
             target_metadata=target_metadata,
+            # Commit each revision on its own so locks taken by one migration
+            # are released before the next one starts
+            transaction_per_migration=True,
         )
 
         with context.begin_transaction():
@@ -31,8 +31,8 @@ def upgrade() -> None:
         sa.Column('display_order', sa.Integer(), nullable=False, server_default='0'),
         sa.Column('is_collapsible', sa.Boolean(), nullable=False, server_default='true'),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
         sa.ForeignKeyConstraint(['category_id'], ['categories.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
@@ -54,20 +54,23 @@ def upgrade() -> None:
         'category_attributes',
         sa.Column('segment_id', postgresql.UUID(as_uuid=True), nullable=True)
     )
-    op.create_foreign_key(
-        'fk_category_attributes_segment_id',
-        'category_attributes',
-        'attribute_segments',
-        ['segment_id'],
-        ['id'],
-        ondelete='SET NULL'
-    )
-    op.create_index(
-        op.f('ix_category_attributes_segment_id'),
-        'category_attributes',
-        ['segment_id'],
-        unique=False
-    )
+    # NOT VALID skips the scan of existing category_attributes rows while the
+    # ALTER holds its lock; b3f1d8c6a2e9 validates it under a weaker lock
+    op.execute(sa.text("""
+        ALTER TABLE category_attributes
+        ADD CONSTRAINT fk_category_attributes_segment_id
+        FOREIGN KEY (segment_id) REFERENCES attribute_segments (id)
+        ON DELETE SET NULL NOT VALID
+    """))
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_category_attributes_segment_id'),
+            'category_attributes',
+            ['segment_id'],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
@@ -28,10 +28,10 @@ def upgrade() -> None:
         sa.Column('otp_code', sa.String(length=6), nullable=False),
         sa.Column('purpose', sa.String(length=50), nullable=False, server_default='login'),
         sa.Column('is_verified', sa.Boolean(), nullable=False, server_default='false'),
-        sa.Column('expires_at', sa.DateTime(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
         sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
         sa.Column('max_attempts', sa.Integer(), nullable=False, server_default='3'),
-        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
     )
     
     # Create indexes
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.utils.migrations import run_batched_update, set_migration_timeouts, with_lock_retry
+
 
 # revision identifiers, used by Alembic.
 revision: str = '5b5c330eeab1'
@@ -19,8 +21,33 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Add is_mobile_verified column to users table
-    op.add_column('users', sa.Column('is_mobile_verified', sa.Boolean(), nullable=False, server_default='false'))
+    set_migration_timeouts()
+    
+    # Add is_mobile_verified column to users table in three steps so no step
+    # rewrites users or scans it while holding a long lock:
+    # 1. Nullable column with a constant default (metadata-only on Postgres 11+)
+    with_lock_retry(lambda: op.add_column(
+        'users', sa.Column('is_mobile_verified', sa.Boolean(), nullable=True, server_default='false')
+    ))
+    
+    # 2. Backfill any NULLs in committed batches (a no-op on Postgres 11+)
+    with op.get_context().autocommit_block():
+        run_batched_update("""
+            WITH batch AS (
+                SELECT ctid FROM users
+                WHERE is_mobile_verified IS NULL
+                LIMIT :batch_size
+            )
+            UPDATE users
+            SET is_mobile_verified = false
+            FROM batch
+            WHERE users.ctid = batch.ctid
+        """)
+    
+    # 3. Enforce NOT NULL now that every row has a value, under fresh
+    # timeouts as the backfill's autocommit block ended the transaction
+    set_migration_timeouts()
+    with_lock_retry(lambda: op.alter_column('users', 'is_mobile_verified', nullable=False))
 
 
 def downgrade() -> None:
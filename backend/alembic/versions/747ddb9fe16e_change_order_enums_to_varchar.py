@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from app.utils.migrations import set_migration_timeouts, swap_column_types
+
 
 # revision identifiers, used by Alembic.
 revision: str = '747ddb9fe16e'
@@ -22,49 +24,27 @@ def upgrade() -> None:
     # Convert enum columns to VARCHAR to use enum values instead of names
     # This allows SQLAlchemy to use the enum value (e.g., "placed") instead of name (e.g., "PLACED")
     
-    # Convert order_status from enum to VARCHAR(50)
-    op.execute(sa.text("""
-        ALTER TABLE orders 
-        ALTER COLUMN order_status TYPE VARCHAR(50) 
-        USING order_status::text
-    """))
-    
-    # Convert payment_mode from enum to VARCHAR(20)
-    op.execute(sa.text("""
-        ALTER TABLE orders 
-        ALTER COLUMN payment_mode TYPE VARCHAR(20) 
-        USING payment_mode::text
-    """))
+    set_migration_timeouts()
     
-    # Convert payment_status from enum to VARCHAR(20)
-    op.execute(sa.text("""
-        ALTER TABLE orders 
-        ALTER COLUMN payment_status TYPE VARCHAR(20) 
-        USING payment_status::text
-    """))
+    # Converted through shadow columns backfilled in batches, so orders stays
+    # readable and writable instead of being rewritten under an exclusive lock.
+    swap_column_types(
+        "orders",
+        {
+            "order_status": "VARCHAR(50)",
+            "payment_mode": "VARCHAR(20)",
+            "payment_status": "VARCHAR(20)",
+        },
+        indexes={"ix_orders_order_status": "order_status"},
+    )
 
 
 def downgrade() -> None:
     # Convert back to enum types
     # Note: This assumes the enum types still exist in the database
-    
-    # Convert order_status back to enum
-    op.execute(sa.text("""
-        ALTER TABLE orders 
-        ALTER COLUMN order_status TYPE orderstatus 
-        USING order_status::orderstatus
-    """))
-    
-    # Convert payment_mode back to enum
-    op.execute(sa.text("""
-        ALTER TABLE orders 
-        ALTER COLUMN payment_mode TYPE paymentmode 
-        USING payment_mode::paymentmode
-    """))
-    
-    # Convert payment_status back to enum
     op.execute(sa.text("""
         ALTER TABLE orders 
-        ALTER COLUMN payment_status TYPE paymentstatus 
-        USING payment_status::paymentstatus
+        ALTER COLUMN order_status TYPE orderstatus USING order_status::orderstatus,
+        ALTER COLUMN payment_mode TYPE paymentmode USING payment_mode::paymentmode,
+        ALTER COLUMN payment_status TYPE paymentstatus USING payment_status::paymentstatus
     """))
@@ -11,6 +11,8 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
+from app.utils.migrations import set_migration_timeouts, swap_column_types
+
 # revision identifiers, used by Alembic.
 revision: str = '7bd9d1d11359'
 down_revision: Union[str, None] = 'fb072af66e41'
@@ -22,12 +24,10 @@ def upgrade() -> None:
     # Convert users.role from enum to VARCHAR to use enum values instead of names
     # This allows SQLAlchemy to use the enum value (e.g., "delivery_partner") instead of name (e.g., "DELIVERY_PARTNER")
     
-    # Convert role from enum to VARCHAR(20)
-    op.execute(sa.text("""
-        ALTER TABLE users 
-        ALTER COLUMN role TYPE VARCHAR(20) 
-        USING role::text
-    """))
+    set_migration_timeouts()
+    
+    # Convert role from enum to VARCHAR(20) through a batched shadow column
+    swap_column_types("users", {"role": "VARCHAR(20)"})
 
 
 def downgrade() -> None:
@@ -29,16 +29,17 @@ def upgrade() -> None:
         sa.Column('discount_value', sa.Numeric(10, 2), nullable=False),
         sa.Column('min_order_amount', sa.Numeric(10, 2), nullable=False, server_default='0.00'),
         sa.Column('max_discount', sa.Numeric(10, 2), nullable=True),
-        sa.Column('expiry_date', sa.DateTime(), nullable=True),
+        sa.Column('expiry_date', sa.DateTime(timezone=True), nullable=True),
         sa.Column('usage_limit', sa.Integer(), nullable=True),
         sa.Column('used_count', sa.Integer(), nullable=False, server_default='0'),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.Column('updated_at', sa.DateTime(), nullable=True),
-        sa.PrimaryKeyConstraint('id')
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        # Built inline by CREATE TABLE rather than as a second statement;
+        # secondary indexes are created by c7e4a9d2b815 once tables hold data.
+        sa.UniqueConstraint('code', name='ix_coupons_code'),
     )
-    op.create_index(op.f('ix_coupons_code'), 'coupons', ['code'], unique=True)
-    op.create_index(op.f('ix_coupons_is_active'), 'coupons', ['is_active'], unique=False)
     
     # Create coupon_usages table
     op.create_table(
@@ -48,21 +49,32 @@ def upgrade() -> None:
         sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=True),
         sa.Column('order_id', postgresql.UUID(as_uuid=True), nullable=False),
         sa.Column('discount_amount', sa.Numeric(10, 2), nullable=False),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.func.now()),
-        sa.ForeignKeyConstraint(['coupon_id'], ['coupons.id'], ondelete='CASCADE'),
-        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL'),
-        sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ondelete='CASCADE'),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        # FK checks are deferred to commit so bulk loads validate once per
+        # transaction instead of once per statement
+        sa.ForeignKeyConstraint(['coupon_id'], ['coupons.id'], ondelete='CASCADE', deferrable=True, initially='DEFERRED'),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='SET NULL', deferrable=True, initially='DEFERRED'),
+        sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ondelete='CASCADE', deferrable=True, initially='DEFERRED'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_coupon_usages_coupon_id'), 'coupon_usages', ['coupon_id'], unique=False)
-    op.create_index(op.f('ix_coupon_usages_user_id'), 'coupon_usages', ['user_id'], unique=False)
-    op.create_index(op.f('ix_coupon_usages_order_id'), 'coupon_usages', ['order_id'], unique=False)
     
-    # Add coupon fields to carts table
-    op.add_column('carts', sa.Column('coupon_id', postgresql.UUID(as_uuid=True), nullable=True))
-    op.add_column('carts', sa.Column('discount_amount', sa.Numeric(10, 2), nullable=False, server_default='0.00'))
-    op.create_index(op.f('ix_carts_coupon_id'), 'carts', ['coupon_id'], unique=False)
-    op.create_foreign_key('fk_carts_coupon', 'carts', 'coupons', ['coupon_id'], ['id'], ondelete='SET NULL')
+    # Add coupon fields to carts table (one ALTER TABLE for columns and FK)
+    op.execute(sa.text("""
+        ALTER TABLE carts
+        ADD COLUMN coupon_id UUID,
+        ADD COLUMN discount_amount NUMERIC(10, 2) NOT NULL DEFAULT 0.00,
+        ADD CONSTRAINT fk_carts_coupon FOREIGN KEY (coupon_id)
+            REFERENCES coupons (id) ON DELETE SET NULL
+            DEFERRABLE INITIALLY DEFERRED
+    """))
+    
+    # carts already holds live rows: build the index CONCURRENTLY (outside the
+    # migration transaction) so cart writes are not blocked while it builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f('ix_carts_coupon_id'), 'carts', ['coupon_id'], unique=False,
+            postgresql_concurrently=True, if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
@@ -73,13 +85,8 @@ def downgrade() -> None:
     op.drop_column('carts', 'coupon_id')
     
     # Drop coupon_usages table
-    op.drop_index(op.f('ix_coupon_usages_order_id'), table_name='coupon_usages')
-    op.drop_index(op.f('ix_coupon_usages_user_id'), table_name='coupon_usages')
-    op.drop_index(op.f('ix_coupon_usages_coupon_id'), table_name='coupon_usages')
     op.drop_table('coupon_usages')
     
     # Drop coupons table
-    op.drop_index(op.f('ix_coupons_is_active'), table_name='coupons')
-    op.drop_index(op.f('ix_coupons_code'), table_name='coupons')
     op.drop_table('coupons')
 
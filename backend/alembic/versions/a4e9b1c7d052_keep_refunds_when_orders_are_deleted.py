@@ -0,0 +1,60 @@
+"""keep_refunds_when_orders_are_deleted
+
+Revision ID: a4e9b1c7d052
+Revises: f5a8d2c6e913
+Create Date: 2026-01-21 02:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migrations import set_migration_timeouts, with_lock_retry
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e9b1c7d052'
+down_revision: Union[str, None] = 'f5a8d2c6e913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    set_migration_timeouts()
+    
+    # Refunds are ledger rows kept for audit: deleting an order detaches its
+    # refunds instead of cascading into them. The FK is swapped as NOT VALID
+    # so the ALTER does not scan refunds while holding its lock.
+    def swap_order_fk() -> None:
+        op.execute(sa.text("""
+            ALTER TABLE refunds
+            ALTER COLUMN order_id DROP NOT NULL,
+            DROP CONSTRAINT refunds_order_id_fkey,
+            ADD CONSTRAINT refunds_order_id_fkey FOREIGN KEY (order_id)
+                REFERENCES orders (id) ON DELETE SET NULL NOT VALID
+        """))
+    
+    with_lock_retry(swap_order_fk)
+    
+    # Validating only takes a SHARE UPDATE EXCLUSIVE lock; run it after the
+    # swap has committed so refunds stays writable meanwhile
+    with op.get_context().autocommit_block():
+        op.execute(sa.text("ALTER TABLE refunds VALIDATE CONSTRAINT refunds_order_id_fkey"))
+
+
+def downgrade() -> None:
+    set_migration_timeouts()
+    
+    # Fails if refunds of deleted orders were kept meanwhile; those rows have
+    # to be archived or removed before the column can be NOT NULL again
+    def restore_order_fk() -> None:
+        op.execute(sa.text("""
+            ALTER TABLE refunds
+            DROP CONSTRAINT refunds_order_id_fkey,
+            ADD CONSTRAINT refunds_order_id_fkey FOREIGN KEY (order_id)
+                REFERENCES orders (id) ON DELETE CASCADE,
+            ALTER COLUMN order_id SET NOT NULL
+        """))
+    
+    with_lock_retry(restore_order_fk)
@@ -0,0 +1,31 @@
+"""validate_category_attribute_segment_fk
+
+Revision ID: b3f1d8c6a2e9
+Revises: 5b5c330eeab1
+Create Date: 2026-01-21 02:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f1d8c6a2e9'
+down_revision: Union[str, None] = '5b5c330eeab1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 2b6a185e3616 adds this FK as NOT VALID; validating it only takes a
+    # SHARE UPDATE EXCLUSIVE lock, so reads and writes continue meanwhile
+    op.execute(sa.text(
+        "ALTER TABLE category_attributes VALIDATE CONSTRAINT fk_category_attributes_segment_id"
+    ))
+
+
+def downgrade() -> None:
+    # A validated constraint cannot be marked NOT VALID again; nothing to undo
+    pass
@@ -0,0 +1,64 @@
+"""add_coupon_usage_composite_indexes
+
+Revision ID: b4d8e2f6a913
+Revises: f1c6a8e4b392
+Create Date: 2026-01-21 04:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4d8e2f6a913'
+down_revision: Union[str, None] = 'f1c6a8e4b392'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite indexes shaped after the usage queries: redemptions of a
+    # coupon within a time window, and whether a user already used a coupon.
+    # Their leading columns also serve plain coupon_id / user_id lookups, so
+    # the single-column indexes they cover are dropped.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_coupon_usages_coupon_id_created_at', 'coupon_usages',
+            ['coupon_id', sa.text('created_at DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_coupon_usages_user_id_coupon_id', 'coupon_usages',
+            ['user_id', 'coupon_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_coupon_usages_coupon_id', table_name='coupon_usages',
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.drop_index(
+            'ix_coupon_usages_user_id', table_name='coupon_usages',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_coupon_usages_coupon_id', 'coupon_usages', ['coupon_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.create_index(
+            'ix_coupon_usages_user_id', 'coupon_usages', ['user_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_coupon_usages_user_id_coupon_id', table_name='coupon_usages',
+            postgresql_concurrently=True, if_exists=True,
+        )
+        op.drop_index(
+            'ix_coupon_usages_coupon_id_created_at', table_name='coupon_usages',
+            postgresql_concurrently=True, if_exists=True,
+        )
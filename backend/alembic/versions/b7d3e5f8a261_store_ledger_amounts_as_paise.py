@@ -0,0 +1,63 @@
+"""store_ledger_amounts_as_paise
+
+Revision ID: b7d3e5f8a261
+Revises: a4e9b1c7d052
+Create Date: 2026-01-21 02:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from app.utils.migrations import set_migration_timeouts, swap_column_types
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3e5f8a261'
+down_revision: Union[str, None] = 'a4e9b1c7d052'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Money columns of the return/refund/payout ledger, mapped to whether they
+# carry a zero server default
+MONEY_COLUMNS = {
+    'return_requests': {'refund_amount': True},
+    'refunds': {'amount': False},
+    'vendor_payouts': {
+        'gross_amount': True,
+        'commission_amount': True,
+        'refund_deductions': True,
+        'net_amount': False,
+    },
+    'vendor_payout_items': {
+        'order_amount': False,
+        'commission': False,
+        'net_amount': False,
+    },
+}
+
+
+def _swap_money_columns(type_: str, using: str, default: str) -> None:
+    # Converted through shadow columns backfilled in batches, so the ledger
+    # tables stay readable and writable instead of being rewritten (and
+    # their indexes rebuilt) under an exclusive lock
+    for table, columns in MONEY_COLUMNS.items():
+        swap_column_types(
+            table,
+            {column: type_ for column in columns},
+            using={column: using for column in columns},
+            defaults={column: default for column, has_default in columns.items() if has_default},
+        )
+
+
+def upgrade() -> None:
+    set_migration_timeouts()
+    
+    # Amounts become integer paise (see app.models.base.Paise) so ledger sums
+    # and payout reports aggregate int64 instead of NUMERIC
+    _swap_money_columns('BIGINT', 'round({column} * 100)::bigint', '0')
+
+
+def downgrade() -> None:
+    set_migration_timeouts()
+    
+    _swap_money_columns('NUMERIC(10, 2)', '({column} / 100.0)::numeric(10, 2)', '0.00')
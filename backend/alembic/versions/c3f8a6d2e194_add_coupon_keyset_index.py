@@ -0,0 +1,37 @@
+"""add_coupon_keyset_index
+
+Revision ID: c3f8a6d2e194
+Revises: e6a2c9f3b847
+Create Date: 2026-01-21 03:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a6d2e194'
+down_revision: Union[str, None] = 'e6a2c9f3b847'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The admin coupon list pages by (created_at, id) newest first; this
+    # index lets a cursor seek straight to the next page
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_coupons_created_at_id', 'coupons',
+            [sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_coupons_created_at_id', table_name='coupons',
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -0,0 +1,36 @@
+"""make_otp_verify_index_partial
+
+Revision ID: c5e9a3b7d124
+Revises: b4d8e2f6a913
+Create Date: 2026-01-21 04:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migrations import rebuild_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e9a3b7d124'
+down_revision: Union[str, None] = 'b4d8e2f6a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the verify lookup (latest unverified OTP for a mobile/purpose):
+    # the partial predicate drops every used OTP from the index and the
+    # INCLUDE columns answer the expiry/attempt checks without a heap visit
+    rebuild_index_concurrently(
+        'idx_mobile_purpose', 'otps',
+        ['mobile_number', 'purpose', sa.text('created_at DESC')],
+        postgresql_include=['expires_at', 'attempts'],
+        postgresql_where=sa.text('is_verified = false'),
+    )
+
+
+def downgrade() -> None:
+    rebuild_index_concurrently('idx_mobile_purpose', 'otps', ['mobile_number', 'purpose'])
@@ -0,0 +1,35 @@
+"""add_coupon_secondary_indexes
+
+Revision ID: c7e4a9d2b815
+Revises: a1b2c3d4e5f6
+Create Date: 2024-01-12 12:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e4a9d2b815'
+down_revision: Union[str, None] = 'a1b2c3d4e5f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Secondary indexes for the coupon tables, split out of a1b2c3d4e5f6 so
+    # coupons can be bulk-loaded with `alembic upgrade a1b2c3d4e5f6` before
+    # any of these indexes exist, then built once over the loaded rows.
+    op.create_index(op.f('ix_coupons_is_active'), 'coupons', ['is_active'], unique=False, if_not_exists=True)
+    op.create_index(op.f('ix_coupon_usages_coupon_id'), 'coupon_usages', ['coupon_id'], unique=False, if_not_exists=True)
+    op.create_index(op.f('ix_coupon_usages_user_id'), 'coupon_usages', ['user_id'], unique=False, if_not_exists=True)
+    op.create_index(op.f('ix_coupon_usages_order_id'), 'coupon_usages', ['order_id'], unique=False, if_not_exists=True)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_coupon_usages_order_id'), table_name='coupon_usages')
+    op.drop_index(op.f('ix_coupon_usages_user_id'), table_name='coupon_usages')
+    op.drop_index(op.f('ix_coupon_usages_coupon_id'), table_name='coupon_usages')
+    op.drop_index(op.f('ix_coupons_is_active'), table_name='coupons')
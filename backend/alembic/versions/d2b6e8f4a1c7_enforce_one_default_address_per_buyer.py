@@ -0,0 +1,65 @@
+"""enforce_one_default_address_per_buyer
+
+Revision ID: d2b6e8f4a1c7
+Revises: c8f1a6e2d394
+Create Date: 2026-01-21 03:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migrations import set_migration_timeouts, with_lock_retry
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b6e8f4a1c7'
+down_revision: Union[str, None] = 'c8f1a6e2d394'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    set_migration_timeouts()
+    
+    # Earlier races could leave a buyer with several active defaults: keep
+    # the most recently created one so the constraint can be added
+    op.execute(sa.text("""
+        UPDATE delivery_addresses
+        SET is_default = false
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT id, row_number() OVER (
+                    PARTITION BY buyer_id ORDER BY created_at DESC
+                ) AS position
+                FROM delivery_addresses
+                WHERE is_default AND is_active
+            ) ranked
+            WHERE position > 1
+        )
+    """))
+    
+    # At most one active default per buyer. A deferrable exclusion
+    # constraint rather than a unique index: set_default_address flips the
+    # old and new default in one UPDATE, and a unique index would reject the
+    # intermediate row state. Soft-deleted addresses keep their flag, so they
+    # are left out. The backing index also serves get_default_address.
+    def add_constraint() -> None:
+        op.execute(sa.text("""
+            ALTER TABLE delivery_addresses
+            ADD CONSTRAINT ex_delivery_addresses_one_default
+            EXCLUDE USING btree (buyer_id WITH =)
+            WHERE (is_default AND is_active)
+            DEFERRABLE INITIALLY DEFERRED
+        """))
+    
+    with_lock_retry(add_constraint)
+
+
+def downgrade() -> None:
+    set_migration_timeouts()
+    
+    with_lock_retry(lambda: op.execute(sa.text(
+        "ALTER TABLE delivery_addresses DROP CONSTRAINT ex_delivery_addresses_one_default"
+    )))
@@ -0,0 +1,47 @@
+"""add_coupon_search_trigram_indexes
+
+Revision ID: d4a9e7b3f215
+Revises: c3f8a6d2e194
+Create Date: 2026-01-21 03:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a9e7b3f215'
+down_revision: Union[str, None] = 'c3f8a6d2e194'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns matched by the admin coupon search (ILIKE '%term%')
+SEARCH_COLUMNS = ('code', 'description')
+
+
+def upgrade() -> None:
+    # A leading wildcard rules out btree indexes; trigram GIN indexes let
+    # the search skip the sequential scan over coupons
+    op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    
+    with op.get_context().autocommit_block():
+        for column in SEARCH_COLUMNS:
+            op.create_index(
+                f'ix_coupons_{column}_trgm', 'coupons', [column],
+                unique=False, postgresql_using='gin',
+                postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True, if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    # pg_trgm is left installed; other schemas may depend on it
+    with op.get_context().autocommit_block():
+        for column in SEARCH_COLUMNS:
+            op.drop_index(
+                f'ix_coupons_{column}_trgm', table_name='coupons',
+                postgresql_concurrently=True, if_exists=True,
+            )
@@ -4,12 +4,14 @@ Revision ID: d6575a3085e7
 Revises: 7bd9d1d11359
 Create Date: 2026-01-11 19:10:00.000000
 
+Superseded by 7bd9d1d11359, which already converts users.role to
+VARCHAR(20). Re-running the conversion would rewrite users a second time
+for no change, so this revision is a no-op kept only to preserve the
+revision chain for deployed databases.
+
 """
 from typing import Sequence, Union
 
-from alembic import op
-import sqlalchemy as sa
-
 # revision identifiers, used by Alembic.
 revision: str = 'd6575a3085e7'
 down_revision: Union[str, None] = '7bd9d1d11359'
@@ -18,23 +20,10 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # Convert users.role from enum to VARCHAR to use enum values instead of names
-    # This allows SQLAlchemy to use the enum value (e.g., "delivery_partner") instead of name (e.g., "DELIVERY_PARTNER")
-    
-    # Convert role from enum to VARCHAR(20)
-    op.execute(sa.text("""
-        ALTER TABLE users 
-        ALTER COLUMN role TYPE VARCHAR(20) 
-        USING role::text
-    """))
+    # Superseded by 7bd9d1d11359
+    pass
 
 
 def downgrade() -> None:
-    # Convert back to enum type
-    # Note: This assumes the enum type still exists in the database
-    
-    op.execute(sa.text("""
-        ALTER TABLE users 
-        ALTER COLUMN role TYPE userrole 
-        USING role::userrole
-    """))
+    # Superseded by 7bd9d1d11359
+    pass
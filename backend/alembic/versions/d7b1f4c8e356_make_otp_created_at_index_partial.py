@@ -0,0 +1,33 @@
+"""make_otp_created_at_index_partial
+
+Revision ID: d7b1f4c8e356
+Revises: c5e9a3b7d124
+Create Date: 2026-01-21 04:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migrations import rebuild_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7b1f4c8e356'
+down_revision: Union[str, None] = 'c5e9a3b7d124'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # created_at only matters to the sweep over stale, unverified OTPs, so the
+    # index skips verified rows instead of growing with every OTP ever sent
+    rebuild_index_concurrently(
+        'ix_otps_created_at', 'otps', ['created_at'],
+        postgresql_where=sa.text('is_verified = false'),
+    )
+
+
+def downgrade() -> None:
+    rebuild_index_concurrently('ix_otps_created_at', 'otps', ['created_at'])
@@ -0,0 +1,70 @@
+"""convert_timestamps_to_timestamptz
+
+Revision ID: d9a7c3e15b42
+Revises: b3f1d8c6a2e9
+Create Date: 2026-01-21 02:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migrations import set_migration_timeouts, with_lock_retry
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a7c3e15b42'
+down_revision: Union[str, None] = 'b3f1d8c6a2e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns created as TIMESTAMP WITHOUT TIME ZONE by earlier revisions of
+# this schema; fresh databases already create them as TIMESTAMPTZ
+TIMESTAMP_COLUMNS = {
+    'attribute_segments': ['created_at', 'updated_at'],
+    'otps': ['expires_at', 'created_at'],
+    'coupons': ['expiry_date', 'created_at', 'updated_at'],
+    'coupon_usages': ['created_at'],
+    'delivery_partners': ['created_at', 'updated_at'],
+    'orders': ['picked_at', 'packed_at', 'out_for_delivery_at'],
+}
+
+
+def _alter_timestamp_columns(target_type: str, source_type: str) -> None:
+    bind = op.get_bind()
+    
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        pending = [
+            row[0] for row in bind.execute(sa.text("""
+                SELECT column_name FROM information_schema.columns
+                WHERE table_name = :table
+                  AND column_name = ANY(:columns)
+                  AND data_type = :source_type
+            """), {"table": table, "columns": columns, "source_type": source_type})
+        ]
+        if not pending:
+            continue
+        
+        alterations = ", ".join(
+            f"ALTER COLUMN {column} TYPE {target_type}" for column in pending
+        )
+        
+        def alter_table() -> None:
+            # Existing values are UTC. With the session in UTC, Postgres 12+
+            # converts TIMESTAMP <-> TIMESTAMPTZ without rewriting the table.
+            op.execute(sa.text("SET LOCAL TimeZone = 'UTC'"))
+            op.execute(sa.text(f"ALTER TABLE {table} {alterations}"))
+        
+        with_lock_retry(alter_table)
+
+
+def upgrade() -> None:
+    set_migration_timeouts()
+    _alter_timestamp_columns('TIMESTAMPTZ', 'timestamp without time zone')
+
+
+def downgrade() -> None:
+    set_migration_timeouts()
+    _alter_timestamp_columns('TIMESTAMP', 'timestamp with time zone')
@@ -0,0 +1,64 @@
+"""add_refund_and_return_composite_indexes
+
+Revision ID: e2c4f7a19b36
+Revises: d9a7c3e15b42
+Create Date: 2026-01-21 02:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c4f7a19b36'
+down_revision: Union[str, None] = 'd9a7c3e15b42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Composite indexes shaped after the list queries: an order's refunds or
+    # returns in a given status, and the status queues ordered by newest
+    # first. Their leading columns also serve plain order_id / status
+    # lookups, so the single-column indexes they cover are dropped.
+    with op.get_context().autocommit_block():
+        for table in ('refunds', 'return_requests'):
+            op.create_index(
+                f'ix_{table}_order_id_status', table, ['order_id', 'status'],
+                unique=False, postgresql_concurrently=True, if_not_exists=True,
+            )
+            op.create_index(
+                f'ix_{table}_status_created_at', table, ['status', sa.text('created_at DESC')],
+                unique=False, postgresql_concurrently=True, if_not_exists=True,
+            )
+            op.drop_index(
+                f'ix_{table}_order_id', table_name=table,
+                postgresql_concurrently=True, if_exists=True,
+            )
+            op.drop_index(
+                f'ix_{table}_status', table_name=table,
+                postgresql_concurrently=True, if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in ('refunds', 'return_requests'):
+            op.create_index(
+                f'ix_{table}_order_id', table, ['order_id'],
+                unique=False, postgresql_concurrently=True, if_not_exists=True,
+            )
+            op.create_index(
+                f'ix_{table}_status', table, ['status'],
+                unique=False, postgresql_concurrently=True, if_not_exists=True,
+            )
+            op.drop_index(
+                f'ix_{table}_status_created_at', table_name=table,
+                postgresql_concurrently=True, if_exists=True,
+            )
+            op.drop_index(
+                f'ix_{table}_order_id_status', table_name=table,
+                postgresql_concurrently=True, if_exists=True,
+            )
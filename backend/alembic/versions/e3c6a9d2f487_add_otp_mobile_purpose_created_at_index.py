@@ -0,0 +1,46 @@
+"""add_otp_mobile_purpose_created_at_index
+
+Revision ID: e3c6a9d2f487
+Revises: d7b1f4c8e356
+Create Date: 2026-01-21 04:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3c6a9d2f487'
+down_revision: Union[str, None] = 'd7b1f4c8e356'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves the full-history lookups (send rate limit over the last hour,
+    # latest OTP for a mobile/purpose). Its leading column also serves plain
+    # mobile_number lookups, so ix_otps_mobile_number is dropped.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_otps_mobile_purpose_created_at', 'otps',
+            ['mobile_number', 'purpose', 'created_at'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_otps_mobile_number', table_name='otps',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_otps_mobile_number', 'otps', ['mobile_number'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_otps_mobile_purpose_created_at', table_name='otps',
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -5,11 +5,14 @@ Revises: f3b0ee454491
 Create Date: 2026-01-11 17:33:33.429076
 
 """
+import os
 from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
 
+from app.utils.migrations import run_batched_update
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'e460fe00f043'
@@ -20,84 +23,126 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     # Step 1: Add new timestamp columns FIRST (before enum changes)
-    op.add_column('orders', sa.Column('picked_at', sa.DateTime(), nullable=True))
-    op.add_column('orders', sa.Column('packed_at', sa.DateTime(), nullable=True))
-    op.add_column('orders', sa.Column('out_for_delivery_at', sa.DateTime(), nullable=True))
+    op.add_column('orders', sa.Column('picked_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('orders', sa.Column('packed_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('orders', sa.Column('out_for_delivery_at', sa.DateTime(timezone=True), nullable=True))
     
     # Step 2: Add new enum values
-    # Postgres requires ALTER TYPE ... ADD VALUE to run outside a transaction.
-    # Alembic provides an autocommit block for this.
+    # All four values go in one DO block: a single round-trip and a single
+    # catalog change instead of one per value. ADD VALUE inside a DO block
+    # needs Postgres 12+, and the block must run outside the migration
+    # transaction so the values are committed before the backfill uses them.
     new_values = ["placed", "picked", "packed", "out_for_delivery"]
+    # DDL can't be reliably parameterized across drivers; values are fixed constants here.
+    add_values = " ".join(
+        f"ALTER TYPE orderstatus ADD VALUE IF NOT EXISTS '{value}';" for value in new_values
+    )
     with op.get_context().autocommit_block():
-        for value in new_values:
-            # DDL can't be reliably parameterized across drivers; values are fixed constants here.
-            op.execute(sa.text(f"ALTER TYPE orderstatus ADD VALUE IF NOT EXISTS '{value}'"))
+        op.execute(sa.text(f"DO $$ BEGIN {add_values} END $$"))
     
     # Step 3: Migrate existing data (now enum values are available)
-    # PENDING -> PLACED
-    op.execute(sa.text("""
-        UPDATE orders 
-        SET order_status = 'placed'::orderstatus
-        WHERE order_status::text = 'pending'
-    """))
-    
-    # PROCESSING -> PICKED
-    op.execute(sa.text("""
-        UPDATE orders 
-        SET order_status = 'picked'::orderstatus, picked_at = processing_at
-        WHERE order_status::text = 'processing' AND processing_at IS NOT NULL
-    """))
-    op.execute(sa.text("""
-        UPDATE orders 
-        SET order_status = 'picked'::orderstatus
-        WHERE order_status::text = 'processing' AND processing_at IS NULL
-    """))
+    #   PENDING -> PLACED
+    #   PROCESSING -> PICKED (picked_at = processing_at)
+    #   SHIPPED -> OUT_FOR_DELIVERY (out_for_delivery_at = shipped_at)
+    # Only labels that exist on the enum can match any row, and comparing the
+    # enum directly avoids an order_status::text cast on every row scanned.
+    legacy_statuses = [
+        row[0] for row in op.get_bind().execute(sa.text("""
+            SELECT enumlabel FROM pg_enum
+            JOIN pg_type ON pg_type.oid = pg_enum.enumtypid
+            WHERE pg_type.typname = 'orderstatus'
+              AND enumlabel IN ('pending', 'processing', 'shipped')
+        """))
+    ]
+    if not legacy_statuses:
+        return
+    predicate = "order_status IN ({})".format(
+        ", ".join(f"'{status}'" for status in legacy_statuses)
+    )
     
-    # SHIPPED -> OUT_FOR_DELIVERY
-    op.execute(sa.text("""
-        UPDATE orders 
-        SET order_status = 'out_for_delivery'::orderstatus, out_for_delivery_at = shipped_at
-        WHERE order_status::text = 'shipped' AND shipped_at IS NOT NULL
-    """))
-    op.execute(sa.text("""
-        UPDATE orders 
-        SET order_status = 'out_for_delivery'::orderstatus
-        WHERE order_status::text = 'shipped' AND shipped_at IS NULL
-    """))
+    # The rows to migrate and their new values are computed once, in a single
+    # scan of orders, into an unlogged work table; the batched UPDATEs then
+    # only copy precomputed values by primary key. Each batch consumes its
+    # rows from the work table and commits on its own, so the orders table is
+    # never locked or logged in one giant transaction. A row whose status
+    # changed since the snapshot keeps its current status.
+    with op.get_context().autocommit_block():
+        op.execute(sa.text("DROP TABLE IF EXISTS _orders_migrate"))
+        op.execute(sa.text(f"""
+            CREATE UNLOGGED TABLE _orders_migrate AS
+            SELECT
+                id,
+                order_status AS old_status,
+                (
+                    CASE order_status::text
+                        WHEN 'pending' THEN 'placed'
+                        WHEN 'processing' THEN 'picked'
+                        ELSE 'out_for_delivery'
+                    END
+                )::orderstatus AS new_status,
+                CASE WHEN order_status::text = 'processing' THEN processing_at END AS picked_at,
+                CASE WHEN order_status::text = 'shipped' THEN shipped_at END AS out_for_delivery_at
+            FROM orders
+            WHERE {predicate}
+        """))
+        op.execute(sa.text("ALTER TABLE _orders_migrate ADD PRIMARY KEY (id)"))
+        
+        run_batched_update("""
+            WITH batch AS (
+                DELETE FROM _orders_migrate
+                WHERE id IN (
+                    SELECT id FROM _orders_migrate ORDER BY id LIMIT :batch_size
+                )
+                RETURNING *
+            )
+            UPDATE orders
+            SET order_status = CASE
+                    WHEN orders.order_status = batch.old_status THEN batch.new_status
+                    ELSE orders.order_status
+                END,
+                picked_at = COALESCE(batch.picked_at, orders.picked_at),
+                out_for_delivery_at = COALESCE(batch.out_for_delivery_at, orders.out_for_delivery_at)
+            FROM batch
+            WHERE orders.id = batch.id
+        """)
+        op.execute(sa.text("DROP TABLE IF EXISTS _orders_migrate"))
 
 
 def downgrade() -> None:
-    # Migrate data back to old statuses
-    # PLACED -> PENDING
-    op.execute("""
-        UPDATE orders 
-        SET order_status = 'pending' 
-        WHERE order_status = 'placed'
-    """)
-    
-    # PICKED -> PROCESSING
-    op.execute("""
-        UPDATE orders 
-        SET order_status = 'processing', processing_at = picked_at
-        WHERE order_status = 'picked' AND picked_at IS NOT NULL
-    """)
-    op.execute("""
-        UPDATE orders 
-        SET order_status = 'processing'
-        WHERE order_status = 'picked' AND picked_at IS NULL
-    """)
-    
-    # OUT_FOR_DELIVERY -> SHIPPED
-    op.execute("""
-        UPDATE orders 
-        SET order_status = 'shipped', shipped_at = out_for_delivery_at
-        WHERE order_status = 'out_for_delivery' AND out_for_delivery_at IS NOT NULL
-    """)
-    op.execute("""
-        UPDATE orders 
-        SET order_status = 'shipped'
-        WHERE order_status = 'out_for_delivery' AND out_for_delivery_at IS NULL
-    """)
+    # Migrating data back means scanning the whole orders table, so it only
+    # runs when explicitly requested; by default just the schema is reverted.
+    if os.getenv("ALEMBIC_BACKFILL_DOWNGRADE"):
+        #   PLACED -> PENDING
+        #   PICKED -> PROCESSING (processing_at = picked_at)
+        #   OUT_FOR_DELIVERY -> SHIPPED (shipped_at = out_for_delivery_at)
+        with op.get_context().autocommit_block():
+            run_batched_update("""
+                WITH batch AS (
+                    SELECT ctid FROM orders
+                    WHERE order_status IN ('placed', 'picked', 'out_for_delivery')
+                    LIMIT :batch_size
+                )
+                UPDATE orders
+                SET order_status = (
+                        CASE orders.order_status::text
+                            WHEN 'placed' THEN 'pending'
+                            WHEN 'picked' THEN 'processing'
+                            ELSE 'shipped'
+                        END
+                    )::orderstatus,
+                    processing_at = CASE
+                        WHEN orders.order_status::text = 'picked' AND orders.picked_at IS NOT NULL
+                            THEN orders.picked_at
+                        ELSE orders.processing_at
+                    END,
+                    shipped_at = CASE
+                        WHEN orders.order_status::text = 'out_for_delivery' AND orders.out_for_delivery_at IS NOT NULL
+                            THEN orders.out_for_delivery_at
+                        ELSE orders.shipped_at
+                    END
+                FROM batch
+                WHERE orders.ctid = batch.ctid
+            """)
     
     # Remove new columns
     op.drop_column('orders', 'out_for_delivery_at')
@@ -0,0 +1,82 @@
+"""add_ledger_status_check_constraints
+
+Revision ID: e6a2c9f3b847
+Revises: d2b6e8f4a1c7
+Create Date: 2026-01-21 03:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migrations import set_migration_timeouts, with_lock_retry
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6a2c9f3b847'
+down_revision: Union[str, None] = 'd2b6e8f4a1c7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column, constraint, allowed labels). The ORM stores enum member
+# names, which is what the constraints admit.
+CHECKS = [
+    ('return_requests', 'status', 'ck_return_requests_status',
+     ['REQUESTED', 'APPROVED', 'REJECTED', 'COMPLETED']),
+    ('return_requests', 'reason', 'ck_return_requests_reason',
+     ['DAMAGED', 'WRONG_ITEM', 'QUALITY', 'OTHER']),
+    ('refunds', 'status', 'ck_refunds_status',
+     ['INITIATED', 'PROCESSED', 'FAILED']),
+    ('vendor_payouts', 'status', 'ck_vendor_payouts_status',
+     ['PENDING', 'PROCESSED', 'FAILED']),
+]
+
+# phase8 gave these columns lowercase server defaults, which the ORM cannot
+# read back and the constraints would reject
+STATUS_DEFAULTS = {
+    'return_requests': 'REQUESTED',
+    'refunds': 'INITIATED',
+    'vendor_payouts': 'PENDING',
+}
+
+
+def upgrade() -> None:
+    set_migration_timeouts()
+    
+    # Rows written through a server default still carry the lowercase form
+    for table, column, _, _ in CHECKS:
+        op.execute(sa.text(
+            f"UPDATE {table} SET {column} = upper({column}) WHERE {column} <> upper({column})"
+        ))
+    
+    # Added NOT VALID so the ALTER does not scan the table under its lock
+    for table, column, name, labels in CHECKS:
+        allowed = ", ".join(f"'{label}'" for label in labels)
+        alterations = [f"ADD CONSTRAINT {name} CHECK ({column} IN ({allowed})) NOT VALID"]
+        if column == 'status':
+            alterations.append(
+                f"ALTER COLUMN status SET DEFAULT '{STATUS_DEFAULTS[table]}'"
+            )
+        statement = f"ALTER TABLE {table} " + ", ".join(alterations)
+        with_lock_retry(lambda: op.execute(sa.text(statement)))
+    
+    # Validation only takes a SHARE UPDATE EXCLUSIVE lock; run it after the
+    # constraints have committed so the tables stay writable meanwhile
+    with op.get_context().autocommit_block():
+        for table, _, name, _ in CHECKS:
+            op.execute(sa.text(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}"))
+
+
+def downgrade() -> None:
+    set_migration_timeouts()
+    
+    for table, column, name, _ in CHECKS:
+        alterations = [f"DROP CONSTRAINT IF EXISTS {name}"]
+        if column == 'status':
+            alterations.append(
+                f"ALTER COLUMN status SET DEFAULT '{STATUS_DEFAULTS[table].lower()}'"
+            )
+        statement = f"ALTER TABLE {table} " + ", ".join(alterations)
+        with_lock_retry(lambda: op.execute(sa.text(statement)))
@@ -0,0 +1,47 @@
+"""add_coupon_active_list_index
+
+Revision ID: e8b2d5c4a671
+Revises: d4a9e7b3f215
+Create Date: 2026-01-21 03:50:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b2d5c4a671'
+down_revision: Union[str, None] = 'd4a9e7b3f215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The admin coupon list filtered by is_active reads newest first: with
+    # the sort columns after it, the index returns the page already ordered
+    # instead of sorting the whole active/inactive slice. Its leading column
+    # also serves plain is_active lookups, so ix_coupons_is_active is dropped.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_coupons_is_active_created_at_id', 'coupons',
+            ['is_active', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_coupons_is_active', table_name='coupons',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_coupons_is_active', 'coupons', ['is_active'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_coupons_is_active_created_at_id', table_name='coupons',
+            postgresql_concurrently=True, if_exists=True,
+        )
@@ -0,0 +1,46 @@
+"""check_coupon_codes_are_upper_case
+
+Revision ID: f1c6a8e4b392
+Revises: e8b2d5c4a671
+Create Date: 2026-01-21 04:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.utils.migrations import set_migration_timeouts, with_lock_retry
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c6a8e4b392'
+down_revision: Union[str, None] = 'e8b2d5c4a671'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    set_migration_timeouts()
+    
+    # Coupon lookups upper-case their input and compare it to code as is,
+    # which only uses the code indexes if stored codes are upper case too.
+    # The check is added NOT VALID so the ALTER does not scan coupons while
+    # holding its lock.
+    with_lock_retry(lambda: op.execute(sa.text("""
+        ALTER TABLE coupons
+        ADD CONSTRAINT ck_coupons_code_upper CHECK (code = upper(code)) NOT VALID
+    """)))
+    
+    # Validating only takes a SHARE UPDATE EXCLUSIVE lock; run it after the
+    # constraint has committed so coupons stays writable meanwhile
+    with op.get_context().autocommit_block():
+        op.execute(sa.text("ALTER TABLE coupons VALIDATE CONSTRAINT ck_coupons_code_upper"))
+
+
+def downgrade() -> None:
+    set_migration_timeouts()
+    
+    with_lock_retry(lambda: op.execute(sa.text(
+        "ALTER TABLE coupons DROP CONSTRAINT ck_coupons_code_upper"
+    )))
@@ -0,0 +1,59 @@
+"""make_razorpay_refund_id_unique
+
+Revision ID: f5a8d2c6e913
+Revises: e2c4f7a19b36
+Create Date: 2026-01-21 02:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5a8d2c6e913'
+down_revision: Union[str, None] = 'e2c4f7a19b36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A failed CONCURRENTLY build leaves an INVALID index behind, so refuse
+    # up front if gateway refund ids are already duplicated
+    duplicates = op.get_bind().execute(sa.text("""
+        SELECT razorpay_refund_id FROM refunds
+        WHERE razorpay_refund_id IS NOT NULL
+        GROUP BY razorpay_refund_id
+        HAVING count(*) > 1
+        LIMIT 5
+    """)).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            f"Duplicate razorpay_refund_id values must be resolved first: {duplicates}"
+        )
+    
+    # Gateway refund ids are unique per refund and NULL until the gateway
+    # responds: a partial unique index enforces that and skips the NULL rows
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_refunds_razorpay_refund_id', 'refunds', ['razorpay_refund_id'],
+            unique=True, postgresql_where=sa.text('razorpay_refund_id IS NOT NULL'),
+            postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'ix_refunds_razorpay_refund_id', table_name='refunds',
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_refunds_razorpay_refund_id', 'refunds', ['razorpay_refund_id'],
+            unique=False, postgresql_concurrently=True, if_not_exists=True,
+        )
+        op.drop_index(
+            'uq_refunds_razorpay_refund_id', table_name='refunds',
+            postgresql_concurrently=True, if_exists=True,
+        )
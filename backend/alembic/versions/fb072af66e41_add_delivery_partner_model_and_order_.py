@@ -11,6 +11,8 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
+from app.utils.migrations import set_migration_timeouts, with_lock_retry
+
 # revision identifiers, used by Alembic.
 revision: str = 'fb072af66e41'
 down_revision: Union[str, None] = '747ddb9fe16e'
@@ -23,6 +25,8 @@ def upgrade() -> None:
     # Note: Since we're using VARCHAR for enums now, we don't need to alter the enum type
     # But we should ensure the application handles the new role
     
+    set_migration_timeouts()
+    
     # Create delivery_partners table
     op.create_table(
         'delivery_partners',
@@ -34,18 +38,29 @@ def upgrade() -> None:
         sa.Column('vehicle_number', sa.String(length=20), nullable=True),
         sa.Column('is_active', sa.Boolean(), nullable=False, server_default='true'),
         sa.Column('is_available', sa.Boolean(), nullable=False, server_default='true'),
-        sa.Column('created_at', sa.DateTime(), nullable=False, server_default=sa.text('now()')),
-        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False, server_default=sa.text('now()')),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
         sa.PrimaryKeyConstraint('id'),
         sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
     )
     op.create_index('ix_delivery_partners_user_id', 'delivery_partners', ['user_id'], unique=True)
     op.create_index('ix_delivery_partners_phone', 'delivery_partners', ['phone'], unique=True)
     
-    # Add delivery_partner_id to orders table
-    op.add_column('orders', sa.Column('delivery_partner_id', postgresql.UUID(as_uuid=True), nullable=True))
-    op.create_foreign_key('fk_orders_delivery_partner_id', 'orders', 'delivery_partners', ['delivery_partner_id'], ['id'], ondelete='SET NULL')
-    op.create_index('ix_orders_delivery_partner_id', 'orders', ['delivery_partner_id'])
+    # Add delivery_partner_id to orders table (orders is live: bounded lock
+    # waits, retried on timeout)
+    def add_delivery_partner_column() -> None:
+        op.add_column('orders', sa.Column('delivery_partner_id', postgresql.UUID(as_uuid=True), nullable=True))
+        op.create_foreign_key('fk_orders_delivery_partner_id', 'orders', 'delivery_partners', ['delivery_partner_id'], ['id'], ondelete='SET NULL')
+    
+    with_lock_retry(add_delivery_partner_column)
+    
+    # orders is a large live table: build the index CONCURRENTLY (outside the
+    # migration transaction) so writes are not blocked while it builds
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_orders_delivery_partner_id', 'orders', ['delivery_partner_id'],
+            postgresql_concurrently=True, if_not_exists=True,
+        )
 
 
 def downgrade() -> None:
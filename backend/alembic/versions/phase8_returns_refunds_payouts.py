@@ -1,7 +1,7 @@
 """add_phase8_returns_refunds_payouts
 
 Revision ID: phase8_returns_refunds
-Revises: a1b2c3d4e5f6
+Revises: c7e4a9d2b815
 Create Date: 2026-01-14 12:00:00.000000
 
 """
@@ -11,24 +11,38 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects import postgresql
 
+from app.utils.migrations import set_migration_timeouts, with_lock_retry
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'phase8_returns_refunds'
-down_revision: Union[str, None] = 'a1b2c3d4e5f6'
+down_revision: Union[str, None] = 'c7e4a9d2b815'
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
+    set_migration_timeouts()
+    
+    # products and order_items are live: one ALTER TABLE per table takes the
+    # ACCESS EXCLUSIVE lock once, and a constant DEFAULT is metadata-only on
+    # PG11+, so neither table is rewritten
+    
     # ============== Add Return Policy to Products ==============
-    op.add_column('products', sa.Column('return_eligible', sa.Boolean(), nullable=False, server_default='false'))
-    op.add_column('products', sa.Column('return_window_days', sa.Integer(), nullable=True))
-    op.add_column('products', sa.Column('return_conditions', sa.Text(), nullable=True))
+    with_lock_retry(lambda: op.execute(sa.text("""
+        ALTER TABLE products
+        ADD COLUMN return_eligible BOOLEAN NOT NULL DEFAULT false,
+        ADD COLUMN return_window_days INTEGER,
+        ADD COLUMN return_conditions TEXT
+    """)))
     
     # ============== Add Return Policy Snapshot to Order Items ==============
-    op.add_column('order_items', sa.Column('return_eligible', sa.Boolean(), nullable=False, server_default='false'))
-    op.add_column('order_items', sa.Column('return_window_days', sa.Integer(), nullable=True))
-    op.add_column('order_items', sa.Column('return_deadline', sa.DateTime(), nullable=True))
+    with_lock_retry(lambda: op.execute(sa.text("""
+        ALTER TABLE order_items
+        ADD COLUMN return_eligible BOOLEAN NOT NULL DEFAULT false,
+        ADD COLUMN return_window_days INTEGER,
+        ADD COLUMN return_deadline TIMESTAMP
+    """)))
     
     # ============== Create Return Requests Table ==============
     op.create_table('return_requests',
@@ -50,10 +64,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['buyer_id'], ['users.id'], ondelete='SET NULL'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_return_requests_order_id'), 'return_requests', ['order_id'], unique=False)
-    op.create_index(op.f('ix_return_requests_order_item_id'), 'return_requests', ['order_item_id'], unique=False)
-    op.create_index(op.f('ix_return_requests_buyer_id'), 'return_requests', ['buyer_id'], unique=False)
-    op.create_index(op.f('ix_return_requests_status'), 'return_requests', ['status'], unique=False)
     
     # ============== Create Refunds Table ==============
     op.create_table('refunds',
@@ -73,11 +83,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint('id'),
         sa.UniqueConstraint('return_request_id')
     )
-    op.create_index(op.f('ix_refunds_order_id'), 'refunds', ['order_id'], unique=False)
-    op.create_index(op.f('ix_refunds_payment_id'), 'refunds', ['payment_id'], unique=False)
-    op.create_index(op.f('ix_refunds_return_request_id'), 'refunds', ['return_request_id'], unique=False)
-    op.create_index(op.f('ix_refunds_razorpay_refund_id'), 'refunds', ['razorpay_refund_id'], unique=False)
-    op.create_index(op.f('ix_refunds_status'), 'refunds', ['status'], unique=False)
     
     # ============== Create Vendor Payouts Table ==============
     op.create_table('vendor_payouts',
@@ -97,9 +102,6 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['vendor_id'], ['vendors.id'], ondelete='CASCADE'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_vendor_payouts_vendor_id'), 'vendor_payouts', ['vendor_id'], unique=False)
-    op.create_index(op.f('ix_vendor_payouts_status'), 'vendor_payouts', ['status'], unique=False)
-    op.create_index(op.f('ix_vendor_payouts_transaction_id'), 'vendor_payouts', ['transaction_id'], unique=False)
     
     # ============== Create Vendor Payout Items Table ==============
     op.create_table('vendor_payout_items',
@@ -114,41 +116,63 @@ def upgrade() -> None:
         sa.ForeignKeyConstraint(['order_id'], ['orders.id'], ondelete='SET NULL'),
         sa.PrimaryKeyConstraint('id')
     )
-    op.create_index(op.f('ix_vendor_payout_items_payout_id'), 'vendor_payout_items', ['payout_id'], unique=False)
-    op.create_index(op.f('ix_vendor_payout_items_order_id'), 'vendor_payout_items', ['order_id'], unique=False)
+    
+    # Build the indexes CONCURRENTLY, outside the migration transaction, so
+    # writes to the new tables are never blocked by an index build
+    with op.get_context().autocommit_block():
+        op.create_index(op.f('ix_return_requests_order_id'), 'return_requests', ['order_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_return_requests_order_item_id'), 'return_requests', ['order_item_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_return_requests_buyer_id'), 'return_requests', ['buyer_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_return_requests_status'), 'return_requests', ['status'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_refunds_order_id'), 'refunds', ['order_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_refunds_payment_id'), 'refunds', ['payment_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_refunds_return_request_id'), 'refunds', ['return_request_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_refunds_razorpay_refund_id'), 'refunds', ['razorpay_refund_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_refunds_status'), 'refunds', ['status'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_vendor_payouts_vendor_id'), 'vendor_payouts', ['vendor_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_vendor_payouts_status'), 'vendor_payouts', ['status'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_vendor_payouts_transaction_id'), 'vendor_payouts', ['transaction_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_vendor_payout_items_payout_id'), 'vendor_payout_items', ['payout_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(op.f('ix_vendor_payout_items_order_id'), 'vendor_payout_items', ['order_id'], unique=False, postgresql_concurrently=True, if_not_exists=True)
 
 
 def downgrade() -> None:
+    # Drop the indexes CONCURRENTLY so readers are not blocked, then the tables
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_vendor_payout_items_order_id'), table_name='vendor_payout_items', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_vendor_payout_items_payout_id'), table_name='vendor_payout_items', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_vendor_payouts_transaction_id'), table_name='vendor_payouts', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_vendor_payouts_status'), table_name='vendor_payouts', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_vendor_payouts_vendor_id'), table_name='vendor_payouts', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_refunds_status'), table_name='refunds', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_refunds_razorpay_refund_id'), table_name='refunds', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_refunds_return_request_id'), table_name='refunds', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_refunds_payment_id'), table_name='refunds', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_refunds_order_id'), table_name='refunds', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_return_requests_status'), table_name='return_requests', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_return_requests_buyer_id'), table_name='return_requests', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_return_requests_order_item_id'), table_name='return_requests', postgresql_concurrently=True, if_exists=True)
+        op.drop_index(op.f('ix_return_requests_order_id'), table_name='return_requests', postgresql_concurrently=True, if_exists=True)
+    
     # Drop tables in reverse order
-    op.drop_index(op.f('ix_vendor_payout_items_order_id'), table_name='vendor_payout_items')
-    op.drop_index(op.f('ix_vendor_payout_items_payout_id'), table_name='vendor_payout_items')
     op.drop_table('vendor_payout_items')
-    
-    op.drop_index(op.f('ix_vendor_payouts_transaction_id'), table_name='vendor_payouts')
-    op.drop_index(op.f('ix_vendor_payouts_status'), table_name='vendor_payouts')
-    op.drop_index(op.f('ix_vendor_payouts_vendor_id'), table_name='vendor_payouts')
     op.drop_table('vendor_payouts')
-    
-    op.drop_index(op.f('ix_refunds_status'), table_name='refunds')
-    op.drop_index(op.f('ix_refunds_razorpay_refund_id'), table_name='refunds')
-    op.drop_index(op.f('ix_refunds_return_request_id'), table_name='refunds')
-    op.drop_index(op.f('ix_refunds_payment_id'), table_name='refunds')
-    op.drop_index(op.f('ix_refunds_order_id'), table_name='refunds')
     op.drop_table('refunds')
-    
-    op.drop_index(op.f('ix_return_requests_status'), table_name='return_requests')
-    op.drop_index(op.f('ix_return_requests_buyer_id'), table_name='return_requests')
-    op.drop_index(op.f('ix_return_requests_order_item_id'), table_name='return_requests')
-    op.drop_index(op.f('ix_return_requests_order_id'), table_name='return_requests')
     op.drop_table('return_requests')
     
     # Remove columns from order_items
-    op.drop_column('order_items', 'return_deadline')
-    op.drop_column('order_items', 'return_window_days')
-    op.drop_column('order_items', 'return_eligible')
+    op.execute(sa.text("""
+        ALTER TABLE order_items
+        DROP COLUMN return_deadline,
+        DROP COLUMN return_window_days,
+        DROP COLUMN return_eligible
+    """))
     
     # Remove columns from products
-    op.drop_column('products', 'return_conditions')
-    op.drop_column('products', 'return_window_days')
-    op.drop_column('products', 'return_eligible')
+    op.execute(sa.text("""
+        ALTER TABLE products
+        DROP COLUMN return_conditions,
+        DROP COLUMN return_window_days,
+        DROP COLUMN return_eligible
+    """))
 
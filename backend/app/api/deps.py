@@ -3,23 +3,158 @@ API Dependencies
 Reusable dependencies for route handlers
 """
 
+import time
 import uuid
-from typing import Annotated, Optional
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Annotated, Any, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session
 import jwt
 
 from app.database import get_db
 from app.models.user import User
 from app.models.enums import UserRole
-from app.config import settings
+from app.utils.security import decode_token
 
 
 # Security scheme for JWT Bearer tokens
 security = HTTPBearer()
 
+# Decoded access-token payloads, keyed by a digest of the raw token. Clients
+# replay the same token on every call until it expires, so the signature is
+# verified once per token instead of once per request.
+TOKEN_CACHE_MAXSIZE = 10_000
+TOKEN_CACHE_TTL_SECONDS = 60
+
+_token_cache: "OrderedDict[bytes, tuple[dict[str, Any], float]]" = OrderedDict()
+_token_cache_lock = threading.Lock()
+
+
+def _decode_cached(token: str) -> dict[str, Any]:
+    """
+    Decode a JWT, reusing the verified payload for repeated tokens.
+    
+    Cached payloads are served for at most TOKEN_CACHE_TTL_SECONDS and never
+    past the token's own expiry; an expired token falls through to
+    decode_token so the usual ExpiredSignatureError is raised.
+    
+    Args:
+        token: Raw JWT string
+        
+    Returns:
+        Decoded token payload
+    """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    now = time.time()
+    
+    with _token_cache_lock:
+        cached = _token_cache.get(key)
+        if cached is not None:
+            payload, cached_until = cached
+            if now < cached_until and now < payload.get("exp", 0):
+                return payload
+            del _token_cache[key]
+    
+    payload = decode_token(token)
+    
+    with _token_cache_lock:
+        _token_cache[key] = (payload, now + TOKEN_CACHE_TTL_SECONDS)
+        if len(_token_cache) > TOKEN_CACHE_MAXSIZE:
+            _token_cache.popitem(last=False)
+    
+    return payload
+
+
+# Column snapshots of recently authenticated users, keyed by user id, so most
+# requests skip the SELECT on users. Entries are dropped whenever a User row
+# is updated or deleted through the ORM in this process, both at flush and
+# again once the change commits; other processes see changes (e.g.
+# deactivation) within USER_CACHE_TTL_SECONDS.
+USER_CACHE_MAXSIZE = 50_000
+USER_CACHE_TTL_SECONDS = 30
+
+_user_cache: "OrderedDict[uuid.UUID, tuple[dict[str, Any], float]]" = OrderedDict()
+_user_cache_lock = threading.Lock()
+
+
+def _load_user(db: Session, user_id: uuid.UUID) -> Optional[User]:
+    """
+    Load a user, serving recently seen users from the snapshot cache.
+    
+    A cached snapshot is rebuilt into a User attached to ``db`` without
+    emitting SQL, so relationships still lazy-load through the session. On a
+    miss, Session.get() returns the user from the identity map if this
+    session already loaded it and otherwise runs a primary-key lookup.
+    
+    Args:
+        db: Database session
+        user_id: User's UUID
+        
+    Returns:
+        User object or None if not found
+    """
+    now = time.time()
+    snapshot = None
+    
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+        if cached is not None:
+            if now < cached[1]:
+                snapshot = cached[0]
+            else:
+                del _user_cache[user_id]
+    
+    if snapshot is not None:
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+    
+    user = db.get(User, user_id)
+    
+    if user is not None:
+        snapshot = {
+            attr.key: getattr(user, attr.key)
+            for attr in User.__mapper__.column_attrs
+        }
+        with _user_cache_lock:
+            _user_cache[user_id] = (snapshot, now + USER_CACHE_TTL_SECONDS)
+            if len(_user_cache) > USER_CACHE_MAXSIZE:
+                _user_cache.popitem(last=False)
+    
+    return user
+
+
+def invalidate_user(user_id: uuid.UUID) -> None:
+    """Drop a user's cached snapshot so the next request reloads it."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+# session.info key of the user ids flushed since the session last committed
+_FLUSHED_USER_IDS = "flushed_user_ids"
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target: User) -> None:
+    invalidate_user(target.id)
+    # Until the transaction commits, other requests still read the old row
+    # and may cache it again, so the user is evicted once more after commit
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_FLUSHED_USER_IDS, set()).add(target.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_users(session: Session) -> None:
+    for user_id in session.info.pop(_FLUSHED_USER_IDS, ()):
+        invalidate_user(user_id)
+
 
 def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
@@ -41,11 +176,7 @@ def get_current_user(
     token = credentials.credentials
     
     try:
-        payload = jwt.decode(
-            token,
-            settings.jwt_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
+        payload = _decode_cached(token)
         
         # Check token type
         if payload.get("type") != "access":
@@ -67,8 +198,8 @@ def get_current_user(
             detail="Invalid token",
         )
     
-    # Get user from database
-    user = db.query(User).filter(User.id == user_id).first()
+    # Get user from cache or database
+    user = _load_user(db, user_id)
     
     if not user:
         raise HTTPException(
@@ -85,21 +216,6 @@ def get_current_user(
     return user
 
 
-def get_current_active_user(
-    current_user: Annotated[User, Depends(get_current_user)],
-) -> User:
-    """
-    Get current active user.
-    
-    Args:
-        current_user: User from get_current_user dependency
-        
-    Returns:
-        Current active user
-    """
-    return current_user
-
-
 # ============== Role-Based Access Dependencies ==============
 
 def require_role(allowed_roles):
@@ -112,12 +228,15 @@ def require_role(allowed_roles):
     Returns:
         Dependency function that validates user role
     """
-    # Handle both list and single role
-    if isinstance(allowed_roles, (list, tuple)):
-        roles = allowed_roles
+    # Handle both collections and a single role; a frozenset keeps the
+    # per-request membership test O(1)
+    if isinstance(allowed_roles, (list, tuple, set, frozenset)):
+        roles = frozenset(allowed_roles)
     else:
-        roles = [allowed_roles]
+        roles = frozenset((allowed_roles,))
     
+    # get_current_user already rejects inactive users, so this single
+    # dependency covers authentication, the active check and the role check
     def role_checker(
         current_user: Annotated[User, Depends(get_current_user)],
     ) -> User:
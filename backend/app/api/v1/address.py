@@ -3,10 +3,11 @@ Delivery Address API Routes
 Buyer address management
 """
 
+import math
 import uuid
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_db, get_current_user, require_role
@@ -22,6 +23,9 @@ from app.services.address_service import AddressService
 
 router = APIRouter(prefix="/addresses", tags=["Delivery Addresses"])
 
+# Built once so every route shares the same dependency callable
+require_buyer_only = require_role([UserRole.BUYER])
+
 
 @router.post(
     "",
@@ -31,7 +35,7 @@ router = APIRouter(prefix="/addresses", tags=["Delivery Addresses"])
 def create_address(
     data: AddressCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.BUYER])),
+    current_user: User = Depends(require_buyer_only),
 ):
     """Create a new delivery address."""
     service = AddressService(db)
@@ -41,15 +45,22 @@ def create_address(
 
 @router.get("", response_model=AddressListResponse)
 def list_addresses(
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=100),
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.BUYER])),
+    current_user: User = Depends(require_buyer_only),
 ):
-    """List all delivery addresses for the current user."""
+    """List delivery addresses for the current user."""
     service = AddressService(db)
-    addresses = service.get_buyer_addresses(current_user.id)
+    addresses, total = service.get_buyer_addresses(
+        current_user.id, page=page, size=size
+    )
     return AddressListResponse(
         items=addresses,
-        total=len(addresses),
+        total=total,
+        page=page,
+        size=size,
+        pages=math.ceil(total / size) if total > 0 else 0,
     )
 
 
@@ -57,7 +68,7 @@ def list_addresses(
 def get_address(
     address_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.BUYER])),
+    current_user: User = Depends(require_buyer_only),
 ):
     """Get a specific delivery address."""
     service = AddressService(db)
@@ -77,7 +88,7 @@ def update_address(
     address_id: uuid.UUID,
     data: AddressUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.BUYER])),
+    current_user: User = Depends(require_buyer_only),
 ):
     """Update a delivery address."""
     service = AddressService(db)
@@ -96,7 +107,7 @@ def update_address(
 def delete_address(
     address_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.BUYER])),
+    current_user: User = Depends(require_buyer_only),
 ):
     """Delete a delivery address."""
     service = AddressService(db)
@@ -116,7 +127,7 @@ def delete_address(
 def set_default_address(
     address_id: uuid.UUID,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.BUYER])),
+    current_user: User = Depends(require_buyer_only),
 ):
     """Set an address as the default."""
     service = AddressService(db)
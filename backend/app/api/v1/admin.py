@@ -3,16 +3,19 @@ Admin Routes
 Admin-only endpoints for platform management
 """
 
-import math
+import hashlib
 import uuid
-from typing import Optional
-from datetime import datetime
+from typing import Any, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response, UploadFile, File
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.database import get_db
-from app.utils.storage import upload_image, validate_image, MAX_FILE_SIZE
+from app.utils.cache import cache_key, get_cache, set_cache
+from app.utils.storage import ALLOWED_IMAGE_CONTENT_TYPES, read_upload, upload_image, validate_image, MAX_FILE_SIZE
 from app.schemas.vendor import (
     VendorAdminResponse,
     VendorApproval,
@@ -45,9 +48,15 @@ from app.schemas.delivery_partner import (
     DeliveryPartnerListResponse,
     OrderAssignmentRequest,
 )
+from app.schemas.analytics import (
+    AnalyticsDateRange,
+    VendorAnalyticsFilters,
+    DeliveryPartnerAnalyticsFilters,
+)
 from app.schemas.user import MessageResponse
+from app.schemas.base import construct_from_orm, model_response
 from app.services.vendor_service import VendorService
-from app.services.category_service import CategoryService
+from app.services.category_service import CategoryService, CATEGORY_LIST_CACHE_PREFIX
 from app.services.service_zone_service import ServiceZoneService
 from app.services.order_service import OrderService
 from app.services.delivery_partner_service import DeliveryPartnerService
@@ -58,6 +67,57 @@ from app.api.deps import DbSession, AdminUser
 
 router = APIRouter()
 
+# Order rows carry nested items, so they are still validated, but through one
+# validator compiled for the whole page instead of a call per order
+_ORDER_LIST_ADAPTER = TypeAdapter(List[OrderResponse])
+
+
+# Response cache lifetimes, in seconds
+CATEGORY_LIST_CACHE_TTL = 300
+ORDER_STATS_CACHE_TTL = 60
+ORDER_STATS_CACHE_KEY = "admin:order_stats"
+
+# Browser caching of polled dashboard routes (see _conditional_response)
+DASHBOARD_CACHE_CONTROL = "private, max-age=30"
+
+
+def _conditional_response(request: Request, content: Any) -> Response:
+    """
+    Render content with an ETag and answer 304 if the client already has it.
+    
+    The ETag is a hash of the rendered body, so a dashboard polling an
+    unchanged route gets an empty 304 instead of the same payload again.
+    """
+    response = ORJSONResponse(jsonable_encoder(content))
+    etag = f'"{hashlib.blake2b(response.body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": DASHBOARD_CACHE_CONTROL}
+    
+    if_none_match = request.headers.get("if-none-match", "")
+    client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in client_etags or "*" in client_etags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    response.headers.update(headers)
+    return response
+
+
+def _not_found(entity: str) -> HTTPException:
+    """
+    Build the 404 for a missing entity.
+    
+    A fresh exception per raise: a shared instance would carry the last
+    request's traceback (and the frames it references) between requests.
+    """
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail=f"{entity} not found",
+    )
+
+
+def _pages(total: int, size: int) -> int:
+    """Number of pages needed for total items, size per page."""
+    return (total + size - 1) // size if total else 0
+
 
 # ============== Vendor Management ==============
 
@@ -89,13 +149,14 @@ def list_all_vendors(
         size=size,
     )
     
-    return VendorAdminListResponse(
-        items=[VendorAdminResponse.model_validate(v) for v in vendors],
+    response = VendorAdminListResponse(
+        items=[construct_from_orm(VendorAdminResponse, v) for v in vendors],
         total=total,
         page=page,
         size=size,
-        pages=math.ceil(total / size) if total > 0 else 0,
+        pages=_pages(total, size),
     )
+    return model_response(response)
 
 
 @router.get(
@@ -114,13 +175,14 @@ def get_pending_vendors(
     vendor_service = VendorService(db)
     vendors, total = vendor_service.get_pending_vendors(page=page, size=size)
     
-    return VendorAdminListResponse(
-        items=[VendorAdminResponse.model_validate(v) for v in vendors],
+    response = VendorAdminListResponse(
+        items=[construct_from_orm(VendorAdminResponse, v) for v in vendors],
         total=total,
         page=page,
         size=size,
-        pages=math.ceil(total / size) if total > 0 else 0,
+        pages=_pages(total, size),
     )
+    return model_response(response)
 
 
 @router.get(
@@ -130,28 +192,16 @@ def get_pending_vendors(
     description="Get full vendor details for admin.",
 )
 def get_vendor_admin(
-    vendor_id: str,
+    vendor_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Get vendor details (admin view)."""
-    import uuid
-    try:
-        vendor_uuid = uuid.UUID(vendor_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid vendor ID",
-        )
-    
     vendor_service = VendorService(db)
-    vendor = vendor_service.get_vendor_by_id(vendor_uuid)
+    vendor = vendor_service.get_vendor_by_id(vendor_id)
     
     if not vendor:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Vendor not found",
-        )
+        raise _not_found("Vendor")
     
     return vendor
 
@@ -163,29 +213,17 @@ def get_vendor_admin(
     description="Approve or reject a vendor application.",
 )
 def approve_vendor(
-    vendor_id: str,
+    vendor_id: uuid.UUID,
     approval_data: VendorApproval,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Approve or reject vendor."""
-    import uuid
-    try:
-        vendor_uuid = uuid.UUID(vendor_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid vendor ID",
-        )
-    
     vendor_service = VendorService(db)
-    vendor = vendor_service.approve_vendor(vendor_uuid, approval_data)
+    vendor = vendor_service.approve_vendor(vendor_id, approval_data)
     
     if not vendor:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Vendor not found",
-        )
+        raise _not_found("Vendor")
     
     return vendor
 
@@ -197,29 +235,17 @@ def approve_vendor(
     description="Suspend or reactivate a vendor.",
 )
 def suspend_vendor(
-    vendor_id: str,
+    vendor_id: uuid.UUID,
     suspend_data: VendorSuspend,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Suspend or reactivate vendor."""
-    import uuid
-    try:
-        vendor_uuid = uuid.UUID(vendor_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid vendor ID",
-        )
-    
     vendor_service = VendorService(db)
-    vendor = vendor_service.suspend_vendor(vendor_uuid, suspend_data.is_active)
+    vendor = vendor_service.suspend_vendor(vendor_id, suspend_data.is_active)
     
     if not vendor:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Vendor not found",
-        )
+        raise _not_found("Vendor")
     
     return vendor
 
@@ -258,18 +284,27 @@ def create_category(
     description="Get all categories including inactive ones.",
 )
 def list_all_categories(
+    request: Request,
     current_user: AdminUser,
     db: DbSession,
     include_inactive: bool = Query(True),
 ):
     """Get all categories (admin view)."""
+    # Invalidated by CategoryService on every category write
+    key = cache_key(CATEGORY_LIST_CACHE_PREFIX, include_inactive=include_inactive)
+    cached_response = get_cache(key)
+    if cached_response is not None:
+        return _conditional_response(request, cached_response)
+    
     category_service = CategoryService(db)
     categories = category_service.get_all_categories(include_inactive=include_inactive)
     
-    return CategoryListResponse(
-        items=[CategoryResponse.model_validate(c) for c in categories],
+    response = CategoryListResponse(
+        items=[construct_from_orm(CategoryResponse, c) for c in categories],
         total=len(categories),
-    )
+    ).model_dump(mode="json")
+    set_cache(key, response, ttl=CATEGORY_LIST_CACHE_TTL)
+    return _conditional_response(request, response)
 
 
 @router.put(
@@ -279,25 +314,16 @@ def list_all_categories(
     description="Update a category.",
 )
 def update_category(
-    category_id: str,
+    category_id: uuid.UUID,
     update_data: CategoryUpdate,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Update category."""
-    import uuid
-    try:
-        category_uuid = uuid.UUID(category_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid category ID",
-        )
-    
     category_service = CategoryService(db)
     
     try:
-        category = category_service.update_category(category_uuid, update_data)
+        category = category_service.update_category(category_id, update_data)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -305,10 +331,7 @@ def update_category(
         )
     
     if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Category not found",
-        )
+        raise _not_found("Category")
     
     return category
 
@@ -321,7 +344,7 @@ def update_category(
     description="Upload an image/logo for a category. Accepts: jpg, jpeg, png, webp. Max size: 5MB.",
 )
 async def upload_category_image(
-    category_id: str,
+    category_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
     file: UploadFile = File(...),
@@ -333,36 +356,28 @@ async def upload_category_image(
     - Max size: 5MB
     - Automatically uploads to Cloudinary/S3 if configured
     """
-    import uuid
-    try:
-        category_uuid = uuid.UUID(category_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid category ID",
-        )
-    
     category_service = CategoryService(db)
-    category = category_service.get_category_by_id(category_uuid)
+    category = category_service.get_category_by_id(category_id)
     
     if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Category not found",
-        )
+        raise _not_found("Category")
     
     # Validate file type
-    allowed_types = ["image/jpeg", "image/jpg", "image/png", "image/webp"]
-    if file.content_type not in allowed_types:
+    if file.content_type not in ALLOWED_IMAGE_CONTENT_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid file type. Allowed: jpg, jpeg, png, webp",
         )
     
-    # Read file content
-    content = await file.read()
+    # Read file content, stopping early on oversized uploads
+    content, error_msg = await read_upload(file)
+    if error_msg:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=error_msg,
+        )
     
-    # Validate file size and type
+    # Validate file type
     is_valid, error_msg = validate_image(content, file.content_type)
     if not is_valid:
         raise HTTPException(
@@ -386,7 +401,7 @@ async def upload_category_image(
         )
     
     # Update category with image URL
-    updated_category = category_service.update_category_image(category_uuid, image_url)
+    updated_category = category_service.update_category_image(category_id, image_url)
     
     if not updated_category:
         raise HTTPException(
@@ -404,28 +419,16 @@ async def upload_category_image(
     description="Soft delete a category and its children.",
 )
 def delete_category(
-    category_id: str,
+    category_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Delete (deactivate) category."""
-    import uuid
-    try:
-        category_uuid = uuid.UUID(category_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid category ID",
-        )
-    
     category_service = CategoryService(db)
-    success = category_service.delete_category(category_uuid)
+    success = category_service.delete_category(category_id)
     
     if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Category not found",
-        )
+        raise _not_found("Category")
     
     return MessageResponse(message="Category deactivated successfully")
 
@@ -473,12 +476,13 @@ def list_service_zones(
         size=size,
     )
     
-    return ServiceZoneListResponse(
-        items=[ServiceZoneResponse.model_validate(z) for z in zones],
+    response = ServiceZoneListResponse(
+        items=[construct_from_orm(ServiceZoneResponse, z) for z in zones],
         total=total,
         page=page,
         size=size,
     )
+    return model_response(response)
 
 
 @router.get(
@@ -488,28 +492,16 @@ def list_service_zones(
     description="Get service zone details.",
 )
 def get_service_zone(
-    zone_id: str,
+    zone_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Get service zone details."""
-    import uuid
-    try:
-        zone_uuid = uuid.UUID(zone_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid zone ID",
-        )
-    
     zone_service = ServiceZoneService(db)
-    zone = zone_service.get_zone_by_id(zone_uuid)
+    zone = zone_service.get_zone_by_id(zone_id)
     
     if not zone:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Service zone not found",
-        )
+        raise _not_found("Service zone")
     
     return zone
 
@@ -521,29 +513,17 @@ def get_service_zone(
     description="Update a service zone.",
 )
 def update_service_zone(
-    zone_id: str,
+    zone_id: uuid.UUID,
     update_data: ServiceZoneUpdate,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Update service zone."""
-    import uuid
-    try:
-        zone_uuid = uuid.UUID(zone_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid zone ID",
-        )
-    
     zone_service = ServiceZoneService(db)
-    zone = zone_service.update_zone(zone_uuid, update_data)
+    zone = zone_service.update_zone(zone_id, update_data)
     
     if not zone:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Service zone not found",
-        )
+        raise _not_found("Service zone")
     
     return zone
 
@@ -555,28 +535,16 @@ def update_service_zone(
     description="Soft delete a service zone.",
 )
 def delete_service_zone(
-    zone_id: str,
+    zone_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Delete (deactivate) service zone."""
-    import uuid
-    try:
-        zone_uuid = uuid.UUID(zone_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid zone ID",
-        )
-    
     zone_service = ServiceZoneService(db)
-    success = zone_service.delete_zone(zone_uuid)
+    success = zone_service.delete_zone(zone_id)
     
     if not success:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Service zone not found",
-        )
+        raise _not_found("Service zone")
     
     return MessageResponse(message="Service zone deactivated successfully")
 
@@ -593,7 +561,7 @@ def list_all_orders(
     current_user: AdminUser,
     db: DbSession,
     status_filter: Optional[OrderStatus] = Query(None, alias="status"),
-    vendor_id: Optional[str] = Query(None),
+    vendor_id: Optional[uuid.UUID] = Query(None),
     search: Optional[str] = Query(None),
     page: int = Query(1, ge=1),
     size: int = Query(20, ge=1, le=100),
@@ -601,30 +569,20 @@ def list_all_orders(
     """Get all orders (admin view)."""
     order_service = OrderService(db)
     
-    vendor_uuid = None
-    if vendor_id:
-        try:
-            vendor_uuid = uuid.UUID(vendor_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid vendor ID",
-            )
-    
     orders, total = order_service.get_all_orders(
         status=status_filter,
-        vendor_id=vendor_uuid,
+        vendor_id=vendor_id,
         search=search,
         page=page,
         size=size,
     )
     
     return OrderListResponse(
-        items=[OrderResponse.model_validate(o) for o in orders],
+        items=_ORDER_LIST_ADAPTER.validate_python(orders, from_attributes=True),
         total=total,
         page=page,
         size=size,
-        pages=math.ceil(total / size) if total > 0 else 0,
+        pages=_pages(total, size),
     )
 
 
@@ -634,13 +592,20 @@ def list_all_orders(
     description="Get order statistics for dashboard.",
 )
 def get_order_stats(
+    request: Request,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Get order statistics."""
+    # Dashboard figures tolerate being a minute stale, so no invalidation
+    cached_stats = get_cache(ORDER_STATS_CACHE_KEY)
+    if cached_stats is not None:
+        return _conditional_response(request, cached_stats)
+    
     order_service = OrderService(db)
     stats = order_service.get_order_stats()
-    return stats
+    set_cache(ORDER_STATS_CACHE_KEY, stats, ttl=ORDER_STATS_CACHE_TTL)
+    return _conditional_response(request, stats)
 
 
 @router.get(
@@ -650,27 +615,16 @@ def get_order_stats(
     description="Get full order details for admin.",
 )
 def get_order_admin(
-    order_id: str,
+    order_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Get order details (admin view)."""
-    try:
-        order_uuid = uuid.UUID(order_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid order ID",
-        )
-    
     order_service = OrderService(db)
-    order = order_service.get_order_by_id(order_uuid)
+    order = order_service.get_order_by_id(order_id)
     
     if not order:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Order not found",
-        )
+        raise _not_found("Order")
     
     return order
 
@@ -682,24 +636,16 @@ def get_order_admin(
     description="Update order status (admin override).",
 )
 def update_order_status_admin(
-    order_id: str,
+    order_id: uuid.UUID,
     status_data: OrderStatusUpdate,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Update order status (admin can override)."""
-    try:
-        order_uuid = uuid.UUID(order_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid order ID",
-        )
-    
     order_service = OrderService(db)
     
     try:
-        order = order_service.update_order_status_admin(order_uuid, status_data.status)
+        order = order_service.update_order_status_admin(order_id, status_data.status)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -707,10 +653,7 @@ def update_order_status_admin(
         )
     
     if not order:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Order not found",
-        )
+        raise _not_found("Order")
     
     return order
 
@@ -722,25 +665,17 @@ def update_order_status_admin(
     description="Assign a PACKED order to a delivery partner and mark as OUT_FOR_DELIVERY.",
 )
 def assign_order_to_delivery_partner(
-    order_id: str,
+    order_id: uuid.UUID,
     assignment_data: OrderAssignmentRequest,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Assign order to delivery partner."""
-    try:
-        order_uuid = uuid.UUID(order_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid order ID",
-        )
-    
     order_service = OrderService(db)
     
     try:
         order = order_service.assign_order_to_delivery_partner(
-            order_id=order_uuid,
+            order_id=order_id,
             delivery_partner_id=assignment_data.delivery_partner_id,
         )
         return OrderResponse.model_validate(order)
@@ -805,13 +740,14 @@ def list_delivery_partners(
         search=search,
     )
     
-    return DeliveryPartnerListResponse(
-        items=[DeliveryPartnerResponse.model_validate(p) for p in partners],
+    response = DeliveryPartnerListResponse(
+        items=[construct_from_orm(DeliveryPartnerResponse, p) for p in partners],
         total=total,
         page=page,
         size=size,
-        pages=math.ceil(total / size) if total > 0 else 0,
+        pages=_pages(total, size),
     )
+    return model_response(response)
 
 
 @router.get(
@@ -821,27 +757,16 @@ def list_delivery_partners(
     description="Get delivery partner details.",
 )
 def get_delivery_partner(
-    partner_id: str,
+    partner_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Get delivery partner details."""
-    try:
-        partner_uuid = uuid.UUID(partner_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid delivery partner ID",
-        )
-    
     service = DeliveryPartnerService(db)
-    partner = service.get_delivery_partner(partner_uuid)
+    partner = service.get_delivery_partner(partner_id)
     
     if not partner:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Delivery partner not found",
-        )
+        raise _not_found("Delivery partner")
     
     return DeliveryPartnerResponse.model_validate(partner)
 
@@ -853,24 +778,16 @@ def get_delivery_partner(
     description="Update delivery partner details.",
 )
 def update_delivery_partner(
-    partner_id: str,
+    partner_id: uuid.UUID,
     update_data: DeliveryPartnerUpdate,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Update delivery partner."""
-    try:
-        partner_uuid = uuid.UUID(partner_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid delivery partner ID",
-        )
-    
     service = DeliveryPartnerService(db)
     
     try:
-        partner = service.update_delivery_partner(partner_uuid, update_data)
+        partner = service.update_delivery_partner(partner_id, update_data)
         return DeliveryPartnerResponse.model_validate(partner)
     except ValueError as e:
         raise HTTPException(
@@ -893,23 +810,15 @@ def update_delivery_partner(
     description="Deactivate a delivery partner.",
 )
 def delete_delivery_partner(
-    partner_id: str,
+    partner_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Delete (deactivate) delivery partner."""
-    try:
-        partner_uuid = uuid.UUID(partner_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid delivery partner ID",
-        )
-    
     service = DeliveryPartnerService(db)
     
     try:
-        service.delete_delivery_partner(partner_uuid)
+        service.delete_delivery_partner(partner_id)
         return MessageResponse(message="Delivery partner deactivated successfully")
     except HTTPException:
         raise
@@ -928,66 +837,16 @@ def delete_delivery_partner(
     description="Get comprehensive vendor analytics with filters.",
 )
 def get_vendor_analytics(
+    request: Request,
     current_user: AdminUser,
     db: DbSession,
-    vendor_id: Optional[str] = Query(None),
-    start_date: Optional[str] = Query(None),
-    end_date: Optional[str] = Query(None),
-    status: Optional[str] = Query(None),
+    filters: VendorAnalyticsFilters = Depends(),
 ):
     """Get vendor analytics."""
     analytics_service = AnalyticsService(db)
+    analytics = analytics_service.get_admin_vendor_analytics(**filters.model_dump())
     
-    # Parse dates
-    start = None
-    end = None
-    if start_date:
-        try:
-            start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid start_date format. Use YYYY-MM-DD",
-            )
-    if end_date:
-        try:
-            end = datetime.strptime(end_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid end_date format. Use YYYY-MM-DD",
-            )
-    
-    # Parse vendor ID
-    vendor_uuid = None
-    if vendor_id:
-        try:
-            vendor_uuid = uuid.UUID(vendor_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid vendor ID",
-            )
-    
-    # Parse status
-    status_filter = None
-    if status:
-        try:
-            status_filter = OrderStatus(status)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid order status: {status}",
-            )
-    
-    analytics = analytics_service.get_admin_vendor_analytics(
-        vendor_id=vendor_uuid,
-        start_date=start,
-        end_date=end,
-        status_filter=status_filter,
-    )
-    
-    return analytics
+    return _conditional_response(request, analytics)
 
 
 @router.get(
@@ -996,46 +855,24 @@ def get_vendor_analytics(
     description="Get analytics for all vendors with search and filters.",
 )
 def get_vendor_list_analytics(
+    request: Request,
     current_user: AdminUser,
     db: DbSession,
     search: Optional[str] = Query(None),
     is_verified: Optional[bool] = Query(None),
     is_active: Optional[bool] = Query(None),
-    start_date: Optional[str] = Query(None),
-    end_date: Optional[str] = Query(None),
+    date_range: AnalyticsDateRange = Depends(),
 ):
     """Get vendor list analytics."""
     analytics_service = AnalyticsService(db)
-    
-    # Parse dates
-    start = None
-    end = None
-    if start_date:
-        try:
-            start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid start_date format. Use YYYY-MM-DD",
-            )
-    if end_date:
-        try:
-            end = datetime.strptime(end_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid end_date format. Use YYYY-MM-DD",
-            )
-    
     analytics = analytics_service.get_admin_vendor_list_analytics(
         search=search,
         is_verified=is_verified,
         is_active=is_active,
-        start_date=start,
-        end_date=end,
+        **date_range.model_dump(),
     )
     
-    return analytics
+    return _conditional_response(request, analytics)
 
 
 @router.get(
@@ -1044,54 +881,17 @@ def get_vendor_list_analytics(
     description="Get comprehensive delivery partner analytics with filters.",
 )
 def get_delivery_partner_analytics(
+    request: Request,
     current_user: AdminUser,
     db: DbSession,
-    delivery_partner_id: Optional[str] = Query(None),
-    start_date: Optional[str] = Query(None),
-    end_date: Optional[str] = Query(None),
+    filters: DeliveryPartnerAnalyticsFilters = Depends(),
     limit: Optional[int] = Query(None),  # Ignore limit parameter for now
 ):
     """Get delivery partner analytics."""
     analytics_service = AnalyticsService(db)
+    analytics = analytics_service.get_admin_delivery_partner_analytics(**filters.model_dump())
     
-    # Parse dates
-    start = None
-    end = None
-    if start_date:
-        try:
-            start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid start_date format. Use YYYY-MM-DD",
-            )
-    if end_date:
-        try:
-            end = datetime.strptime(end_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid end_date format. Use YYYY-MM-DD",
-            )
-    
-    # Parse delivery partner ID
-    dp_uuid = None
-    if delivery_partner_id:
-        try:
-            dp_uuid = uuid.UUID(delivery_partner_id)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid delivery partner ID",
-            )
-    
-    analytics = analytics_service.get_admin_delivery_partner_analytics(
-        delivery_partner_id=dp_uuid,
-        start_date=start,
-        end_date=end,
-    )
-    
-    return analytics
+    return _conditional_response(request, analytics)
 
 
 @router.get(
@@ -1100,41 +900,19 @@ def get_delivery_partner_analytics(
     description="Get analytics for all delivery partners with search and filters.",
 )
 def get_delivery_partner_list_analytics(
+    request: Request,
     current_user: AdminUser,
     db: DbSession,
     search: Optional[str] = Query(None),
     is_active: Optional[bool] = Query(None),
-    start_date: Optional[str] = Query(None),
-    end_date: Optional[str] = Query(None),
+    date_range: AnalyticsDateRange = Depends(),
 ):
     """Get delivery partner list analytics."""
     analytics_service = AnalyticsService(db)
-    
-    # Parse dates
-    start = None
-    end = None
-    if start_date:
-        try:
-            start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid start_date format. Use YYYY-MM-DD",
-            )
-    if end_date:
-        try:
-            end = datetime.strptime(end_date, "%Y-%m-%d").date()
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid end_date format. Use YYYY-MM-DD",
-            )
-    
     analytics = analytics_service.get_admin_delivery_partner_list_analytics(
         search=search,
         is_active=is_active,
-        start_date=start,
-        end_date=end,
+        **date_range.model_dump(),
     )
     
-    return analytics
+    return _conditional_response(request, analytics)
@@ -4,15 +4,20 @@ Analytics endpoints for admins
 """
 
 from datetime import date
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import sessionmaker
 
-from app.database import get_db
+from app.database import get_db, get_session_factory
 from app.api.deps import DbSession, require_role, get_current_user
 from app.models.user import User
 from app.models.enums import UserRole
 from app.schemas.analytics import (
+    AdminDashboardBundleResponse,
     AdminDashboardStatsResponse,
     VendorPerformanceResponse,
     RevenueReportResponse,
@@ -20,11 +25,29 @@ from app.schemas.analytics import (
     VendorPerformanceItem,
     RevenueReportItem,
     DeliveryPartnerPerformanceItem,
+    ReportGroupBy,
 )
 from app.services.analytics_service import AnalyticsService
+from app.utils.cache import cache_key, get_cache, set_cache
 
 router = APIRouter()
 
+# Reports are shared by every admin and only expire: platform aggregates a
+# minute old are fine for the dashboard, and no write path has to know them
+ANALYTICS_CACHE_PREFIX = "admin:analytics"
+ANALYTICS_CACHE_TTL = 60
+
+
+def _cached_report(key: str, build: Callable[[], BaseModel]) -> Any:
+    """Return the cached JSON form of a report, building it on a miss."""
+    cached_report = get_cache(key)
+    if cached_report is not None:
+        return cached_report
+    
+    report = build().model_dump(mode="json")
+    set_cache(key, report, ttl=ANALYTICS_CACHE_TTL)
+    return report
+
 
 @router.get(
     "/dashboard",
@@ -37,10 +60,13 @@ def get_admin_dashboard_stats(
     current_user: User = Depends(require_role([UserRole.ADMIN])),
 ):
     """Get admin dashboard statistics."""
-    analytics_service = AnalyticsService(db)
-    stats = analytics_service.get_admin_dashboard_stats()
+    def build() -> AdminDashboardStatsResponse:
+        analytics_service = AnalyticsService(db)
+        stats = analytics_service.get_admin_dashboard_stats()
+        
+        return AdminDashboardStatsResponse(**stats)
     
-    return AdminDashboardStatsResponse(**stats)
+    return _cached_report(cache_key(ANALYTICS_CACHE_PREFIX, "dashboard"), build)
 
 
 @router.get(
@@ -55,12 +81,15 @@ def get_vendor_performance_report(
     limit: int = Query(10, ge=1, le=50, description="Number of vendors"),
 ):
     """Get vendor performance report."""
-    analytics_service = AnalyticsService(db)
-    vendors = analytics_service.get_vendor_performance_report(limit=limit)
+    def build() -> VendorPerformanceResponse:
+        analytics_service = AnalyticsService(db)
+        vendors = analytics_service.get_vendor_performance_report(limit=limit)
+        
+        return VendorPerformanceResponse(
+            vendors=[VendorPerformanceItem(**item) for item in vendors]
+        )
     
-    return VendorPerformanceResponse(
-        vendors=[VendorPerformanceItem(**item) for item in vendors]
-    )
+    return _cached_report(cache_key(ANALYTICS_CACHE_PREFIX, "vendors", limit=limit), build)
 
 
 @router.get(
@@ -74,30 +103,62 @@ def get_revenue_report(
     current_user: User = Depends(require_role([UserRole.ADMIN])),
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
-    group_by: str = Query("day", description="Group by: day, week, month"),
+    group_by: ReportGroupBy = Query(ReportGroupBy.DAY, description="Group by: day, week, month"),
 ):
     """Get platform revenue report."""
-    # Validate group_by
-    valid_groups = ["day", "week", "month"]
-    if group_by not in valid_groups:
-        group_by = "day"
+    def build() -> RevenueReportResponse:
+        analytics_service = AnalyticsService(db)
+        report = analytics_service.get_revenue_report(
+            start_date=start_date,
+            end_date=end_date,
+            group_by=group_by.value,
+        )
+        
+        return RevenueReportResponse(
+            items=[RevenueReportItem(**item) for item in report["items"]],
+            total_revenue=report["total_revenue"],
+            total_orders=report["total_orders"],
+        )
     
-    analytics_service = AnalyticsService(db)
-    revenue_data = analytics_service.get_revenue_report(
-        start_date=start_date,
-        end_date=end_date,
-        group_by=group_by,
+    key = cache_key(
+        ANALYTICS_CACHE_PREFIX, "revenue",
+        start_date=start_date, end_date=end_date, group_by=group_by.value,
     )
+    return _cached_report(key, build)
+
+
+@router.get(
+    "/revenue/stream",
+    summary="Stream revenue report",
+    description=(
+        "Get the platform revenue report as NDJSON: one line per time period, "
+        "then a line with total_revenue and total_orders."
+    ),
+)
+def stream_revenue_report(
+    session_factory: sessionmaker = Depends(get_session_factory),
+    current_user: User = Depends(require_role([UserRole.ADMIN])),
+    start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
+    group_by: ReportGroupBy = Query(ReportGroupBy.DAY, description="Group by: day, week, month"),
+):
+    """Stream platform revenue report."""
+    def lines() -> Iterator[bytes]:
+        # The request's session is closed before the body streams, so the
+        # rows are read through a session owned by the stream itself
+        db = session_factory()
+        try:
+            analytics_service = AnalyticsService(db)
+            for row in analytics_service.iter_revenue_report(
+                start_date=start_date,
+                end_date=end_date,
+                group_by=group_by.value,
+            ):
+                yield orjson.dumps(row) + b"\n"
+        finally:
+            db.close()
     
-    # Calculate totals
-    total_revenue = sum(item["revenue"] for item in revenue_data)
-    total_orders = sum(item["order_count"] for item in revenue_data)
-    
-    return RevenueReportResponse(
-        items=[RevenueReportItem(**item) for item in revenue_data],
-        total_revenue=total_revenue,
-        total_orders=total_orders,
-    )
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get(
@@ -112,10 +173,43 @@ def get_delivery_partner_performance_report(
     limit: int = Query(10, ge=1, le=50, description="Number of delivery partners"),
 ):
     """Get delivery partner performance report."""
-    analytics_service = AnalyticsService(db)
-    delivery_partners = analytics_service.get_delivery_partner_performance_report(limit=limit)
+    def build() -> DeliveryPartnerPerformanceResponse:
+        analytics_service = AnalyticsService(db)
+        delivery_partners = analytics_service.get_delivery_partner_performance_report(limit=limit)
+        
+        return DeliveryPartnerPerformanceResponse(
+            delivery_partners=[DeliveryPartnerPerformanceItem(**item) for item in delivery_partners]
+        )
     
-    return DeliveryPartnerPerformanceResponse(
-        delivery_partners=[DeliveryPartnerPerformanceItem(**item) for item in delivery_partners]
-    )
+    key = cache_key(ANALYTICS_CACHE_PREFIX, "delivery_partners", limit=limit)
+    return _cached_report(key, build)
 
+
+@router.get(
+    "/dashboard/all",
+    response_model=AdminDashboardBundleResponse,
+    summary="Get all admin dashboard reports",
+    description="Get dashboard stats and the vendor, revenue and delivery partner reports in one request.",
+)
+def get_admin_dashboard_bundle(
+    db: DbSession,
+    current_user: User = Depends(require_role([UserRole.ADMIN])),
+    limit: int = Query(10, ge=1, le=50, description="Number of vendors and delivery partners"),
+    start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
+    group_by: ReportGroupBy = Query(ReportGroupBy.DAY, description="Group by: day, week, month"),
+):
+    """
+    Get all admin dashboard reports.
+    
+    One round-trip instead of four; each report is read from (or written
+    to) the same cache entry as its own endpoint.
+    """
+    return {
+        "stats": get_admin_dashboard_stats(db, current_user),
+        "vendors": get_vendor_performance_report(db, current_user, limit=limit),
+        "revenue": get_revenue_report(
+            db, current_user, start_date=start_date, end_date=end_date, group_by=group_by,
+        ),
+        "delivery_partners": get_delivery_partner_performance_report(db, current_user, limit=limit),
+    }
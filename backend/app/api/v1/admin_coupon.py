@@ -3,12 +3,15 @@ Admin Coupon Management API Routes
 Admin-only coupon CRUD operations
 """
 
+import base64
 import uuid
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from sqlalchemy.orm import Session, raiseload
+from sqlalchemy import or_, func, literal, tuple_, update
+from sqlalchemy.exc import IntegrityError
 
 from app.api.deps import get_db, require_role
 from app.models.user import User
@@ -21,10 +24,57 @@ from app.schemas.coupon import (
     CouponListResponse,
 )
 from app.schemas.user import MessageResponse
+from app.schemas.base import model_response
 
 router = APIRouter(prefix="/admin/coupons", tags=["Admin - Coupons"])
 
 
+def _is_duplicate_code(error: IntegrityError) -> bool:
+    """Whether an IntegrityError was raised by the unique index on code."""
+    diag = getattr(error.orig, "diag", None)
+    if diag is not None:
+        return diag.constraint_name == "ix_coupons_code"
+    # SQLite names only the offending column, not the constraint
+    return "UNIQUE constraint failed: coupons.code" in str(error.orig)
+
+
+def _encode_cursor(coupon: Coupon) -> str:
+    """Encode the list position after a coupon as an opaque cursor."""
+    raw = f"{coupon.created_at.isoformat()}|{coupon.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """Decode a cursor from _encode_cursor into (created_at, id)."""
+    try:
+        created_at, coupon_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(coupon_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+def _coupon_filters(search: Optional[str], is_active: Optional[bool]) -> List:
+    """Build the admin coupon list filter criteria."""
+    criteria = []
+    if search:
+        # Codes are stored upper-cased, so a case-sensitive LIKE on the
+        # upper-cased term matches them without ILIKE's per-row case folding
+        criteria.append(
+            or_(
+                Coupon.code.like(f"%{search.upper()}%"),
+                Coupon.description.ilike(f"%{search}%"),
+            )
+        )
+    
+    if is_active is not None:
+        criteria.append(Coupon.is_active == is_active)
+    
+    return criteria
+
+
 @router.post("", response_model=CouponResponse, status_code=status.HTTP_201_CREATED)
 def create_coupon(
     data: CouponCreate,
@@ -32,20 +82,8 @@ def create_coupon(
     current_user: User = Depends(require_role([UserRole.ADMIN])),
 ):
     """Create a new coupon."""
-    # Check if code already exists
-    existing = db.query(Coupon).filter(
-        Coupon.code == data.code.upper().strip()
-    ).first()
-    
-    if existing:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Coupon code already exists",
-        )
-    
-    # Create coupon
     coupon = Coupon(
-        code=data.code.upper().strip(),
+        code=data.code,
         description=data.description,
         discount_type=data.discount_type,
         discount_value=data.discount_value,
@@ -57,8 +95,19 @@ def create_coupon(
         is_active=True,
     )
     
+    # The unique index on code decides duplicates atomically: checking first
+    # would let two concurrent creates of the same code both pass
     db.add(coupon)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError as e:
+        db.rollback()
+        if not _is_duplicate_code(e):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Coupon code already exists",
+        )
     db.refresh(coupon)
     
     return coupon
@@ -70,41 +119,55 @@ def list_coupons(
     size: int = Query(10, ge=1, le=100),
     search: Optional[str] = Query(None),
     is_active: Optional[bool] = Query(None),
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = Query(False, description="Count matches when paging by cursor"),
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role([UserRole.ADMIN])),
 ):
-    """List all coupons with pagination."""
-    query = db.query(Coupon)
-    
-    # Apply filters
-    if search:
+    """
+    List all coupons, newest first.
+    
+    Pass the returned next_cursor to fetch the following page: it seeks
+    past the last coupon on the (created_at, id) index instead of counting
+    and skipping rows. Page numbers still work and always include the total.
+    """
+    criteria = _coupon_filters(search, is_active)
+    # CouponResponse has no relationships; fail loudly rather than lazy-load
+    # one per coupon if a serialized field ever starts touching usages
+    query = db.query(Coupon).options(raiseload("*")).filter(*criteria)
+    
+    # Count total on a bare count(id) query: wrapping the ordered row query
+    # in a count(*) subquery keeps PostgreSQL off an index-only scan
+    total = None
+    if cursor is None or include_total:
+        total = db.query(func.count(Coupon.id)).filter(*criteria).scalar()
+    
+    # Paginate, fetching one extra row to learn whether a next page exists
+    query = query.order_by(Coupon.created_at.desc(), Coupon.id.desc())
+    if cursor:
+        created_at, coupon_id = _decode_cursor(cursor)
         query = query.filter(
-            or_(
-                Coupon.code.ilike(f"%{search}%"),
-                Coupon.description.ilike(f"%{search}%") if Coupon.description else False,
+            tuple_(Coupon.created_at, Coupon.id) < tuple_(
+                literal(created_at, Coupon.created_at.type),
+                literal(coupon_id, Coupon.id.type),
             )
         )
+    else:
+        query = query.offset((page - 1) * size)
     
-    if is_active is not None:
-        query = query.filter(Coupon.is_active == is_active)
-    
-    # Count total
-    total = query.count()
-    
-    # Paginate
-    offset = (page - 1) * size
-    coupons = query.order_by(Coupon.created_at.desc()).offset(offset).limit(size).all()
+    coupons = query.limit(size + 1).all()
+    next_cursor = _encode_cursor(coupons[size - 1]) if len(coupons) > size else None
     
-    # Calculate pages
-    pages = (total + size - 1) // size
-    
-    return CouponListResponse(
-        items=coupons,
+    response = CouponListResponse(
+        items=coupons[:size],
         total=total,
         page=page,
         size=size,
-        pages=pages,
+        pages=(total + size - 1) // size if total is not None else None,
+        next_cursor=next_cursor,
     )
+    
+    return model_response(response)
 
 
 @router.get("/{coupon_id}", response_model=CouponResponse)
@@ -133,7 +196,16 @@ def update_coupon(
     current_user: User = Depends(require_role([UserRole.ADMIN])),
 ):
     """Update a coupon."""
-    coupon = db.query(Coupon).filter(Coupon.id == coupon_id).first()
+    # None means "leave unchanged", so only the provided fields are written
+    updates = data.model_dump(exclude_none=True)
+    if not updates:
+        return get_coupon(coupon_id, db, current_user)
+    
+    # One UPDATE ... RETURNING both writes the fields and loads the result,
+    # which is serialized before commit expires the returned instance
+    coupon = db.execute(
+        update(Coupon).where(Coupon.id == coupon_id).values(**updates).returning(Coupon)
+    ).scalar_one_or_none()
     
     if not coupon:
         raise HTTPException(
@@ -141,26 +213,10 @@ def update_coupon(
             detail="Coupon not found",
         )
     
-    # Update fields
-    if data.description is not None:
-        coupon.description = data.description
-    if data.discount_value is not None:
-        coupon.discount_value = data.discount_value
-    if data.min_order_amount is not None:
-        coupon.min_order_amount = data.min_order_amount
-    if data.max_discount is not None:
-        coupon.max_discount = data.max_discount
-    if data.expiry_date is not None:
-        coupon.expiry_date = data.expiry_date
-    if data.usage_limit is not None:
-        coupon.usage_limit = data.usage_limit
-    if data.is_active is not None:
-        coupon.is_active = data.is_active
-    
+    response = CouponResponse.model_validate(coupon)
     db.commit()
-    db.refresh(coupon)
     
-    return coupon
+    return model_response(response)
 
 
 @router.delete("/{coupon_id}", response_model=MessageResponse)
@@ -170,17 +226,18 @@ def delete_coupon(
     current_user: User = Depends(require_role([UserRole.ADMIN])),
 ):
     """Disable a coupon (soft delete)."""
-    coupon = db.query(Coupon).filter(Coupon.id == coupon_id).first()
+    # Soft delete - just mark as inactive, in one UPDATE whose row count
+    # tells whether the coupon exists
+    updated = db.query(Coupon).filter(Coupon.id == coupon_id).update(
+        {Coupon.is_active: False}, synchronize_session=False,
+    )
     
-    if not coupon:
+    if not updated:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Coupon not found",
         )
     
-    # Soft delete - just mark as inactive
-    coupon.is_active = False
-    
     db.commit()
     
     return MessageResponse(message="Coupon disabled successfully")
@@ -7,12 +7,18 @@ import math
 import uuid
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy.orm import Session, joinedload
 
 from app.database import get_db
 from app.api.deps import DbSession, AdminUser, CurrentUser
-from app.services.attribute_service import AttributeService
+from app.services.attribute_service import (
+    AttributeService,
+    FILTER_OPTIONS_CACHE_PREFIX,
+    get_local_filter_options,
+    set_local_filter_options,
+)
 from app.services.segment_service import SegmentService
 from app.models.attribute import CategoryAttribute
 from app.schemas.attribute import (
@@ -28,12 +34,30 @@ from app.schemas.attribute import (
     AttributeSegmentResponse,
     AttributeSegmentListResponse,
     AttributeSegmentWithAttributes,
+    SegmentOrderItem,
 )
 from app.schemas.user import MessageResponse
+from app.schemas.base import construct_from_orm, model_response
+from app.utils.cache import cache_key, get_cache, set_cache
 
 
 router = APIRouter()
 
+# Filter options are invalidated by AttributeService on attribute writes;
+# the TTL bounds how stale the product counts get as products change
+FILTER_OPTIONS_CACHE_TTL = 300
+
+
+def _attribute_response(attribute: CategoryAttribute) -> CategoryAttributeResponse:
+    """Build the response for an attribute of the requested category."""
+    return construct_from_orm(
+        CategoryAttributeResponse,
+        attribute,
+        category_name=attribute.category.name if attribute.category else None,
+        segment_name=attribute.segment.name if attribute.segment else None,
+        is_own=True,
+    )
+
 
 # ============== Admin: Category Attribute Management ==============
 
@@ -45,23 +69,15 @@ router = APIRouter()
     description="Create a new attribute for a category. Admin only.",
 )
 def create_category_attribute(
-    category_id: str,
+    category_id: uuid.UUID,
     data: CategoryAttributeCreate,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Create a new attribute for a category."""
-    try:
-        category_uuid = uuid.UUID(category_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid category ID",
-        )
-    
     # Ensure category_id in path matches body
-    if data.category_id != category_uuid:
-        data.category_id = category_uuid
+    if data.category_id != category_id:
+        data.category_id = category_id
     
     attr_service = AttributeService(db)
     
@@ -73,30 +89,7 @@ def create_category_attribute(
             detail=str(e),
         )
     
-    return CategoryAttributeResponse(
-        id=attribute.id,
-        category_id=attribute.category_id,
-        segment_id=attribute.segment_id,
-        name=attribute.name,
-        slug=attribute.slug,
-        description=attribute.description,
-        attribute_type=attribute.attribute_type,
-        options=attribute.options,
-        unit=attribute.unit,
-        is_required=attribute.is_required,
-        is_inherited=attribute.is_inherited,
-        is_filterable=attribute.is_filterable,
-        is_searchable=attribute.is_searchable,
-        display_order=attribute.display_order,
-        show_in_listing=attribute.show_in_listing,
-        show_in_details=attribute.show_in_details,
-        is_active=attribute.is_active,
-        created_at=attribute.created_at,
-        updated_at=attribute.updated_at,
-        category_name=attribute.category.name if attribute.category else None,
-        segment_name=attribute.segment.name if attribute.segment else None,
-        is_own=True,
-    )
+    return model_response(_attribute_response(attribute), status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -106,56 +99,22 @@ def create_category_attribute(
     description="Get all attributes for a category including inherited ones. Admin only.",
 )
 def get_category_attributes(
-    category_id: str,
+    category_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
     include_inactive: bool = Query(False),
     own_only: bool = Query(False, description="Only return attributes directly on this category"),
 ):
     """Get attributes for a category."""
-    try:
-        category_uuid = uuid.UUID(category_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid category ID",
-        )
-    
     attr_service = AttributeService(db)
     
     if own_only:
-        attributes = attr_service.get_category_own_attributes(category_uuid, include_inactive)
-        items = [
-            CategoryAttributeResponse(
-                id=attr.id,
-                category_id=attr.category_id,
-                segment_id=attr.segment_id,
-                name=attr.name,
-                slug=attr.slug,
-                description=attr.description,
-                attribute_type=attr.attribute_type,
-                options=attr.options,
-                unit=attr.unit,
-                is_required=attr.is_required,
-                is_inherited=attr.is_inherited,
-                is_filterable=attr.is_filterable,
-                is_searchable=attr.is_searchable,
-                display_order=attr.display_order,
-                show_in_listing=attr.show_in_listing,
-                show_in_details=attr.show_in_details,
-                is_active=attr.is_active,
-                created_at=attr.created_at,
-                updated_at=attr.updated_at,
-                category_name=attr.category.name if attr.category else None,
-                segment_name=attr.segment.name if attr.segment else None,
-                is_own=True,
-            )
-            for attr in attributes
-        ]
+        attributes = attr_service.get_category_own_attributes(category_id, include_inactive)
+        items = [_attribute_response(attr) for attr in attributes]
     else:
-        items = attr_service.get_attributes_for_product_form(category_uuid)
+        items = attr_service.get_attributes_for_product_form(category_id)
     
-    return CategoryAttributeListResponse(items=items, total=len(items))
+    return model_response(CategoryAttributeListResponse(items=items, total=len(items)))
 
 
 @router.get(
@@ -165,21 +124,13 @@ def get_category_attributes(
     description="Get a single attribute by its ID. Admin only.",
 )
 def get_attribute(
-    attribute_id: str,
+    attribute_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Get attribute by ID."""
-    try:
-        attr_uuid = uuid.UUID(attribute_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid attribute ID",
-        )
-    
     attr_service = AttributeService(db)
-    attribute = attr_service.get_attribute_by_id(attr_uuid)
+    attribute = attr_service.get_attribute_by_id(attribute_id)
     
     if not attribute:
         raise HTTPException(
@@ -187,30 +138,7 @@ def get_attribute(
             detail="Attribute not found",
         )
     
-    return CategoryAttributeResponse(
-        id=attribute.id,
-        category_id=attribute.category_id,
-        segment_id=attribute.segment_id,
-        name=attribute.name,
-        slug=attribute.slug,
-        description=attribute.description,
-        attribute_type=attribute.attribute_type,
-        options=attribute.options,
-        unit=attribute.unit,
-        is_required=attribute.is_required,
-        is_inherited=attribute.is_inherited,
-        is_filterable=attribute.is_filterable,
-        is_searchable=attribute.is_searchable,
-        display_order=attribute.display_order,
-        show_in_listing=attribute.show_in_listing,
-        show_in_details=attribute.show_in_details,
-        is_active=attribute.is_active,
-        created_at=attribute.created_at,
-        updated_at=attribute.updated_at,
-        category_name=attribute.category.name if attribute.category else None,
-        segment_name=attribute.segment.name if attribute.segment else None,
-        is_own=True,
-    )
+    return model_response(_attribute_response(attribute))
 
 
 @router.put(
@@ -220,24 +148,16 @@ def get_attribute(
     description="Update a category attribute. Admin only.",
 )
 def update_attribute(
-    attribute_id: str,
+    attribute_id: uuid.UUID,
     data: CategoryAttributeUpdate,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Update an attribute."""
-    try:
-        attr_uuid = uuid.UUID(attribute_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid attribute ID",
-        )
-    
     attr_service = AttributeService(db)
     
     try:
-        attribute = attr_service.update_attribute(attr_uuid, data)
+        attribute = attr_service.update_attribute(attribute_id, data)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -250,30 +170,7 @@ def update_attribute(
             detail="Attribute not found",
         )
     
-    return CategoryAttributeResponse(
-        id=attribute.id,
-        category_id=attribute.category_id,
-        segment_id=attribute.segment_id,
-        name=attribute.name,
-        slug=attribute.slug,
-        description=attribute.description,
-        attribute_type=attribute.attribute_type,
-        options=attribute.options,
-        unit=attribute.unit,
-        is_required=attribute.is_required,
-        is_inherited=attribute.is_inherited,
-        is_filterable=attribute.is_filterable,
-        is_searchable=attribute.is_searchable,
-        display_order=attribute.display_order,
-        show_in_listing=attribute.show_in_listing,
-        show_in_details=attribute.show_in_details,
-        is_active=attribute.is_active,
-        created_at=attribute.created_at,
-        updated_at=attribute.updated_at,
-        category_name=attribute.category.name if attribute.category else None,
-        segment_name=attribute.segment.name if attribute.segment else None,
-        is_own=True,
-    )
+    return model_response(_attribute_response(attribute))
 
 
 # ============== Admin: Attribute Segment Management ==============
@@ -286,7 +183,7 @@ def update_attribute(
     description="Create a new attribute segment for a category. Admin only.",
 )
 def create_segment(
-    category_id: str,
+    category_id: uuid.UUID,
     data: AttributeSegmentCreate,
     current_user: AdminUser,
     db: DbSession,
@@ -300,16 +197,6 @@ def create_segment(
     logger.info(f"  Request data: {data}")
     logger.info(f"  Current user: {current_user.id}")
     
-    try:
-        category_uuid = uuid.UUID(category_id)
-        logger.info(f"  Parsed category UUID: {category_uuid}")
-    except ValueError as e:
-        logger.error(f"  Invalid category ID format: {category_id}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid category ID",
-        )
-    
     # Ensure category_id in path matches body - use path parameter as source of truth
     # Create a new instance with the correct category_id
     # Pydantic will handle defaults automatically, so we can use data directly
@@ -322,7 +209,7 @@ def create_segment(
         
         # Use Pydantic's model_dump to get all fields with defaults, then override category_id
         segment_dict = data.model_dump(exclude={'category_id'})
-        segment_dict['category_id'] = category_uuid
+        segment_dict['category_id'] = category_id
         if description is not None:
             segment_dict['description'] = description
         
@@ -362,25 +249,12 @@ def create_segment(
             detail=f"Failed to create segment: {str(e)}",
         )
     
-    # Get attribute count
-    from sqlalchemy import func
-    attr_count = db.query(func.count(CategoryAttribute.id)).filter(
-        CategoryAttribute.segment_id == segment.id,
-        CategoryAttribute.is_active == True
-    ).scalar() or 0
-    
-    return AttributeSegmentResponse(
-        id=segment.id,
-        category_id=segment.category_id,
-        name=segment.name,
-        description=segment.description,
-        icon=segment.icon,
-        display_order=segment.display_order,
-        is_collapsible=segment.is_collapsible,
-        is_active=segment.is_active,
-        created_at=segment.created_at,
-        updated_at=segment.updated_at,
-        attribute_count=attr_count,
+    # A new segment has no attributes yet
+    attr_count = 0
+    
+    return model_response(
+        construct_from_orm(AttributeSegmentResponse, segment, attribute_count=attr_count),
+        status.HTTP_201_CREATED,
     )
 
 
@@ -391,66 +265,39 @@ def create_segment(
     description="Get all segments for a category. Admin only.",
 )
 def get_category_segments(
-    category_id: str,
+    category_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
     include_inactive: bool = Query(False),
     with_attributes: bool = Query(False, description="Include attributes in response"),
 ):
     """Get segments for a category."""
-    try:
-        category_uuid = uuid.UUID(category_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid category ID",
-        )
-    
     segment_service = SegmentService(db)
     
     if with_attributes:
-        segments = segment_service.get_segments_with_attributes(category_uuid, include_inactive)
+        segments = segment_service.get_segments_with_attributes(category_id, include_inactive)
         items = [
-            AttributeSegmentResponse(
-                id=seg.id,
-                category_id=seg.category_id,
-                name=seg.name,
-                description=seg.description,
-                icon=seg.icon,
-                display_order=seg.display_order,
-                is_collapsible=seg.is_collapsible,
-                is_active=seg.is_active,
-                created_at=seg.created_at,
-                updated_at=seg.updated_at,
+            construct_from_orm(
+                AttributeSegmentResponse,
+                seg,
                 attribute_count=seg.attribute_count,
             )
             for seg in segments
         ]
     else:
-        segments = segment_service.get_segments_by_category(category_uuid, include_inactive)
+        segments = segment_service.get_segments_by_category(category_id, include_inactive)
+        attr_counts = segment_service.get_attribute_counts([segment.id for segment in segments])
         items = []
         for segment in segments:
-            from sqlalchemy import func
-            attr_count = db.query(func.count(CategoryAttribute.id)).filter(
-                CategoryAttribute.segment_id == segment.id,
-                CategoryAttribute.is_active == True
-            ).scalar() or 0
+            attr_count = attr_counts.get(segment.id, 0)
             
-            items.append(AttributeSegmentResponse(
-                id=segment.id,
-                category_id=segment.category_id,
-                name=segment.name,
-                description=segment.description,
-                icon=segment.icon,
-                display_order=segment.display_order,
-                is_collapsible=segment.is_collapsible,
-                is_active=segment.is_active,
-                created_at=segment.created_at,
-                updated_at=segment.updated_at,
+            items.append(construct_from_orm(
+                AttributeSegmentResponse,
+                segment,
                 attribute_count=attr_count,
             ))
     
-    return AttributeSegmentListResponse(items=items, total=len(items))
+    return model_response(AttributeSegmentListResponse(items=items, total=len(items)))
 
 
 @router.get(
@@ -460,21 +307,13 @@ def get_category_segments(
     description="Get a single segment with its attributes. Admin only.",
 )
 def get_segment(
-    segment_id: str,
+    segment_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Get segment by ID."""
-    try:
-        seg_uuid = uuid.UUID(segment_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid segment ID",
-        )
-    
     segment_service = SegmentService(db)
-    segment = segment_service.get_segment_by_id(seg_uuid)
+    segment = segment_service.get_segment_by_id(segment_id)
     
     if not segment:
         raise HTTPException(
@@ -482,50 +321,21 @@ def get_segment(
             detail="Segment not found",
         )
     
-    # Get attributes
-    attributes = db.query(CategoryAttribute).filter(
-        CategoryAttribute.segment_id == seg_uuid,
+    # Get attributes, with the category and segment their responses name
+    attributes = db.query(CategoryAttribute).options(
+        joinedload(CategoryAttribute.category),
+        joinedload(CategoryAttribute.segment),
+    ).filter(
+        CategoryAttribute.segment_id == segment_id,
         CategoryAttribute.is_active == True
     ).order_by(CategoryAttribute.display_order).all()
     
-    return AttributeSegmentWithAttributes(
-        id=segment.id,
-        category_id=segment.category_id,
-        name=segment.name,
-        description=segment.description,
-        icon=segment.icon,
-        display_order=segment.display_order,
-        is_collapsible=segment.is_collapsible,
-        is_active=segment.is_active,
-        created_at=segment.created_at,
-        updated_at=segment.updated_at,
+    return model_response(construct_from_orm(
+        AttributeSegmentWithAttributes,
+        segment,
         attribute_count=len(attributes),
-        attributes=[
-            CategoryAttributeResponse(
-                id=attr.id,
-                category_id=attr.category_id,
-                segment_id=attr.segment_id,
-                name=attr.name,
-                slug=attr.slug,
-                description=attr.description,
-                attribute_type=attr.attribute_type,
-                options=attr.options,
-                unit=attr.unit,
-                is_required=attr.is_required,
-                is_inherited=attr.is_inherited,
-                is_filterable=attr.is_filterable,
-                is_searchable=attr.is_searchable,
-                display_order=attr.display_order,
-                show_in_listing=attr.show_in_listing,
-                show_in_details=attr.show_in_details,
-                is_active=attr.is_active,
-                created_at=attr.created_at,
-                updated_at=attr.updated_at,
-                segment_name=segment.name,
-            )
-            for attr in attributes
-        ],
-    )
+        attributes=[_attribute_response(attr) for attr in attributes],
+    ))
 
 
 @router.put(
@@ -535,24 +345,16 @@ def get_segment(
     description="Update an attribute segment. Admin only.",
 )
 def update_segment(
-    segment_id: str,
+    segment_id: uuid.UUID,
     data: AttributeSegmentUpdate,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Update a segment."""
-    try:
-        seg_uuid = uuid.UUID(segment_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid segment ID",
-        )
-    
     segment_service = SegmentService(db)
     
     try:
-        segment = segment_service.update_segment(seg_uuid, data)
+        segment = segment_service.update_segment(segment_id, data)
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -565,25 +367,13 @@ def update_segment(
             detail="Segment not found",
         )
     
-    from sqlalchemy import func
-    attr_count = db.query(func.count(CategoryAttribute.id)).filter(
-        CategoryAttribute.segment_id == seg_uuid,
-        CategoryAttribute.is_active == True
-    ).scalar() or 0
-    
-    return AttributeSegmentResponse(
-        id=segment.id,
-        category_id=segment.category_id,
-        name=segment.name,
-        description=segment.description,
-        icon=segment.icon,
-        display_order=segment.display_order,
-        is_collapsible=segment.is_collapsible,
-        is_active=segment.is_active,
-        created_at=segment.created_at,
-        updated_at=segment.updated_at,
+    attr_count = segment_service.get_attribute_counts([segment_id]).get(segment_id, 0)
+    
+    return model_response(construct_from_orm(
+        AttributeSegmentResponse,
+        segment,
         attribute_count=attr_count,
-    )
+    ))
 
 
 @router.delete(
@@ -593,21 +383,13 @@ def update_segment(
     description="Soft delete an attribute segment. Admin only.",
 )
 def delete_segment(
-    segment_id: str,
+    segment_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
 ):
     """Delete a segment."""
-    try:
-        seg_uuid = uuid.UUID(segment_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid segment ID",
-        )
-    
     segment_service = SegmentService(db)
-    success = segment_service.delete_segment(seg_uuid)
+    success = segment_service.delete_segment(segment_id)
     
     if not success:
         raise HTTPException(
@@ -625,22 +407,14 @@ def delete_segment(
     description="Reorder segments for a category. Admin only.",
 )
 def reorder_segments(
-    category_id: str,
-    segment_orders: List[dict],
+    category_id: uuid.UUID,
+    segment_orders: List[SegmentOrderItem],
     current_user: AdminUser,
     db: DbSession,
 ):
     """Reorder segments."""
-    try:
-        category_uuid = uuid.UUID(category_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid category ID",
-        )
-    
     segment_service = SegmentService(db)
-    success = segment_service.reorder_segments(category_uuid, segment_orders)
+    success = segment_service.reorder_segments(category_id, segment_orders)
     
     if not success:
         raise HTTPException(
@@ -658,26 +432,18 @@ def reorder_segments(
     description="Soft delete an attribute. Admin only.",
 )
 def delete_attribute(
-    attribute_id: str,
+    attribute_id: uuid.UUID,
     current_user: AdminUser,
     db: DbSession,
     hard_delete: bool = Query(False, description="Permanently delete instead of soft delete"),
 ):
     """Delete an attribute."""
-    try:
-        attr_uuid = uuid.UUID(attribute_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid attribute ID",
-        )
-    
     attr_service = AttributeService(db)
     
     if hard_delete:
-        success = attr_service.hard_delete_attribute(attr_uuid)
+        success = attr_service.hard_delete_attribute(attribute_id)
     else:
-        success = attr_service.delete_attribute(attr_uuid)
+        success = attr_service.delete_attribute(attribute_id)
     
     if not success:
         raise HTTPException(
@@ -699,28 +465,33 @@ def delete_attribute(
     description="Get all available filter options for a category. Public.",
 )
 def get_category_filters(
-    category_id: str,
+    category_id: uuid.UUID,
     db: DbSession,
 ):
     """Get filter options for a category (for buyer filter sidebar)."""
-    try:
-        category_uuid = uuid.UUID(category_id)
-    except ValueError:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid category ID",
-        )
-    
-    attr_service = AttributeService(db)
-    
-    try:
-        filters = attr_service.get_category_filter_options(category_uuid)
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=str(e),
-        )
+    body = get_local_filter_options(category_id)
+    if body is not None:
+        return Response(body, media_type="application/json")
+    
+    key = cache_key(FILTER_OPTIONS_CACHE_PREFIX, category_id)
+    cached_filters = get_cache(key)
+    if cached_filters is not None:
+        body = orjson.dumps(cached_filters)
+    else:
+        attr_service = AttributeService(db)
+        
+        try:
+            filters = attr_service.get_category_filter_options(category_id)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=str(e),
+            )
+        
+        set_cache(key, filters.model_dump(mode="json"), ttl=FILTER_OPTIONS_CACHE_TTL)
+        body = filters.model_dump_json().encode()
     
-    return filters
+    set_local_filter_options(category_id, body)
+    return Response(body, media_type="application/json")
 
 
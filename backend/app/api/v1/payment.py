@@ -5,7 +5,7 @@ Razorpay payment integration endpoints
 
 import uuid
 import math
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Header
@@ -298,8 +298,8 @@ def list_payments(
     order_id: Optional[str] = Query(None, alias="order_id"),
     razorpay_order_id: Optional[str] = Query(None, alias="razorpay_order_id"),
     razorpay_payment_id: Optional[str] = Query(None, alias="razorpay_payment_id"),
-    date_from: Optional[str] = Query(None, alias="date_from", description="YYYY-MM-DD"),
-    date_to: Optional[str] = Query(None, alias="date_to", description="YYYY-MM-DD"),
+    date_from: Optional[date] = Query(None, alias="date_from", description="YYYY-MM-DD"),
+    date_to: Optional[date] = Query(None, alias="date_to", description="YYYY-MM-DD"),
 ):
     """
     List all payments with advanced filtering (Admin).
@@ -313,7 +313,6 @@ def list_payments(
     - date_to: Payments to date (YYYY-MM-DD)
     """
     from app.models.payment import Payment
-    from datetime import datetime
     
     query = db.query(Payment)
     
@@ -344,24 +343,10 @@ def list_payments(
     
     # Date filters
     if date_from:
-        try:
-            from_date = datetime.combine(
-                datetime.strptime(date_from, "%Y-%m-%d").date(),
-                datetime.min.time()
-            )
-            query = query.filter(Payment.created_at >= from_date)
-        except ValueError:
-            pass
+        query = query.filter(Payment.created_at >= datetime.combine(date_from, datetime.min.time()))
     
     if date_to:
-        try:
-            to_date = datetime.combine(
-                datetime.strptime(date_to, "%Y-%m-%d").date(),
-                datetime.max.time()
-            )
-            query = query.filter(Payment.created_at <= to_date)
-        except ValueError:
-            pass
+        query = query.filter(Payment.created_at <= datetime.combine(date_to, datetime.max.time()))
     
     # Get total count
     total = query.count()
@@ -13,7 +13,7 @@ from sqlalchemy.orm import Session
 from app.api.deps import get_db, require_role, get_current_user
 from app.models.user import User
 from app.models.enums import UserRole
-from app.utils.storage import upload_image, validate_image, MAX_FILE_SIZE
+from app.utils.storage import ALLOWED_IMAGE_CONTENT_TYPES, upload_image, validate_image, MAX_FILE_SIZE
 from app.config import settings
 
 router = APIRouter()
@@ -60,7 +60,7 @@ async def upload_return_request_images(
     
     for file in files:
         # Validate file type
-        if file.content_type not in ["image/jpeg", "image/png", "image/webp"]:
+        if file.content_type not in ALLOWED_IMAGE_CONTENT_TYPES:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid file type for {file.filename}. Allowed: jpg, png, webp",
@@ -163,8 +163,7 @@ async def upload_product_images(
         logger.info(f"Processing file upload: filename={file.filename}, content_type={file.content_type}, size={file.size if hasattr(file, 'size') else 'unknown'}")
         
         # Validate file type
-        allowed_types = ["image/jpeg", "image/jpg", "image/png", "image/webp"]
-        if file.content_type not in allowed_types:
+        if file.content_type not in ALLOWED_IMAGE_CONTENT_TYPES:
             logger.warning(f"Invalid file type rejected: {file.filename}, content_type={file.content_type}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -24,6 +24,7 @@ from app.schemas.vendor import (
 from app.schemas.user import MessageResponse
 from app.services.vendor_service import VendorService
 from app.api.deps import CurrentUser, DbSession, VendorUser
+from app.utils.storage import ALLOWED_IMAGE_CONTENT_TYPES
 
 
 class VendorStatsResponse(BaseModel):
@@ -178,8 +179,7 @@ async def upload_vendor_logo(
         )
     
     # Validate file type
-    allowed_types = ["image/jpeg", "image/png", "image/webp"]
-    if file.content_type not in allowed_types:
+    if file.content_type not in ALLOWED_IMAGE_CONTENT_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid file type. Allowed: jpg, png, webp",
@@ -16,6 +16,7 @@ from app.schemas.analytics import (
     VendorProductPerformanceResponse,
     SalesReportItem,
     ProductPerformanceItem,
+    ReportGroupBy,
 )
 from app.services.analytics_service import AnalyticsService
 from app.services.vendor_service import VendorService
@@ -60,7 +61,7 @@ def get_vendor_sales_report(
     current_user: VendorUser,
     start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
-    group_by: str = Query("day", description="Group by: day, week, month"),
+    group_by: ReportGroupBy = Query(ReportGroupBy.DAY, description="Group by: day, week, month"),
 ):
     """Get vendor sales report."""
     vendor_service = VendorService(db)
@@ -72,17 +73,12 @@ def get_vendor_sales_report(
             detail="Vendor profile not found",
         )
     
-    # Validate group_by
-    valid_groups = ["day", "week", "month"]
-    if group_by not in valid_groups:
-        group_by = "day"
-    
     analytics_service = AnalyticsService(db)
     sales_data = analytics_service.get_vendor_sales_report(
         vendor_id=vendor.id,
         start_date=start_date,
         end_date=end_date,
-        group_by=group_by,
+        group_by=group_by.value,
     )
     
     # Calculate totals
@@ -36,6 +36,7 @@ from app.services.product_service import ProductService
 from app.services.vendor_service import VendorService
 from app.services.attribute_service import AttributeService
 from app.api.deps import DbSession, VendorUser
+from app.utils.storage import ALLOWED_IMAGE_CONTENT_TYPES
 
 
 router = APIRouter()
@@ -443,8 +444,7 @@ async def upload_product_image(
         )
     
     # Validate file
-    allowed_types = ["image/jpeg", "image/png", "image/webp"]
-    if file.content_type not in allowed_types:
+    if file.content_type not in ALLOWED_IMAGE_CONTENT_TYPES:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid file type. Allowed: jpg, png, webp",
@@ -15,8 +15,8 @@ engine = create_engine(
     settings.database_url,
     echo=settings.debug,  # Log SQL queries in debug mode
     pool_pre_ping=True,  # Verify connections before use
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
 )
 
 # Session factory
@@ -59,6 +59,10 @@ def get_db():
     """
     Dependency that provides a database session.
     Yields a session and ensures it's closed after use.
+    
+    Creating a Session is cheap and does not touch the pool: a connection is
+    only checked out on the first query, so requests rejected before reaching
+    the database (validation, auth, 404s) never use one.
     """
     db = SessionLocal()
     try:
@@ -67,6 +71,16 @@ def get_db():
         db.close()
 
 
+def get_session_factory() -> sessionmaker:
+    """
+    Dependency that provides the session factory.
+    
+    For work that outlives the request, such as a streamed response body,
+    which opens its own session once get_db's has been closed.
+    """
+    return SessionLocal
+
+
 def init_db():
     """
     Initialize database tables.
@@ -5,9 +5,11 @@ Main application configuration and startup
 
 from contextlib import asynccontextmanager
 
+from anyio import to_thread
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 import logging
 import sys
 
@@ -55,6 +57,10 @@ async def lifespan(app: FastAPI):
     print(f"[STARTING] {settings.app_name} v{settings.app_version}")
     print(f"[INFO] API Docs: http://localhost:8000/docs")
     
+    # Route handlers and DB sessions are synchronous and run in AnyIO's
+    # threadpool, whose size caps how many requests can wait on the database
+    to_thread.current_default_thread_limiter().total_tokens = settings.threadpool_size
+    
     # Check database connection (non-blocking - app will start even if DB is temporarily unavailable)
     print("[INFO] Checking database connection...")
     try:
@@ -112,6 +118,7 @@ def create_app() -> FastAPI:
         """,
         version=settings.app_version,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",
         redoc_url="/redoc",
         openapi_url="/openapi.json",
@@ -150,6 +157,11 @@ def create_app() -> FastAPI:
         max_age=3600,  # Cache preflight requests for 1 hour
     )
     
+    # ============== Compression Middleware ==============
+    # List and analytics payloads are mostly repetitive JSON; level 5 keeps
+    # the CPU cost low while still shrinking them several times over
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+    
     # Add request logging middleware to debug CORS issues
     @app.middleware("http")
     async def log_requests(request: Request, call_next):
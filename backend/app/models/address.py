@@ -8,7 +8,8 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, Text, Numeric
+from sqlalchemy import String, Boolean, DateTime, ForeignKey, Text, Numeric, text
+from sqlalchemy.dialects.postgresql import ExcludeConstraint
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -115,6 +116,19 @@ class DeliveryAddress(Base):
         backref="delivery_addresses",
     )
     
+    # One active default per buyer, checked at commit so the default can be
+    # moved with a single UPDATE (PostgreSQL only)
+    __table_args__ = (
+        ExcludeConstraint(
+            ('buyer_id', '='),
+            name='ex_delivery_addresses_one_default',
+            using='btree',
+            where=text('is_default AND is_active'),
+            deferrable=True,
+            initially='DEFERRED',
+        ).ddl_if(dialect='postgresql'),
+    )
+    
     def __repr__(self) -> str:
         return f"<DeliveryAddress {self.label} - {self.city}>"
     
@@ -7,11 +7,11 @@ import uuid
 from datetime import datetime
 from typing import Optional, List
 
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, Text, Integer
+from sqlalchemy import String, Boolean, ForeignKey, Text, Integer
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.base import GUID
+from app.models.base import GUID, UTCDateTime
 
 
 class AttributeSegment(Base):
@@ -80,12 +80,12 @@ class AttributeSegment(Base):
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         default=datetime.utcnow,
         nullable=False,
     )
     updated_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         onupdate=datetime.utcnow,
         nullable=True,
     )
@@ -3,13 +3,34 @@ Base Model Utilities
 Custom types and mixins for SQLAlchemy models
 """
 
+import os
+import time
 import uuid
+from datetime import timezone
+from decimal import Decimal, ROUND_HALF_UP
 from typing import Any
 
-from sqlalchemy import CHAR, TypeDecorator
+from sqlalchemy import BigInteger, CHAR, DateTime, Numeric, TypeDecorator
+from sqlalchemy.sql import operators
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+    
+    The leading 48 bits are the Unix time in milliseconds, so new keys land
+    at the right edge of the primary-key B-tree instead of at random pages.
+    Use as the id default for insert-heavy tables.
+    """
+    value = (time.time_ns() // 1_000_000) << 80
+    value |= int.from_bytes(os.urandom(10), "big") & ((1 << 80) - 1)
+    # Version 7 in bits 48-51, RFC 4122 variant in bits 64-65
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
 class GUID(TypeDecorator):
     """
     Platform-independent GUID type.
@@ -47,3 +68,71 @@ class GUID(TypeDecorator):
                 return uuid.UUID(value)
         return value
 
+
+class UTCDateTime(TypeDecorator):
+    """
+    Timezone-aware timestamp exposed to Python as naive UTC.
+    
+    Stored as TIMESTAMPTZ on PostgreSQL, so comparisons against now() need no
+    per-row conversion, while the application keeps working with naive
+    datetime.utcnow() values. Naive values are assumed to be UTC.
+    """
+    
+    impl = DateTime(timezone=True)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is not None:
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            else:
+                value = value.astimezone(timezone.utc)
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+
+class Paise(TypeDecorator):
+    """
+    Rupee amount stored as a BIGINT count of paise.
+    
+    The application keeps working with Decimal rupees; the database sees
+    integers, so SUM() and comparisons run on int64 instead of NUMERIC.
+    Values are rounded half-up to the nearest paisa when bound and read.
+    
+    SQL arithmetic stays in rupees too: ``col + 5`` adds five rupees and
+    ``col * 2`` or ``col / 2`` scale by a plain number, and all of these
+    (like SUM()) read back as Decimal rupees rather than raw paise.
+    """
+    
+    impl = BigInteger
+    cache_ok = True
+
+    class comparator_factory(BigInteger.Comparator):
+        def _adapt_expression(self, op, other_comparator):
+            # Sums, differences and scaled amounts are still paise
+            if op in (operators.add, operators.sub, operators.mul, operators.truediv):
+                return op, self.type
+            return super()._adapt_expression(op, other_comparator)
+
+    def coerce_compared_value(self, op, value):
+        # Multipliers and divisors are plain numbers, not amounts; NUMERIC
+        # also keeps Postgres from truncating bigint / integer division
+        if op in (operators.mul, operators.truediv):
+            return Numeric()
+        return self
+
+    def process_bind_param(self, value, dialect):
+        if value is not None:
+            value = int(
+                (Decimal(str(value)) * 100).quantize(Decimal("1"), rounding=ROUND_HALF_UP)
+            )
+        return value
+
+    def process_result_value(self, value, dialect):
+        if value is not None:
+            return (Decimal(str(value)) / 100).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+        return value
@@ -8,11 +8,11 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional, List
 
-from sqlalchemy import String, DateTime, ForeignKey, Text, Numeric, Integer, Enum, Boolean
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import String, ForeignKey, Text, Numeric, Integer, Enum, Boolean, Index, CheckConstraint, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.database import Base
-from app.models.base import GUID
+from app.models.base import GUID, UTCDateTime
 from app.models.enums import DiscountType
 
 
@@ -58,7 +58,7 @@ class Coupon(Base):
     
     # Validity
     expiry_date: Mapped[Optional[datetime]] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         nullable=True,
     )
     
@@ -78,17 +78,16 @@ class Coupon(Base):
         Boolean,
         default=True,
         nullable=False,
-        index=True,
     )
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         default=datetime.utcnow,
         nullable=False,
     )
     updated_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         onupdate=datetime.utcnow,
         nullable=True,
     )
@@ -100,6 +99,34 @@ class Coupon(Base):
         cascade="all, delete-orphan",
     )
     
+    # Codes are stored upper-cased (checked below), so lookups compare the
+    # normalized input against code directly and no upper(code) index is needed.
+    # (created_at, id) serves the newest-first keyset pagination of the list,
+    # led by is_active when the list is filtered on it (which also covers
+    # plain is_active lookups), and the trigram indexes serve its substring
+    # ILIKE search.
+    __table_args__ = (
+        CheckConstraint('code = upper(code)', name='ck_coupons_code_upper'),
+        Index('ix_coupons_created_at_id', text('created_at DESC'), text('id DESC')),
+        Index(
+            'ix_coupons_is_active_created_at_id',
+            'is_active', text('created_at DESC'), text('id DESC'),
+        ),
+        Index(
+            'ix_coupons_code_trgm', 'code',
+            postgresql_using='gin', postgresql_ops={'code': 'gin_trgm_ops'},
+        ),
+        Index(
+            'ix_coupons_description_trgm', 'description',
+            postgresql_using='gin', postgresql_ops={'description': 'gin_trgm_ops'},
+        ),
+    )
+    
+    @validates("code")
+    def validate_code(self, key: str, code: str) -> str:
+        """Normalize codes to the upper-case form ck_coupons_code_upper requires."""
+        return code.upper().strip()
+    
     def __repr__(self) -> str:
         return f"<Coupon {self.code} - {self.discount_type}>"
     
@@ -128,13 +155,11 @@ class CouponUsage(Base):
         GUID(),
         ForeignKey("coupons.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
         ForeignKey("users.id", ondelete="SET NULL"),
         nullable=True,
-        index=True,
     )
     order_id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
@@ -149,7 +174,7 @@ class CouponUsage(Base):
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         default=datetime.utcnow,
         nullable=False,
     )
@@ -166,6 +191,12 @@ class CouponUsage(Base):
         "Order",
     )
     
+    # Indexes matching the usage-limit and per-user redemption lookups
+    __table_args__ = (
+        Index('ix_coupon_usages_coupon_id_created_at', 'coupon_id', text('created_at DESC')),
+        Index('ix_coupon_usages_user_id_coupon_id', 'user_id', 'coupon_id'),
+    )
+    
     def __repr__(self) -> str:
         return f"<CouponUsage {self.coupon_id} - Order {self.order_id}>"
 
@@ -7,11 +7,11 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import String, Boolean, ForeignKey, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.base import GUID
+from app.models.base import GUID, UTCDateTime
 
 
 class DeliveryPartner(Base):
@@ -68,12 +68,12 @@ class DeliveryPartner(Base):
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         default=datetime.utcnow,
         nullable=False,
     )
     updated_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         onupdate=datetime.utcnow,
         nullable=True,
     )
@@ -12,7 +12,7 @@ from sqlalchemy import String, DateTime, ForeignKey, Text, Numeric, Integer, Enu
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.base import GUID
+from app.models.base import GUID, UTCDateTime
 from app.models.enums import OrderStatus, PaymentStatus, PaymentMode
 
 
@@ -150,15 +150,15 @@ class Order(Base):
         nullable=True,
     )
     picked_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         nullable=True,
     )
     packed_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         nullable=True,
     )
     out_for_delivery_at: Mapped[Optional[datetime]] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         nullable=True,
     )
     # Legacy timestamps (for backward compatibility)
@@ -227,10 +227,11 @@ class Order(Base):
         back_populates="order",
         cascade="all, delete-orphan",
     )
+    # No delete cascade: the database detaches refunds (ON DELETE SET NULL)
     refunds: Mapped[List["Refund"]] = relationship(
         "Refund",
         back_populates="order",
-        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     
     def __repr__(self) -> str:
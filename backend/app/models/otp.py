@@ -6,11 +6,11 @@ import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 
-from sqlalchemy import String, Boolean, DateTime, Integer, Index
+from sqlalchemy import String, Boolean, Integer, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
-from app.models.base import GUID
+from app.models.base import GUID, UTCDateTime
 
 
 class OTP(Base):
@@ -26,7 +26,6 @@ class OTP(Base):
     mobile_number: Mapped[str] = mapped_column(
         String(15),
         nullable=False,
-        index=True,
     )
     otp_code: Mapped[str] = mapped_column(
         String(6),
@@ -43,7 +42,7 @@ class OTP(Base):
         nullable=False,
     )
     expires_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         nullable=False,
     )
     attempts: Mapped[int] = mapped_column(
@@ -57,14 +56,22 @@ class OTP(Base):
         nullable=False,
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime,
+        UTCDateTime(),
         default=datetime.utcnow,
         nullable=False,
     )
     
-    # Index for faster lookups
+    # Indexes for the rate-limit count and the "latest unverified OTP" lookup
     __table_args__ = (
-        Index('idx_mobile_purpose', 'mobile_number', 'purpose'),
+        Index('ix_otps_mobile_purpose_created_at', 'mobile_number', 'purpose', 'created_at'),
+        Index(
+            'idx_mobile_purpose',
+            'mobile_number',
+            'purpose',
+            text('created_at DESC'),
+            postgresql_include=['expires_at', 'attempts'],
+            postgresql_where=text('is_verified = false'),
+        ),
     )
     
     def is_expired(self) -> bool:
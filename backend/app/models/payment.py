@@ -98,10 +98,11 @@ class Payment(Base):
         back_populates="payment",
         cascade="all, delete-orphan",
     )
+    # No delete cascade: the database detaches refunds (ON DELETE SET NULL)
     refunds: Mapped[List["Refund"]] = relationship(
         "Refund",
         back_populates="payment",
-        cascade="all, delete-orphan",
+        passive_deletes=True,
     )
     
     def __repr__(self) -> str:
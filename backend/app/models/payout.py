@@ -9,11 +9,11 @@ from datetime import datetime, date
 from decimal import Decimal
 from typing import Optional, List
 
-from sqlalchemy import String, DateTime, ForeignKey, Numeric, Integer, Enum, Date
+from sqlalchemy import String, DateTime, ForeignKey, Integer, Enum, Date, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.base import GUID
+from app.models.base import GUID, Paise, uuid7
 
 
 class PayoutStatus(str, enum.Enum):
@@ -31,7 +31,7 @@ class VendorPayout(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     vendor_id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
@@ -57,28 +57,31 @@ class VendorPayout(Base):
         nullable=False,
     )
     gross_amount: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+        Paise(),
         default=Decimal("0.00"),
         nullable=False,
     )
     commission_amount: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+        Paise(),
         default=Decimal("0.00"),
         nullable=False,
     )
     refund_deductions: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+        Paise(),
         default=Decimal("0.00"),
         nullable=False,
     )
     net_amount: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+        Paise(),
         nullable=False,
     )
     
     # Status
     status: Mapped[PayoutStatus] = mapped_column(
-        Enum(PayoutStatus, native_enum=False),
+        Enum(
+            PayoutStatus, native_enum=False,
+            create_constraint=True, name="ck_vendor_payouts_status",
+        ),
         default=PayoutStatus.PENDING,
         nullable=False,
         index=True,
@@ -111,6 +114,14 @@ class VendorPayout(Base):
         cascade="all, delete-orphan",
     )
     
+    # Payout reports scan by creation period over rows stored in time order
+    __table_args__ = (
+        Index(
+            'ix_vendor_payouts_created_at_brin', 'created_at',
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<VendorPayout {self.id} - Vendor {self.vendor_id} - {self.status}>"
 
@@ -123,7 +134,7 @@ class VendorPayoutItem(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     payout_id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
@@ -140,15 +151,15 @@ class VendorPayoutItem(Base):
     
     # Amounts
     order_amount: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+        Paise(),
         nullable=False,
     )
     commission: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+        Paise(),
         nullable=False,
     )
     net_amount: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+        Paise(),
         nullable=False,
     )
     
@@ -168,6 +179,14 @@ class VendorPayoutItem(Base):
         "Order",
     )
     
+    # Items are inserted with their payout and never reordered
+    __table_args__ = (
+        Index(
+            'ix_vendor_payout_items_created_at_brin', 'created_at',
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<VendorPayoutItem {self.id} - Payout {self.payout_id}>"
 
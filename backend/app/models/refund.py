@@ -9,7 +9,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import String, DateTime, ForeignKey, Text, Numeric, Enum
+from sqlalchemy import String, DateTime, ForeignKey, Text, Enum, Index, text
 
 if TYPE_CHECKING:
     import importlib
@@ -21,7 +21,7 @@ if TYPE_CHECKING:
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.base import GUID
+from app.models.base import GUID, Paise, uuid7
 
 
 class RefundStatus(str, enum.Enum):
@@ -39,13 +39,13 @@ class Refund(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
-    order_id: Mapped[uuid.UUID] = mapped_column(
+    # Refunds are kept for audit when their order is deleted
+    order_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         GUID(),
-        ForeignKey("orders.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True,
+        ForeignKey("orders.id", ondelete="SET NULL"),
+        nullable=True,
     )
     payment_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         GUID(),
@@ -63,21 +63,22 @@ class Refund(Base):
     
     # Refund details
     amount: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+        Paise(),
         nullable=False,
     )
     razorpay_refund_id: Mapped[Optional[str]] = mapped_column(
         String(100),
         nullable=True,
-        index=True,
     )
     
     # Status
     status: Mapped[RefundStatus] = mapped_column(
-        Enum(RefundStatus, native_enum=False),
+        Enum(
+            RefundStatus, native_enum=False,
+            create_constraint=True, name="ck_refunds_status",
+        ),
         default=RefundStatus.INITIATED,
         nullable=False,
-        index=True,
     )
     failure_reason: Mapped[Optional[str]] = mapped_column(
         Text,
@@ -96,7 +97,7 @@ class Refund(Base):
     )
     
     # Relationships
-    order: Mapped["Order"] = relationship(
+    order: Mapped[Optional["Order"]] = relationship(
         "Order",
         back_populates="refunds",
     )
@@ -109,6 +110,24 @@ class Refund(Base):
         back_populates="refund",
     )
     
+    # Indexes matching the per-order and status-queue list queries and the
+    # gateway webhook lookup
+    __table_args__ = (
+        Index('ix_refunds_order_id_status', 'order_id', 'status'),
+        Index('ix_refunds_status_created_at', 'status', text('created_at DESC')),
+        # Gateway ids are unique once assigned; NULL until the gateway responds
+        Index(
+            'uq_refunds_razorpay_refund_id', 'razorpay_refund_id',
+            unique=True,
+            postgresql_where=text('razorpay_refund_id IS NOT NULL'),
+        ),
+        # Append-mostly: a BRIN index covers created_at range scans
+        Index(
+            'ix_refunds_created_at_brin', 'created_at',
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<Refund {self.id} - Order {self.order_id} - {self.status}>"
 
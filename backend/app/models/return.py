@@ -8,11 +8,11 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import String, DateTime, ForeignKey, Text, Numeric, Enum, JSON, Boolean
+from sqlalchemy import String, DateTime, ForeignKey, Text, Enum, JSON, Boolean, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.base import GUID
+from app.models.base import GUID, Paise, uuid7
 from app.models.enums import ReturnStatus, ReturnReason
 
 
@@ -24,13 +24,12 @@ class ReturnRequest(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     order_id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
         ForeignKey("orders.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     order_item_id: Mapped[uuid.UUID] = mapped_column(
         GUID(),
@@ -47,7 +46,10 @@ class ReturnRequest(Base):
     
     # Return details
     reason: Mapped[ReturnReason] = mapped_column(
-        Enum(ReturnReason, native_enum=False, length=50),
+        Enum(
+            ReturnReason, native_enum=False, length=50,
+            create_constraint=True, name="ck_return_requests_reason",
+        ),
         nullable=False,
     )
     description: Mapped[Optional[str]] = mapped_column(
@@ -61,13 +63,15 @@ class ReturnRequest(Base):
     
     # Status and processing
     status: Mapped[ReturnStatus] = mapped_column(
-        Enum(ReturnStatus, native_enum=False, length=50),
+        Enum(
+            ReturnStatus, native_enum=False, length=50,
+            create_constraint=True, name="ck_return_requests_status",
+        ),
         default=ReturnStatus.REQUESTED,
         nullable=False,
-        index=True,
     )
     refund_amount: Mapped[Decimal] = mapped_column(
-        Numeric(10, 2),
+        Paise(),
         default=Decimal("0.00"),
         nullable=False,
     )
@@ -111,6 +115,17 @@ class ReturnRequest(Base):
         uselist=False,
     )
     
+    # Indexes matching the per-order and status-queue list queries
+    __table_args__ = (
+        Index('ix_return_requests_order_id_status', 'order_id', 'status'),
+        Index('ix_return_requests_status_created_at', 'status', text('created_at DESC')),
+        # Requests are inserted in created_at order: BRIN for date ranges
+        Index(
+            'ix_return_requests_created_at_brin', 'created_at',
+            postgresql_using='brin', postgresql_with={'pages_per_range': 32},
+        ),
+    )
+    
     def __repr__(self) -> str:
         return f"<ReturnRequest {self.id} - Order {self.order_id} - {self.status}>"
     
@@ -71,7 +71,10 @@ class AddressResponse(BaseModel):
 
 
 class AddressListResponse(BaseModel):
-    """Schema for address list."""
+    """Schema for paginated address list."""
     items: List[AddressResponse]
     total: int
+    page: int
+    size: int
+    pages: int
 
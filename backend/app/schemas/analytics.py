@@ -3,11 +3,22 @@ Analytics Schemas
 Pydantic models for analytics request/response validation
 """
 
+import enum
+import uuid
 from datetime import date
 from typing import Optional, List, Dict, Any
 
 from pydantic import BaseModel, Field
 
+from app.models.enums import OrderStatus
+
+
+class ReportGroupBy(str, enum.Enum):
+    """Time period the sales and revenue reports group by."""
+    DAY = "day"
+    WEEK = "week"
+    MONTH = "month"
+
 
 # ============== Vendor Analytics ==============
 
@@ -119,3 +130,29 @@ class DeliveryPartnerPerformanceResponse(BaseModel):
     """Delivery partner performance report response."""
     delivery_partners: List[DeliveryPartnerPerformanceItem]
 
+
+class AdminDashboardBundleResponse(BaseModel):
+    """All admin dashboard reports in one response."""
+    stats: AdminDashboardStatsResponse
+    vendors: VendorPerformanceResponse
+    revenue: RevenueReportResponse
+    delivery_partners: DeliveryPartnerPerformanceResponse
+
+
+# ============== Admin Analytics Filters ==============
+
+class AnalyticsDateRange(BaseModel):
+    """Date range query filter shared by the admin analytics routes."""
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+
+class VendorAnalyticsFilters(AnalyticsDateRange):
+    """Query filters for admin vendor analytics."""
+    vendor_id: Optional[uuid.UUID] = None
+    status_filter: Optional[OrderStatus] = Field(None, alias="status")
+
+
+class DeliveryPartnerAnalyticsFilters(AnalyticsDateRange):
+    """Query filters for admin delivery partner analytics."""
+    delivery_partner_id: Optional[uuid.UUID] = None
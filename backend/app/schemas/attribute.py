@@ -40,6 +40,12 @@ class AttributeSegmentUpdate(BaseModel):
     is_active: Optional[bool] = None
 
 
+class SegmentOrderItem(BaseModel):
+    """New display order of one segment, for reordering a category's segments."""
+    segment_id: uuid.UUID
+    display_order: int
+
+
 class AttributeSegmentResponse(AttributeSegmentBase):
     """Schema for attribute segment responses."""
     id: uuid.UUID
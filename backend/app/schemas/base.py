@@ -0,0 +1,75 @@
+"""
+Schema Utilities
+Helpers shared by response schemas
+"""
+
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Tuple, Type, TypeVar
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+@lru_cache(maxsize=None)
+def _field_reader(
+    model_cls: Type[BaseModel],
+    skip: frozenset,
+) -> Tuple[Tuple[str, ...], Callable[[Any], Tuple[Any, ...]]]:
+    """Field names of a schema, minus skip, and one getter reading them all."""
+    names = tuple(name for name in model_cls.model_fields if name not in skip)
+    if not names:
+        return names, lambda obj: ()
+    if len(names) == 1:
+        getter = attrgetter(names[0])
+        return names, lambda obj: (getter(obj),)
+    return names, attrgetter(*names)
+
+
+def construct_from_orm(model_cls: Type[ModelT], obj: Any, **values: Any) -> ModelT:
+    """
+    Build a response model from a trusted ORM object without validation.
+    
+    Rows loaded by SQLAlchemy already match the column types, so running
+    the full validator chain on every list item only costs CPU. Only use
+    this for flat schemas: nested models are not built, so schemas with
+    nested fields should go through model_validate, or be built by the
+    caller and passed in values.
+    
+    Args:
+        model_cls: Response schema class
+        obj: ORM object exposing the schema's fields as attributes
+        **values: Values for fields the object does not carry, such as
+            computed counts; these are not read from the object
+        
+    Returns:
+        Schema instance holding the object's attribute values
+    """
+    # The field list and its getter are built once per schema and set of
+    # passed values, so each row is read with a single attrgetter call
+    names, read = _field_reader(model_cls, frozenset(values))
+    return model_cls.model_construct(**dict(zip(names, read(obj))), **values)
+
+
+def model_response(model: BaseModel, status_code: int = status.HTTP_200_OK) -> Response:
+    """
+    Send a response model built by the route as JSON in one pydantic-core pass.
+    
+    Returning the model itself would have FastAPI dump it, validate it again
+    against the route's response_model and encode the result; response_model
+    stays on the routes for the OpenAPI schema. A returned Response is sent
+    as-is, so routes declaring another status_code must pass it here too.
+    
+    Args:
+        model: Response model, already built from trusted data
+        status_code: HTTP status of the response
+        
+    Returns:
+        JSON response holding the serialized model
+    """
+    return Response(
+        model.model_dump_json(), status_code=status_code, media_type="application/json"
+    )
@@ -8,7 +8,7 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 from app.models.enums import DiscountType
 
@@ -25,6 +25,12 @@ class CouponCreate(BaseModel):
     max_discount: Optional[Decimal] = Field(None, gt=0, description="Max discount cap for percentage")
     expiry_date: Optional[datetime] = Field(None, description="Coupon expiry date")
     usage_limit: Optional[int] = Field(None, gt=0, description="Total usage limit")
+    
+    @field_validator("code")
+    @classmethod
+    def normalize_code(cls, v: str) -> str:
+        """Codes are stored and matched upper-cased."""
+        return v.upper().strip()
 
 
 class CouponUpdate(BaseModel):
@@ -41,6 +47,12 @@ class CouponUpdate(BaseModel):
 class CouponApplyRequest(BaseModel):
     """Schema for applying coupon to cart."""
     coupon_code: str = Field(..., min_length=3, max_length=50)
+    
+    @field_validator("coupon_code")
+    @classmethod
+    def normalize_code(cls, v: str) -> str:
+        """Codes are stored and matched upper-cased."""
+        return v.upper().strip()
 
 
 # ============== Response Schemas ==============
@@ -77,12 +89,18 @@ class CouponUsageResponse(BaseModel):
 
 
 class CouponListResponse(BaseModel):
-    """Schema for paginated coupon list."""
+    """
+    Schema for paginated coupon list.
+    
+    Pages fetched by cursor leave total and pages unset unless the count
+    was requested with include_total.
+    """
     items: list[CouponResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class CouponValidationResponse(BaseModel):
@@ -29,7 +29,7 @@ class RefundCreate(BaseModel):
 class RefundResponse(BaseModel):
     """Schema for refund response."""
     id: uuid.UUID
-    order_id: uuid.UUID
+    order_id: Optional[uuid.UUID]
     payment_id: Optional[uuid.UUID]
     return_request_id: Optional[uuid.UUID]
     amount: Decimal
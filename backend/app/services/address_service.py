@@ -4,9 +4,10 @@ Business logic for managing delivery addresses
 """
 
 import uuid
-from typing import Optional, List
+from typing import Callable, Optional, List, Tuple
 
-from sqlalchemy import select, update, and_
+from sqlalchemy import select, update, and_, func, lambda_stmt
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, status
 
@@ -15,6 +16,10 @@ from app.models.user import User
 from app.schemas.address import AddressCreate, AddressUpdate
 
 
+# Retries when a concurrent default switch for the same buyer wins the race
+SET_DEFAULT_ATTEMPTS = 3
+
+
 class AddressService:
     """Service for delivery address operations."""
     
@@ -27,14 +32,6 @@ class AddressService:
         data: AddressCreate,
     ) -> DeliveryAddress:
         """Create a new delivery address."""
-        # If this is set as default, unset other defaults
-        if data.is_default:
-            self._unset_default_addresses(buyer.id)
-        
-        # If this is the first address, make it default
-        existing_count = self._count_buyer_addresses(buyer.id)
-        is_default = data.is_default or existing_count == 0
-        
         address = DeliveryAddress(
             buyer_id=buyer.id,
             label=data.label,
@@ -48,11 +45,20 @@ class AddressService:
             landmark=data.landmark,
             latitude=data.latitude,
             longitude=data.longitude,
-            is_default=is_default,
         )
         
-        self.db.add(address)
-        self.db.commit()
+        def add_address() -> None:
+            # If this is set as default, unset other defaults
+            if data.is_default:
+                self._unset_default_addresses(buyer.id)
+            
+            # If this is the first address, make it default
+            existing_count = self._count_buyer_addresses(buyer.id)
+            address.is_default = data.is_default or existing_count == 0
+            
+            self.db.add(address)
+        
+        self._commit_default_change(add_address)
         self.db.refresh(address)
         
         return address
@@ -63,28 +69,42 @@ class AddressService:
         buyer_id: uuid.UUID,
     ) -> Optional[DeliveryAddress]:
         """Get a delivery address by ID."""
-        return self.db.query(DeliveryAddress).filter(
-            and_(
-                DeliveryAddress.id == address_id,
-                DeliveryAddress.buyer_id == buyer_id,
-                DeliveryAddress.is_active == True,
-            )
-        ).first()
+        # lambda_stmt caches the compiled SELECT; the ids are bound per call
+        stmt = lambda_stmt(lambda: select(DeliveryAddress).where(
+            DeliveryAddress.id == address_id,
+            DeliveryAddress.buyer_id == buyer_id,
+            DeliveryAddress.is_active == True,
+        ))
+        return self.db.execute(stmt).scalars().first()
     
     def get_buyer_addresses(
         self,
         buyer_id: uuid.UUID,
-    ) -> List[DeliveryAddress]:
-        """Get all addresses for a buyer."""
-        return self.db.query(DeliveryAddress).filter(
-            and_(
-                DeliveryAddress.buyer_id == buyer_id,
-                DeliveryAddress.is_active == True,
-            )
+        page: int = 1,
+        size: int = 20,
+    ) -> Tuple[List[DeliveryAddress], int]:
+        """Get paginated addresses for a buyer."""
+        # COUNT(*) OVER () returns the total alongside each row, so the page
+        # and the count come back in a single query
+        offset = (page - 1) * size
+        stmt = lambda_stmt(lambda: select(
+            DeliveryAddress,
+            func.count().over().label("total"),
+        ).where(
+            DeliveryAddress.buyer_id == buyer_id,
+            DeliveryAddress.is_active == True,
         ).order_by(
             DeliveryAddress.is_default.desc(),
             DeliveryAddress.created_at.desc()
-        ).all()
+        ).offset(offset).limit(size))
+        rows = self.db.execute(stmt).all()
+        
+        if rows:
+            return [row[0] for row in rows], rows[0].total
+        
+        # A page past the end has no rows to carry the total
+        total = self._count_buyer_addresses(buyer_id) if page > 1 else 0
+        return [], total
     
     def update_address(
         self,
@@ -119,11 +139,16 @@ class AddressService:
         
         # Cannot delete default address if others exist
         if address.is_default:
-            other_addresses = self.get_buyer_addresses(buyer_id)
-            other_addresses = [a for a in other_addresses if a.id != address_id]
-            if other_addresses:
-                # Make the first other address default
-                other_addresses[0].is_default = True
+            # Make the most recent other address default
+            other_address = self.db.query(DeliveryAddress).filter(
+                and_(
+                    DeliveryAddress.buyer_id == buyer_id,
+                    DeliveryAddress.is_active == True,
+                    DeliveryAddress.id != address_id,
+                )
+            ).order_by(DeliveryAddress.created_at.desc()).first()
+            if other_address:
+                other_address.is_default = True
         
         address.is_active = False
         self.db.commit()
@@ -140,10 +165,19 @@ class AddressService:
         if not address:
             return None
         
-        self._unset_default_addresses(buyer_id)
+        # One UPDATE flips the flag on exactly the rows whose value changes:
+        # the previous default and the new one
+        is_target = DeliveryAddress.id == address_id
+        self._commit_default_change(lambda: self.db.execute(
+            update(DeliveryAddress)
+            .where(
+                DeliveryAddress.buyer_id == buyer_id,
+                DeliveryAddress.is_default != is_target,
+            )
+            .values(is_default=is_target)
+            .execution_options(synchronize_session=False)
+        ))
         
-        address.is_default = True
-        self.db.commit()
         self.db.refresh(address)
         
         return address
@@ -153,13 +187,33 @@ class AddressService:
         buyer_id: uuid.UUID,
     ) -> Optional[DeliveryAddress]:
         """Get the default delivery address for a buyer."""
-        return self.db.query(DeliveryAddress).filter(
-            and_(
-                DeliveryAddress.buyer_id == buyer_id,
-                DeliveryAddress.is_active == True,
-                DeliveryAddress.is_default == True,
-            )
-        ).first()
+        stmt = lambda_stmt(lambda: select(DeliveryAddress).where(
+            DeliveryAddress.buyer_id == buyer_id,
+            DeliveryAddress.is_active == True,
+            DeliveryAddress.is_default == True,
+        ))
+        return self.db.execute(stmt).scalars().first()
+    
+    def _commit_default_change(self, apply: Callable[[], object]) -> None:
+        """
+        Apply and commit a change that may move a buyer's default address.
+        
+        A concurrent change for the same buyer violates the one-default
+        constraint at commit; the change is redone against the state that
+        won, and reported as a 409 once the attempts run out.
+        """
+        for attempt in range(1, SET_DEFAULT_ATTEMPTS + 1):
+            apply()
+            try:
+                self.db.commit()
+                return
+            except IntegrityError:
+                self.db.rollback()
+                if attempt == SET_DEFAULT_ATTEMPTS:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT,
+                        detail="Default address is being changed, please retry",
+                    )
     
     def _unset_default_addresses(self, buyer_id: uuid.UUID) -> None:
         """Unset all default addresses for a buyer."""
@@ -6,7 +6,7 @@ Business logic for vendor and admin analytics
 import uuid
 from datetime import datetime, date, timedelta
 from decimal import Decimal
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, Iterator, List, Dict, Any, Tuple
 
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_, case, extract, desc
@@ -21,10 +21,15 @@ from app.models.category import Category
 from app.models.delivery_partner import DeliveryPartner
 from app.models.delivery_history import DeliveryHistory, DeliveryAttemptStatus
 
+# Rows fetched per round-trip by report queries that stream their results
+REPORT_BATCH_SIZE = 500
+
 
 class AnalyticsService:
     """Service for analytics operations."""
     
+    __slots__ = ("db",)
+    
     def __init__(self, db: Session):
         """Initialize with database session."""
         self.db = db
@@ -378,7 +383,7 @@ class AnalyticsService:
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         group_by: str = "day",  # day, week, month
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, Any]:
         """
         Get platform revenue report.
         
@@ -388,8 +393,45 @@ class AnalyticsService:
             group_by: Group by day, week, or month
             
         Returns:
-            List of revenue data grouped by time period
+            Dictionary with revenue data grouped by time period and totals
         """
+        result = {"items": [], "total_revenue": 0.0, "total_orders": 0}
+        for row in self._revenue_report_rows(start_date, end_date, group_by):
+            if row.is_total:
+                result.update(self._revenue_totals(row))
+            else:
+                result["items"].append(self._revenue_item(row))
+        
+        return result
+    
+    def iter_revenue_report(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        group_by: str = "day",  # day, week, month
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the platform revenue report one time period at a time.
+        
+        Rows are fetched in batches rather than all at once; the last item
+        yielded holds total_revenue and total_orders.
+        """
+        totals = {"total_revenue": 0.0, "total_orders": 0}
+        for row in self._revenue_report_rows(start_date, end_date, group_by):
+            if row.is_total:
+                totals = self._revenue_totals(row)
+            else:
+                yield self._revenue_item(row)
+        
+        yield totals
+    
+    def _revenue_report_rows(
+        self,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        group_by: str,
+    ) -> Iterator[Any]:
+        """Run the revenue report query, period rows first, then the total row."""
         if not end_date:
             end_date = date.today()
         if not start_date:
@@ -412,24 +454,33 @@ class AnalyticsService:
         else:
             date_expr = func.date(Order.delivered_at)
         
-        # Aggregate revenue data
-        revenue_data = query.with_entities(
+        # Aggregate revenue data; ROLLUP adds the grand total row in the
+        # same scan, flagged by GROUPING() and sorted last (NULL period)
+        return query.with_entities(
             date_expr.label("period"),
+            func.grouping(date_expr).label("is_total"),
             func.count(Order.id).label("order_count"),
             func.sum(Order.total_amount).label("revenue"),
             func.avg(Order.total_amount).label("avg_order_value"),
-        ).group_by(date_expr).order_by(date_expr).all()
-        
-        result = []
-        for row in revenue_data:
-            result.append({
-                "period": row.period.isoformat() if isinstance(row.period, date) else row.period.strftime("%Y-%m-%d"),
-                "order_count": row.order_count,
-                "revenue": float(row.revenue or Decimal("0.00")),
-                "avg_order_value": float(row.avg_order_value or Decimal("0.00")),
-            })
-        
-        return result
+        ).group_by(func.rollup(date_expr)).order_by(date_expr).yield_per(REPORT_BATCH_SIZE)
+    
+    @staticmethod
+    def _revenue_item(row: Any) -> Dict[str, Any]:
+        """Format one time period row of the revenue report."""
+        return {
+            "period": row.period.isoformat() if isinstance(row.period, date) else row.period.strftime("%Y-%m-%d"),
+            "order_count": row.order_count,
+            "revenue": float(row.revenue or Decimal("0.00")),
+            "avg_order_value": float(row.avg_order_value or Decimal("0.00")),
+        }
+    
+    @staticmethod
+    def _revenue_totals(row: Any) -> Dict[str, Any]:
+        """Format the grand total row of the revenue report."""
+        return {
+            "total_revenue": float(row.revenue or Decimal("0.00")),
+            "total_orders": row.order_count,
+        }
     
     def get_delivery_partner_performance_report(
         self,
@@ -3,12 +3,14 @@ Attribute Service
 Business logic for category attributes and product attribute values with inheritance
 """
 
+import time
 import uuid
 import re
+import threading
 from typing import Optional, List, Dict, Any, Tuple
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import func, and_, or_
 
 from app.models.category import Category
@@ -25,6 +27,40 @@ from app.schemas.attribute import (
     AttributeFilterOption,
     CategoryFilterOptions,
 )
+from app.utils.cache import delete_cache_pattern
+
+# Cache key prefix of the public filter options (see api/v1/attribute.py)
+FILTER_OPTIONS_CACHE_PREFIX = "attributes:filters"
+
+# Serialized filter options kept in this process in front of Redis, keyed by
+# category id, so repeated requests skip the Redis round trip and the JSON
+# decode/encode. Writes in this process clear it; other processes pick up
+# attribute changes within FILTER_OPTIONS_LOCAL_TTL_SECONDS.
+FILTER_OPTIONS_LOCAL_MAXSIZE = 1024
+FILTER_OPTIONS_LOCAL_TTL_SECONDS = 30
+
+_filter_options_local: "OrderedDict[uuid.UUID, tuple[bytes, float]]" = OrderedDict()
+_filter_options_local_lock = threading.Lock()
+
+
+def get_local_filter_options(category_id: uuid.UUID) -> Optional[bytes]:
+    """Return the serialized filter options cached in this process, if fresh."""
+    with _filter_options_local_lock:
+        cached = _filter_options_local.get(category_id)
+        if cached is not None:
+            if time.time() < cached[1]:
+                return cached[0]
+            del _filter_options_local[category_id]
+    
+    return None
+
+
+def set_local_filter_options(category_id: uuid.UUID, body: bytes) -> None:
+    """Cache serialized filter options of a category in this process."""
+    with _filter_options_local_lock:
+        _filter_options_local[category_id] = (body, time.time() + FILTER_OPTIONS_LOCAL_TTL_SECONDS)
+        if len(_filter_options_local) > FILTER_OPTIONS_LOCAL_MAXSIZE:
+            _filter_options_local.popitem(last=False)
 
 
 class AttributeService:
@@ -36,6 +72,18 @@ class AttributeService:
     
     # ============== Helper Methods ==============
     
+    def _invalidate_filter_cache(self):
+        """
+        Drop cached filter options after an attribute write has committed.
+        
+        Child categories inherit their ancestors' attributes, so one write
+        can change the filters of a whole subtree; every category's entry
+        is dropped rather than working out which ones it reaches.
+        """
+        with _filter_options_local_lock:
+            _filter_options_local.clear()
+        delete_cache_pattern(f"{FILTER_OPTIONS_CACHE_PREFIX}:*")
+    
     def _generate_slug(self, name: str, category_id: uuid.UUID) -> str:
         """Generate unique slug for attribute within a category."""
         slug = name.lower().strip()
@@ -183,6 +231,7 @@ class AttributeService:
         self.db.add(attribute)
         self.db.commit()
         self.db.refresh(attribute)
+        self._invalidate_filter_cache()
         
         return attribute
     
@@ -225,6 +274,7 @@ class AttributeService:
         
         self.db.commit()
         self.db.refresh(attribute)
+        self._invalidate_filter_cache()
         
         return attribute
     
@@ -236,6 +286,7 @@ class AttributeService:
         
         attribute.is_active = False
         self.db.commit()
+        self._invalidate_filter_cache()
         
         return True
     
@@ -247,6 +298,7 @@ class AttributeService:
         
         self.db.delete(attribute)
         self.db.commit()
+        self._invalidate_filter_cache()
         
         return True
     
@@ -258,7 +310,12 @@ class AttributeService:
         include_inactive: bool = False,
     ) -> List[CategoryAttribute]:
         """Get only the attributes directly defined on a category."""
-        query = self.db.query(CategoryAttribute).filter(
+        # Responses name each attribute's category and segment: load both in
+        # the same query rather than lazily per attribute
+        query = self.db.query(CategoryAttribute).options(
+            joinedload(CategoryAttribute.category),
+            joinedload(CategoryAttribute.segment),
+        ).filter(
             CategoryAttribute.category_id == category_id
         )
         
@@ -512,21 +569,31 @@ class AttributeService:
         # Get all products in this category (and subcategories)
         category_ids = self._get_category_and_descendants(category_id)
         
-        # Build filter groups
-        filter_groups = []
-        
-        for attr in filterable_attrs:
-            # Get value counts for this attribute
+        # Count the values of every filterable attribute in one grouped query
+        value_counts_by_attr = defaultdict(list)
+        if filterable_attrs:
             value_counts = self.db.query(
+                ProductAttributeValue.attribute_id,
                 ProductAttributeValue.value,
                 func.count(ProductAttributeValue.id).label("count")
             ).join(Product).filter(
-                ProductAttributeValue.attribute_id == attr.id,
+                ProductAttributeValue.attribute_id.in_([attr.id for attr in filterable_attrs]),
                 Product.category_id.in_(category_ids),
                 Product.is_active == True,
                 Product.is_deleted == False,
-            ).group_by(ProductAttributeValue.value).all()
+            ).group_by(
+                ProductAttributeValue.attribute_id,
+                ProductAttributeValue.value,
+            ).all()
             
+            for vc in value_counts:
+                value_counts_by_attr[vc.attribute_id].append(vc)
+        
+        # Build filter groups
+        filter_groups = []
+        
+        for attr in filterable_attrs:
+            value_counts = value_counts_by_attr[attr.id]
             if not value_counts:
                 continue
             
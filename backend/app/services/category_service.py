@@ -12,17 +12,27 @@ from sqlalchemy import func
 
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryUpdate, CategoryTreeNode
+from app.utils.cache import delete_cache_pattern
+
+# Cache key prefix of the admin category list (see api/v1/admin.py)
+CATEGORY_LIST_CACHE_PREFIX = "admin:categories"
 
 
 class CategoryService:
     """Service class for category operations."""
     
+    __slots__ = ("db",)
+    
     def __init__(self, db: Session):
         """Initialize with database session."""
         self.db = db
     
     # ============== Helper Methods ==============
     
+    def _invalidate_list_cache(self):
+        """Drop cached category lists after a write has committed."""
+        delete_cache_pattern(f"{CATEGORY_LIST_CACHE_PREFIX}:*")
+    
     def _generate_slug(self, name: str, parent_id: Optional[uuid.UUID] = None) -> str:
         """
         Generate unique slug from category name.
@@ -166,6 +176,7 @@ class CategoryService:
         
         self.db.add(category)
         self.db.commit()
+        self._invalidate_list_cache()
         self.db.refresh(category)
         
         return category
@@ -187,6 +198,7 @@ class CategoryService:
         
         category.image_url = image_url
         self.db.commit()
+        self._invalidate_list_cache()
         self.db.refresh(category)
         
         return category
@@ -251,6 +263,7 @@ class CategoryService:
             setattr(category, field, value)
         
         self.db.commit()
+        self._invalidate_list_cache()
         self.db.refresh(category)
         
         return category
@@ -273,6 +286,7 @@ class CategoryService:
         # Deactivate category and all descendants
         self._deactivate_tree(category)
         self.db.commit()
+        self._invalidate_list_cache()
         
         return True
     
@@ -37,6 +37,8 @@ def generate_random_password(length: int = 12) -> str:
 class DeliveryPartnerService:
     """Service for delivery partner operations."""
     
+    __slots__ = ("db",)
+    
     def __init__(self, db: Session):
         self.db = db
     
@@ -12,7 +12,7 @@ from decimal import Decimal
 from typing import Optional, List, Tuple
 
 from sqlalchemy import and_, func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 from fastapi import HTTPException, status
 
 logger = logging.getLogger(__name__)
@@ -39,6 +39,8 @@ RESERVATION_TIMEOUT_MINUTES = 10
 class OrderService:
     """Service for order operations."""
     
+    __slots__ = ("db",)
+    
     def __init__(self, db: Session):
         self.db = db
     
@@ -1122,10 +1124,12 @@ class OrderService:
         size: int = 20,
     ) -> Tuple[List[Order], int]:
         """Get all orders with filters (admin view)."""
+        # Load exactly what OrderResponse reads. Items come from one
+        # selectin query for the page: joining a collection would multiply
+        # rows and force the LIMIT into a subquery
         query = self.db.query(Order).options(
-            joinedload(Order.buyer),
             joinedload(Order.vendor),
-            joinedload(Order.items).joinedload(OrderItem.sell_unit),
+            selectinload(Order.items),
         )
         
         if status:
@@ -4,10 +4,11 @@ Business logic for attribute segment management
 """
 
 import uuid
-from typing import Optional, List
+from collections import defaultdict
+from typing import Dict, Optional, List
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import case, func
 
 from app.models.category import Category
 from app.models.attribute_segment import AttributeSegment
@@ -17,7 +18,10 @@ from app.schemas.attribute import (
     AttributeSegmentUpdate,
     AttributeSegmentResponse,
     AttributeSegmentWithAttributes,
+    CategoryAttributeResponse,
+    SegmentOrderItem,
 )
+from app.schemas.base import construct_from_orm
 
 
 class SegmentService:
@@ -124,6 +128,29 @@ class SegmentService:
         
         return query.order_by(AttributeSegment.display_order).all()
     
+    def get_attribute_counts(self, segment_ids: List[uuid.UUID]) -> Dict[uuid.UUID, int]:
+        """
+        Count the active attributes of segments in one grouped query.
+        
+        Args:
+            segment_ids: Segment UUIDs
+            
+        Returns:
+            Attribute count by segment ID (segments without any are omitted)
+        """
+        if not segment_ids:
+            return {}
+        
+        return dict(
+            self.db.query(CategoryAttribute.segment_id, func.count(CategoryAttribute.id))
+            .filter(
+                CategoryAttribute.segment_id.in_(segment_ids),
+                CategoryAttribute.is_active == True
+            )
+            .group_by(CategoryAttribute.segment_id)
+            .all()
+        )
+    
     def get_segments_with_attributes(
         self,
         category_id: uuid.UUID,
@@ -141,54 +168,36 @@ class SegmentService:
         """
         segments = self.get_segments_by_category(category_id, include_inactive)
         
-        result = []
-        for segment in segments:
-            # Get attributes for this segment
+        # Get the attributes of all segments at once
+        attributes_by_segment = defaultdict(list)
+        if segments:
             attributes_query = self.db.query(CategoryAttribute).filter(
-                CategoryAttribute.segment_id == segment.id,
+                CategoryAttribute.segment_id.in_([segment.id for segment in segments]),
                 CategoryAttribute.is_active == True
             ).order_by(CategoryAttribute.display_order)
             
-            attributes = attributes_query.all()
+            for attr in attributes_query.all():
+                attributes_by_segment[attr.segment_id].append(attr)
+        
+        result = []
+        for segment in segments:
+            attributes = attributes_by_segment[segment.id]
             
             # Build response
-            segment_data = AttributeSegmentWithAttributes(
-                id=segment.id,
-                category_id=segment.category_id,
-                name=segment.name,
-                description=segment.description,
-                icon=segment.icon,
-                display_order=segment.display_order,
-                is_collapsible=segment.is_collapsible,
-                is_active=segment.is_active,
-                created_at=segment.created_at,
-                updated_at=segment.updated_at,
+            segment_data = construct_from_orm(
+                AttributeSegmentWithAttributes,
+                segment,
                 attribute_count=len(attributes),
                 attributes=[
-                    CategoryAttributeResponse(
-                        id=attr.id,
-                        category_id=attr.category_id,
-                        segment_id=attr.segment_id,
-                        name=attr.name,
-                        slug=attr.slug,
-                        description=attr.description,
-                        attribute_type=attr.attribute_type,
-                        options=attr.options,
-                        unit=attr.unit,
-                        is_required=attr.is_required,
-                        is_inherited=attr.is_inherited,
-                        is_filterable=attr.is_filterable,
-                        is_searchable=attr.is_searchable,
-                        display_order=attr.display_order,
-                        show_in_listing=attr.show_in_listing,
-                        show_in_details=attr.show_in_details,
-                        is_active=attr.is_active,
-                        created_at=attr.created_at,
-                        updated_at=attr.updated_at,
+                    construct_from_orm(
+                        CategoryAttributeResponse,
+                        attr,
+                        category_name=None,
                         segment_name=segment.name,
+                        is_own=True,
                     )
                     for attr in attributes
-                ]
+                ],
             )
             result.append(segment_data)
         
@@ -262,26 +271,33 @@ class SegmentService:
     def reorder_segments(
         self,
         category_id: uuid.UUID,
-        segment_orders: List[dict]
+        segment_orders: List[SegmentOrderItem]
     ) -> bool:
         """
         Reorder segments for a category.
         
         Args:
             category_id: Category UUID
-            segment_orders: List of {segment_id: UUID, display_order: int}
+            segment_orders: New display order of each segment
             
         Returns:
             True if successful
         """
-        for item in segment_orders:
-            segment_id = uuid.UUID(item["segment_id"])
-            display_order = item["display_order"]
-            
+        display_orders = {item.segment_id: item.display_order for item in segment_orders}
+        
+        # One UPDATE sets every segment's order through a CASE on its id;
+        # segments of other categories are left alone
+        if display_orders:
             self.db.query(AttributeSegment).filter(
-                AttributeSegment.id == segment_id,
+                AttributeSegment.id.in_(display_orders),
                 AttributeSegment.category_id == category_id
-            ).update({"display_order": display_order})
+            ).update(
+                {"display_order": case(*(
+                    (AttributeSegment.id == segment_id, display_order)
+                    for segment_id, display_order in display_orders.items()
+                ))},
+                synchronize_session=False,
+            )
         
         self.db.commit()
         
@@ -17,6 +17,8 @@ from app.utils.geo import calculate_distance, is_within_radius, calculate_delive
 class ServiceZoneService:
     """Service class for service zone operations."""
     
+    __slots__ = ("db",)
+    
     def __init__(self, db: Session):
         """Initialize with database session."""
         self.db = db
@@ -23,6 +23,8 @@ from app.utils.geo import calculate_distance, is_within_radius
 class VendorService:
     """Service class for vendor operations."""
     
+    __slots__ = ("db",)
+    
     def __init__(self, db: Session):
         """Initialize with database session."""
         self.db = db
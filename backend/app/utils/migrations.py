@@ -0,0 +1,308 @@
+"""
+Migration Utility
+Helpers shared by Alembic revisions that touch large, live tables
+"""
+
+import os
+import time
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.exc import OperationalError
+
+logger = logging.getLogger(__name__)
+
+# Rows touched per batch by data backfills (override with ALEMBIC_BATCH_SIZE)
+DEFAULT_BATCH_SIZE = 10000
+
+# Rows sent per executemany() call by bulk inserts
+DEFAULT_INSERT_CHUNK_SIZE = 1000
+
+# Guards for DDL on live tables (override with ALEMBIC_LOCK_TIMEOUT and
+# ALEMBIC_STATEMENT_TIMEOUT)
+DEFAULT_LOCK_TIMEOUT = "5s"
+DEFAULT_STATEMENT_TIMEOUT = "30min"
+LOCK_RETRY_ATTEMPTS = 5
+LOCK_RETRY_DELAY_SECONDS = 1.0
+
+
+def set_migration_timeouts() -> None:
+    """
+    Bound how long a migration waits for locks and runs each statement.
+
+    Without a lock_timeout, an ALTER queued behind a long-running query
+    waits indefinitely while every later query on the table queues behind
+    the ALTER. Call at the start of upgrade() in revisions that alter live
+    tables. The settings are transaction-local: they end when the revision
+    commits, and an autocommit_block() commits too, so CONCURRENTLY builds
+    and batched backfills run without them. Call again after an
+    autocommit_block() that is followed by more DDL on live tables.
+    """
+    timeouts = {
+        "lock_timeout": os.getenv("ALEMBIC_LOCK_TIMEOUT", DEFAULT_LOCK_TIMEOUT),
+        "statement_timeout": os.getenv("ALEMBIC_STATEMENT_TIMEOUT", DEFAULT_STATEMENT_TIMEOUT),
+    }
+    for name, value in timeouts.items():
+        op.execute(
+            sa.text("SELECT set_config(:name, :value, true)").bindparams(name=name, value=value)
+        )
+
+
+def with_lock_retry(
+    operation: Callable[[], None],
+    attempts: int = LOCK_RETRY_ATTEMPTS,
+    delay: float = LOCK_RETRY_DELAY_SECONDS,
+) -> None:
+    """
+    Run DDL in a savepoint, retrying with exponential backoff on timeouts.
+
+    A lock timeout only rolls back to the savepoint, so a transient blocker
+    delays the migration instead of aborting the whole deploy.
+    """
+    bind = op.get_bind()
+
+    for attempt in range(1, attempts + 1):
+        try:
+            with bind.begin_nested():
+                operation()
+            return
+        except OperationalError as e:
+            if attempt == attempts:
+                raise
+            wait = delay * 2 ** (attempt - 1)
+            logger.warning(
+                f"DDL attempt {attempt}/{attempts} timed out ({e.orig}); retrying in {wait}s"
+            )
+            time.sleep(wait)
+
+
+def get_batch_size() -> int:
+    """Get the backfill batch size from the environment."""
+    return int(os.getenv("ALEMBIC_BATCH_SIZE", DEFAULT_BATCH_SIZE))
+
+
+def run_batched_update(statement: str, batch_size: Optional[int] = None) -> int:
+    """
+    Repeat a batched UPDATE until it stops matching rows.
+
+    The statement must select its target rows with ``LIMIT :batch_size``
+    (typically a ``ctid`` CTE) and must exclude rows it already updated,
+    otherwise the loop never terminates. Call it inside
+    ``op.get_context().autocommit_block()`` so every batch commits on its
+    own instead of holding row locks and WAL for the whole table.
+
+    Returns:
+        Total number of rows updated
+    """
+    bind = op.get_bind()
+    batch_size = batch_size or get_batch_size()
+    total = 0
+
+    while True:
+        result = bind.execute(sa.text(statement), {"batch_size": batch_size})
+        if not result.rowcount:
+            break
+        total += result.rowcount
+
+    logger.info(f"Batched update touched {total} rows")
+    return total
+
+
+
+def bulk_execute(
+    statement: Any,
+    rows: List[Dict[str, Any]],
+    chunk_size: int = DEFAULT_INSERT_CHUNK_SIZE,
+) -> int:
+    """
+    Execute a Core statement for many parameter sets in chunks.
+
+    Use this for data backfills instead of calling ``op.execute`` once per
+    row: each chunk is a single executemany(), which SQLAlchemy's psycopg2
+    dialect sends as multi-row ``INSERT ... VALUES`` batches.
+
+    Example:
+        bulk_execute(sa.table("segments", sa.column("id"), ...).insert(), rows)
+
+    Returns:
+        Number of rows sent
+    """
+    bind = op.get_bind()
+
+    for start in range(0, len(rows), chunk_size):
+        bind.execute(statement, rows[start:start + chunk_size])
+
+    logger.info(f"Bulk execute sent {len(rows)} rows")
+    return len(rows)
+
+def swap_column_types(
+    table: str,
+    columns: Dict[str, str],
+    indexes: Optional[Dict[str, str]] = None,
+    using: Optional[Dict[str, str]] = None,
+    defaults: Optional[Dict[str, str]] = None,
+) -> None:
+    """
+    Change column types without rewriting the table under ACCESS EXCLUSIVE.
+
+    Each column in ``columns`` (name -> new SQL type) gets a shadow
+    ``<name>_new`` column that a trigger keeps in sync with live writes while
+    existing rows are backfilled in batches. Values are cast to the new type
+    unless ``using`` gives a conversion for the column, written in terms of
+    ``{column}`` (e.g. ``"round({column} * 100)::bigint"``). The columns are
+    then swapped in one short transaction, keeping each original column's
+    nullability: NOT NULL is proven by a CHECK constraint validated
+    beforehand, so setting it does not scan the table under the swap's lock.
+    ``defaults`` (column -> SQL expression) are set on the swapped columns,
+    since the old columns' defaults are dropped with them. Dropping the old
+    columns drops their indexes too, so ``indexes`` (index name -> column)
+    are rebuilt CONCURRENTLY afterwards.
+
+    Requires one transaction per migration so the swap commits on its own.
+    """
+    bind = op.get_bind()
+    using = using or {}
+    defaults = defaults or {}
+    sync_fn = f"{table}_swap_sync"
+
+    def convert(name: str, source: str) -> str:
+        if name in using:
+            return using[name].format(column=source)
+        return f"{source}::{columns[name]}"
+
+    add_columns = ", ".join(
+        f"ADD COLUMN {name}_new {type_}" for name, type_ in columns.items()
+    )
+    assignments = "; ".join(
+        f"NEW.{name}_new := {convert(name, f'NEW.{name}')}" for name in columns
+    )
+    backfill = ", ".join(
+        f"{name}_new = {convert(name, name)}" for name in columns
+    )
+    # A NULL source casts to NULL, so rows are pending only while a non-NULL
+    # value has not been copied yet; otherwise the backfill never ends
+    pending = " OR ".join(
+        f"({name}_new IS NULL AND {name} IS NOT NULL)" for name in columns
+    )
+    not_null_columns = bind.execute(
+        sa.text("""
+            SELECT attname FROM pg_attribute
+            WHERE attrelid = CAST(:table AS regclass)
+            AND attname = ANY(:names)
+            AND attnotnull
+        """),
+        {"table": table, "names": list(columns)},
+    ).scalars().all()
+
+    # Step 1: Shadow columns plus a trigger covering writes during the backfill
+    def add_shadow_columns() -> None:
+        op.execute(sa.text(f"ALTER TABLE {table} {add_columns}"))
+        op.execute(sa.text(f"""
+            CREATE FUNCTION {sync_fn}() RETURNS trigger AS $$
+            BEGIN
+                {assignments};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """))
+        op.execute(sa.text(f"""
+            CREATE TRIGGER {sync_fn} BEFORE INSERT OR UPDATE ON {table}
+            FOR EACH ROW EXECUTE FUNCTION {sync_fn}()
+        """))
+
+    with_lock_retry(add_shadow_columns)
+
+    # Step 2: Backfill existing rows, one committed batch at a time
+    with op.get_context().autocommit_block():
+        run_batched_update(f"""
+            WITH batch AS (
+                SELECT ctid FROM {table}
+                WHERE {pending}
+                LIMIT :batch_size
+            )
+            UPDATE {table}
+            SET {backfill}
+            FROM batch
+            WHERE {table}.ctid = batch.ctid
+        """)
+
+    # Step 3: Prove the shadows of NOT NULL columns hold no NULLs. Adding
+    # the CHECK as NOT VALID is instant; validating only takes a SHARE
+    # UPDATE EXCLUSIVE lock, so the table stays writable meanwhile.
+    if not_null_columns:
+        set_migration_timeouts()
+        with_lock_retry(lambda: op.execute(sa.text(
+            f"ALTER TABLE {table} " + ", ".join(
+                f"ADD CONSTRAINT {name}_new_not_null CHECK ({name}_new IS NOT NULL) NOT VALID"
+                for name in not_null_columns
+            )
+        )))
+        with op.get_context().autocommit_block():
+            for name in not_null_columns:
+                op.execute(sa.text(
+                    f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}_new_not_null"
+                ))
+
+    # Step 4: Swap the columns; the autocommit blocks above ended the
+    # transaction the timeouts were set in
+    set_migration_timeouts()
+
+    def swap_columns() -> None:
+        op.execute(sa.text(f"DROP TRIGGER {sync_fn} ON {table}"))
+        op.execute(sa.text(f"DROP FUNCTION {sync_fn}()"))
+        # One ALTER drops the old columns, sets NOT NULL, which the
+        # validated CHECKs let Postgres do without a scan, and sets the
+        # defaults, which only touches the catalog. RENAME cannot be
+        # combined with other subcommands, so it follows per column in the
+        # same transaction.
+        op.execute(sa.text(f"ALTER TABLE {table} " + ", ".join(
+            [f"DROP COLUMN {name}" for name in columns]
+            + [f"ALTER COLUMN {name}_new SET NOT NULL" for name in not_null_columns]
+            + [f"ALTER COLUMN {name}_new SET DEFAULT {default}" for name, default in defaults.items()]
+        )))
+        for name in columns:
+            op.execute(sa.text(f"ALTER TABLE {table} RENAME COLUMN {name}_new TO {name}"))
+        if not_null_columns:
+            op.execute(sa.text(f"ALTER TABLE {table} " + ", ".join(
+                f"DROP CONSTRAINT {name}_new_not_null" for name in not_null_columns
+            )))
+
+    with_lock_retry(swap_columns)
+
+    # Step 5: Rebuild indexes dropped along with the old columns
+    if indexes:
+        with op.get_context().autocommit_block():
+            for index_name, column in indexes.items():
+                op.execute(sa.text(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} ON {table} ({column})"
+                ))
+
+
+def rebuild_index_concurrently(name: str, table: str, columns: List[Any], **kwargs: Any) -> None:
+    """
+    Replace an index with a new definition under the same name.
+
+    The new definition is built CONCURRENTLY as ``<name>_new``, the old
+    index is dropped CONCURRENTLY and the new one renamed into place, so the
+    table stays writable and indexed throughout. Each step is idempotent, so
+    a revision interrupted midway can simply be re-run. Call it outside
+    ``autocommit_block()``; extra keyword arguments go to
+    ``op.create_index`` (``postgresql_where``, ``postgresql_include``, ...).
+    """
+    new_name = f"{name}_new"
+    with op.get_context().autocommit_block():
+        op.create_index(
+            new_name, table, columns, unique=False,
+            postgresql_concurrently=True, if_not_exists=True, **kwargs,
+        )
+        op.drop_index(
+            name, table_name=table,
+            postgresql_concurrently=True, if_exists=True,
+        )
+
+    # The rename only takes a brief lock, but still waits behind blockers;
+    # the timeouts are set here as the autocommit block ended the transaction
+    set_migration_timeouts()
+    with_lock_retry(lambda: op.execute(sa.text(f"ALTER INDEX {new_name} RENAME TO {name}")))
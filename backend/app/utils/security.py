@@ -3,11 +3,16 @@ Security Utilities
 Password hashing and JWT token management
 """
 
+from calendar import timegm
 from datetime import datetime, timedelta
 from typing import Any, Optional
+import json
+import time
 import uuid
 
 import jwt
+import orjson
+from jwt.algorithms import HMACAlgorithm, get_default_algorithms
 from passlib.context import CryptContext
 
 from app.config import settings
@@ -63,6 +68,57 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 
 # ============== JWT Functions ==============
 
+class _PreparedKeyHMAC(HMACAlgorithm):
+    """HMAC algorithm that skips key preparation for a pre-validated key."""
+
+    def prepare_key(self, key: bytes) -> bytes:
+        return key
+
+
+# Tokens are signed with the shared secret, so only the HMAC algorithms are
+# accepted: labelling HMAC-signed tokens RS256 or ES256 would be a forgery
+# vector, not asymmetric signing.
+_HMAC_ALGORITHMS = ("HS256", "HS384", "HS512")
+
+if settings.jwt_algorithm not in _HMAC_ALGORITHMS:
+    raise ValueError(
+        f"jwt_algorithm must be one of {', '.join(_HMAC_ALGORITHMS)}, "
+        f"got {settings.jwt_algorithm!r}"
+    )
+
+# The signing key is validated and encoded to bytes once at import, and
+# tokens are signed and verified by a dedicated PyJWS that only knows the
+# configured algorithm, so neither path does per-call key setup.
+_JWT_ALGORITHMS = [settings.jwt_algorithm]
+_jwt_algorithm = get_default_algorithms()[settings.jwt_algorithm]
+_jwt_key: bytes = _jwt_algorithm.prepare_key(settings.jwt_secret_key)
+
+_jws = jwt.PyJWS(algorithms=[])
+_jws.register_algorithm(
+    settings.jwt_algorithm, _PreparedKeyHMAC(_jwt_algorithm.hash_alg)
+)
+
+
+def _encode_token(payload: dict[str, Any]) -> str:
+    """
+    Sign a token payload with the prepared key.
+    
+    Goes through the dedicated PyJWS instance so signing, like decoding,
+    reuses the key bytes prepared at import instead of preparing them again.
+    """
+    # Like jwt.encode, leave the caller's dict untouched
+    payload = dict(payload)
+    for claim in ("exp", "iat"):
+        if isinstance(payload.get(claim), datetime):
+            payload[claim] = timegm(payload[claim].utctimetuple())
+    
+    return _jws.encode(
+        json.dumps(payload, separators=(",", ":")).encode(),
+        _jwt_key,
+        algorithm=settings.jwt_algorithm,
+    )
+
+
 def create_access_token(
     user_id: uuid.UUID,
     role: UserRole,
@@ -94,11 +150,7 @@ def create_access_token(
         "type": "access",
     }
     
-    return jwt.encode(
-        payload,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
-    )
+    return _encode_token(payload)
 
 
 def create_refresh_token(
@@ -132,11 +184,7 @@ def create_refresh_token(
         "type": "refresh",
     }
     
-    return jwt.encode(
-        payload,
-        settings.jwt_secret_key,
-        algorithm=settings.jwt_algorithm,
-    )
+    return _encode_token(payload)
 
 
 def decode_token(token: str) -> dict[str, Any]:
@@ -153,11 +201,25 @@ def decode_token(token: str) -> dict[str, Any]:
         jwt.ExpiredSignatureError: If token has expired
         jwt.InvalidTokenError: If token is invalid
     """
-    return jwt.decode(
-        token,
-        settings.jwt_secret_key,
-        algorithms=[settings.jwt_algorithm],
-    )
+    decoded = _jws.decode_complete(token, key=_jwt_key, algorithms=_JWT_ALGORITHMS)
+    try:
+        payload = orjson.loads(decoded["payload"])
+    except ValueError as e:
+        raise jwt.DecodeError(f"Invalid payload string: {e}")
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+    
+    # Our tokens carry no aud/iss/nbf claims and iat is informational, so
+    # only expiry is checked once the signature has been verified
+    if "exp" in payload:
+        try:
+            expires_at = int(payload["exp"])
+        except (TypeError, ValueError):
+            raise jwt.DecodeError("Expiration Time claim (exp) must be an integer.")
+        if expires_at <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    
+    return payload
 
 
 def get_token_expiry(token_type: str = "access") -> datetime:
@@ -20,8 +20,36 @@ ALLOWED_IMAGE_TYPES = {
     "image/gif": [".gif"],
 }
 
+# Content types the image upload routes accept before reading the body
+ALLOWED_IMAGE_CONTENT_TYPES = frozenset({"image/jpeg", "image/png", "image/webp"})
+
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB (increased for high-res screenshots)
 
+# Bytes read per call when buffering an upload
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def read_upload(file, max_size: int = MAX_FILE_SIZE) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    Read an uploaded file in chunks, giving up as soon as it exceeds max_size.
+    
+    Args:
+        file: FastAPI UploadFile
+        max_size: Largest accepted size in bytes
+        
+    Returns:
+        Tuple of (content, error_message)
+    """
+    chunks = []
+    size = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        size += len(chunk)
+        if size > max_size:
+            return None, "File too large"
+        chunks.append(chunk)
+    
+    return b"".join(chunks), None
+
 
 def validate_image(content: bytes, content_type: str):
 
@@ -13,7 +13,7 @@ from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.database import Base, get_db
+from app.database import Base, get_db, get_session_factory
 from app.models.enums import UserRole, StockUnit
 from app.utils.security import hash_password, create_access_token
 
@@ -62,6 +62,7 @@ def client(db) -> Generator:
             pass
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
     
     with TestClient(app) as test_client:
         yield test_client
@@ -125,6 +126,12 @@ def test_user(db):
     return user
 
 
+@pytest.fixture
+def buyer_token(test_user):
+    """Create buyer access token."""
+    return create_access_token(test_user.id, test_user.role)
+
+
 @pytest.fixture
 def test_admin(db):
     """Create a test admin user."""
@@ -355,3 +362,31 @@ def test_public_product(db, test_vendor, test_category):
     db.refresh(product)
     
     return {"id": str(product.id), "name": product.name}
+
+
+# ============== Coupon Fixtures ==============
+
+@pytest.fixture
+def test_coupons(db):
+    """Create five coupons, one minute apart, oldest first."""
+    from datetime import datetime, timedelta
+    from app.models import Coupon
+    from app.models.enums import DiscountType
+    
+    created_at = datetime(2024, 1, 1)
+    coupons = []
+    for i in range(5):
+        coupon = Coupon(
+            id=uuid.uuid4(),
+            code=f"SAVE{i}",
+            discount_type=DiscountType.FLAT,
+            discount_value=Decimal("10"),
+            is_active=i % 2 == 0,
+            created_at=created_at + timedelta(minutes=i),
+        )
+        db.add(coupon)
+        coupons.append(coupon)
+    
+    db.commit()
+    
+    return [coupon.code for coupon in coupons]
@@ -0,0 +1,140 @@
+"""
+Address Module Tests
+Tests for buyer delivery address management
+"""
+
+import pytest
+from fastapi import status
+from sqlalchemy.exc import IntegrityError
+
+
+def _address_data(label: str, is_default: bool = False) -> dict:
+    return {
+        "label": label,
+        "recipient_name": "Test Buyer",
+        "recipient_phone": "9876543210",
+        "address_line_1": f"{label} Street 1",
+        "city": "Pune",
+        "state": "Maharashtra",
+        "pincode": "411001",
+        "is_default": is_default,
+    }
+
+
+def _create_address(client, token, label: str, is_default: bool = False) -> dict:
+    response = client.post(
+        "/api/v1/addresses",
+        headers={"Authorization": f"Bearer {token}"},
+        json=_address_data(label, is_default),
+    )
+    assert response.status_code == status.HTTP_201_CREATED
+    return response.json()
+
+
+def _defaults(client, token) -> list:
+    response = client.get(
+        "/api/v1/addresses",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    return [item["label"] for item in response.json()["items"] if item["is_default"]]
+
+
+class TestDefaultAddress:
+    """Tests for switching the default delivery address."""
+    
+    def test_first_address_is_default(self, client, buyer_token):
+        """Test that a buyer's first address becomes the default."""
+        address = _create_address(client, buyer_token, "Home")
+        
+        assert address["is_default"] is True
+    
+    def test_set_default_address(self, client, buyer_token):
+        """Test that setting a default clears the previous one."""
+        _create_address(client, buyer_token, "Home")
+        office = _create_address(client, buyer_token, "Office")
+        assert office["is_default"] is False
+        
+        response = client.post(
+            f"/api/v1/addresses/{office['id']}/default",
+            headers={"Authorization": f"Bearer {buyer_token}"},
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["is_default"] is True
+        assert _defaults(client, buyer_token) == ["Office"]
+    
+    def test_create_default_address(self, client, buyer_token):
+        """Test that creating a default address clears the previous one."""
+        _create_address(client, buyer_token, "Home")
+        
+        office = _create_address(client, buyer_token, "Office", is_default=True)
+        
+        assert office["is_default"] is True
+        assert _defaults(client, buyer_token) == ["Office"]
+    
+    def test_set_default_address_not_found(self, client, buyer_token):
+        """Test setting a missing address as default."""
+        response = client.post(
+            "/api/v1/addresses/00000000-0000-0000-0000-000000000000/default",
+            headers={"Authorization": f"Bearer {buyer_token}"},
+        )
+        
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+    
+    def test_default_conflict_returns_409(self, client, buyer_token, db, monkeypatch):
+        """Test that a default change losing every retry returns 409."""
+        home = _create_address(client, buyer_token, "Home")
+        commits = []
+        
+        def conflicting_commit():
+            commits.append(1)
+            raise IntegrityError("UPDATE delivery_addresses", {}, Exception("conflict"))
+        
+        monkeypatch.setattr(db, "commit", conflicting_commit)
+        headers = {"Authorization": f"Bearer {buyer_token}"}
+        
+        response = client.post(f"/api/v1/addresses/{home['id']}/default", headers=headers)
+        assert response.status_code == status.HTTP_409_CONFLICT
+        
+        response = client.post(
+            "/api/v1/addresses",
+            headers=headers,
+            json=_address_data("Office", is_default=True),
+        )
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert len(commits) == 6
+
+
+class TestAddressList:
+    """Tests for listing delivery addresses."""
+    
+    def test_list_addresses_paginated(self, client, buyer_token):
+        """Test paging through addresses with the total."""
+        for label in ("Home", "Office", "Gym"):
+            _create_address(client, buyer_token, label)
+        headers = {"Authorization": f"Bearer {buyer_token}"}
+        
+        response = client.get("/api/v1/addresses?page=2&size=2", headers=headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert len(data["items"]) == 1
+        assert data["total"] == 3
+        assert data["page"] == 2
+        assert data["size"] == 2
+        assert data["pages"] == 2
+    
+    def test_list_addresses_past_last_page(self, client, buyer_token):
+        """Test that a page past the end still reports the total."""
+        _create_address(client, buyer_token, "Home")
+        
+        response = client.get(
+            "/api/v1/addresses?page=3&size=2",
+            headers={"Authorization": f"Bearer {buyer_token}"},
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["items"] == []
+        assert data["total"] == 1
+        assert data["pages"] == 1
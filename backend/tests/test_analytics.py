@@ -0,0 +1,67 @@
+"""
+Analytics Module Tests
+Tests for admin analytics reports
+"""
+
+import orjson
+import pytest
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+from fastapi import status
+
+from app.models.user import User
+from app.services.analytics_service import AnalyticsService
+
+
+class TestRevenueReportStream:
+    """Tests for the streamed revenue report."""
+    
+    def test_stream_revenue_report(self, client, admin_token, monkeypatch):
+        """Test streaming the revenue report as NDJSON."""
+        user_counts = []
+        
+        def fake_rows(self, start_date, end_date, group_by):
+            # The report query uses ROLLUP, which SQLite lacks; querying the
+            # stream's own session still shows it is bound to the test database
+            user_counts.append(self.db.query(User).count())
+            return iter([
+                SimpleNamespace(
+                    period=date(2024, 1, 1), is_total=0, order_count=2,
+                    revenue=Decimal("150.00"), avg_order_value=Decimal("75.00"),
+                ),
+                SimpleNamespace(
+                    period=date(2024, 1, 2), is_total=0, order_count=1,
+                    revenue=Decimal("50.00"), avg_order_value=Decimal("50.00"),
+                ),
+                SimpleNamespace(
+                    period=None, is_total=1, order_count=3,
+                    revenue=Decimal("200.00"), avg_order_value=Decimal("66.67"),
+                ),
+            ])
+        
+        monkeypatch.setattr(AnalyticsService, "_revenue_report_rows", fake_rows)
+        
+        response = client.get(
+            "/api/v1/admin/analytics/revenue/stream",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [orjson.loads(line) for line in response.text.splitlines()]
+        assert lines == [
+            {"period": "2024-01-01", "order_count": 2, "revenue": 150.0, "avg_order_value": 75.0},
+            {"period": "2024-01-02", "order_count": 1, "revenue": 50.0, "avg_order_value": 50.0},
+            {"total_revenue": 200.0, "total_orders": 3},
+        ]
+        assert user_counts == [1]
+    
+    def test_stream_revenue_report_requires_admin(self, client, verified_vendor_token):
+        """Test that non-admins cannot stream the revenue report."""
+        response = client.get(
+            "/api/v1/admin/analytics/revenue/stream",
+            headers={"Authorization": f"Bearer {verified_vendor_token}"},
+        )
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
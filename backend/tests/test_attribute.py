@@ -0,0 +1,42 @@
+"""
+Attribute Module Tests
+Tests for category attribute and segment management
+"""
+
+import pytest
+from fastapi import status
+
+
+class TestAdminAttributeManagement:
+    """Tests for admin attribute and segment management."""
+    
+    def test_create_attribute(self, client, admin_token, test_category):
+        """Test creating a category attribute."""
+        response = client.post(
+            f"/api/v1/admin/categories/{test_category['id']}/attributes",
+            headers={"Authorization": f"Bearer {admin_token}"},
+            json={
+                "category_id": test_category["id"],
+                "name": "Weight",
+                "attribute_type": "number",
+                "unit": "kg",
+            },
+        )
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["slug"] == "weight"
+        assert data["category_name"] == "Fruits"
+    
+    def test_create_segment(self, client, admin_token, test_category):
+        """Test creating an attribute segment."""
+        response = client.post(
+            f"/api/v1/admin/categories/{test_category['id']}/segments",
+            headers={"Authorization": f"Bearer {admin_token}"},
+            json={"category_id": test_category["id"], "name": "Specifications"},
+        )
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        data = response.json()
+        assert data["name"] == "Specifications"
+        assert data["attribute_count"] == 0
@@ -242,3 +242,110 @@ class TestPasswordChange:
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
+
+
+class TestAccessTokenCache:
+    """Tests for the decoded access-token cache."""
+    
+    def test_repeated_token_is_decoded_once(self, client, test_user, monkeypatch):
+        """Test that a replayed token skips signature verification."""
+        from app.api import deps
+        from app.utils.security import create_access_token
+        
+        token = create_access_token(test_user.id, test_user.role)
+        headers = {"Authorization": f"Bearer {token}"}
+        decode_calls = []
+        real_decode = deps.decode_token
+        
+        def counting_decode(token):
+            decode_calls.append(token)
+            return real_decode(token)
+        
+        monkeypatch.setattr(deps, "decode_token", counting_decode)
+        
+        for _ in range(3):
+            response = client.get("/api/v1/auth/me", headers=headers)
+            assert response.status_code == status.HTTP_200_OK
+        
+        assert decode_calls == [token]
+    
+    def test_expired_cached_token_rejected(self, client, test_user, monkeypatch):
+        """Test that a cached payload is not served past the token expiry."""
+        from datetime import timedelta
+        from app.api import deps
+        from app.utils.security import create_access_token
+        
+        token = create_access_token(
+            test_user.id, test_user.role, expires_delta=timedelta(seconds=10)
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        
+        assert client.get("/api/v1/auth/me", headers=headers).status_code == status.HTTP_200_OK
+        
+        # Move the clock past the token's expiry but within the cache TTL
+        now = deps.time.time()
+        monkeypatch.setattr(deps.time, "time", lambda: now + 20)
+        
+        response = client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+class TestCurrentUserCache:
+    """Tests for the authenticated user snapshot cache."""
+    
+    def test_cached_user_skips_query(self, client, test_user, db):
+        """Test that repeated requests reuse the cached user snapshot."""
+        from sqlalchemy import event
+        from app.utils.security import create_access_token
+        
+        token = create_access_token(test_user.id, test_user.role)
+        headers = {"Authorization": f"Bearer {token}"}
+        client.get("/api/v1/auth/me", headers=headers)
+        
+        statements = []
+        
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+        
+        event.listen(db.get_bind(), "before_cursor_execute", record)
+        try:
+            response = client.get("/api/v1/auth/me", headers=headers)
+        finally:
+            event.remove(db.get_bind(), "before_cursor_execute", record)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["email"] == test_user.email
+        assert not [s for s in statements if "FROM users" in s]
+    
+    def test_deactivated_user_rejected(self, client, test_user, db):
+        """Test that updating a user drops its cached snapshot."""
+        from app.utils.security import create_access_token
+        
+        token = create_access_token(test_user.id, test_user.role)
+        headers = {"Authorization": f"Bearer {token}"}
+        assert client.get("/api/v1/auth/me", headers=headers).status_code == status.HTTP_200_OK
+        
+        test_user.is_active = False
+        db.commit()
+        
+        response = client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+    
+    def test_user_recached_before_commit_is_evicted(self, client, test_user, db):
+        """Test that a snapshot cached between flush and commit is dropped."""
+        from app.api import deps
+        from app.utils.security import create_access_token
+        
+        token = create_access_token(test_user.id, test_user.role)
+        headers = {"Authorization": f"Bearer {token}"}
+        assert client.get("/api/v1/auth/me", headers=headers).status_code == status.HTTP_200_OK
+        stale = deps._user_cache[test_user.id]
+        
+        test_user.is_active = False
+        db.flush()
+        # A concurrent request still reads the committed row and caches it
+        deps._user_cache[test_user.id] = stale
+        db.commit()
+        
+        response = client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
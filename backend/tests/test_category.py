@@ -112,6 +112,22 @@ class TestAdminCategoryManagement:
         public_response = client.get(f"/api/v1/categories/{test_category['id']}")
         assert public_response.status_code == status.HTTP_404_NOT_FOUND
     
+    def test_list_categories_not_modified(self, client, admin_token, test_category):
+        """Test that a matching If-None-Match gets 304 from the admin list."""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = client.get("/api/v1/admin/categories", headers=headers)
+        
+        assert response.status_code == status.HTTP_200_OK
+        etag = response.headers["etag"]
+        
+        response = client.get(
+            "/api/v1/admin/categories",
+            headers={**headers, "If-None-Match": etag},
+        )
+        
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["etag"] == etag
+    
     def test_non_admin_cannot_create(self, client, verified_vendor_token):
         """Test that non-admin cannot create categories."""
         response = client.post(
@@ -0,0 +1,90 @@
+"""
+Coupon Module Tests
+Tests for admin coupon management
+"""
+
+import pytest
+from fastapi import status
+
+
+class TestAdminCouponList:
+    """Tests for the admin coupon list pagination."""
+    
+    def test_list_coupons_by_page(self, client, admin_token, test_coupons):
+        """Test listing coupons by page number, newest first."""
+        response = client.get(
+            "/api/v1/admin/coupons?page=2&size=2",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["code"] for item in data["items"]] == ["SAVE2", "SAVE1"]
+        assert data["total"] == 5
+        assert data["pages"] == 3
+    
+    def test_list_coupons_by_cursor(self, client, admin_token, test_coupons):
+        """Test following next_cursor through to the last page."""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        
+        response = client.get("/api/v1/admin/coupons?size=2", headers=headers)
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["code"] for item in data["items"]] == ["SAVE4", "SAVE3"]
+        assert data["total"] == 5
+        assert data["next_cursor"]
+        
+        response = client.get(
+            "/api/v1/admin/coupons",
+            headers=headers,
+            params={"size": 2, "cursor": data["next_cursor"]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["code"] for item in data["items"]] == ["SAVE2", "SAVE1"]
+        assert data["total"] is None
+        assert data["pages"] is None
+        assert data["next_cursor"]
+        
+        response = client.get(
+            "/api/v1/admin/coupons",
+            headers=headers,
+            params={"size": 2, "cursor": data["next_cursor"]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["code"] for item in data["items"]] == ["SAVE0"]
+        assert data["next_cursor"] is None
+    
+    def test_list_coupons_by_cursor_with_total(self, client, admin_token, test_coupons):
+        """Test that include_total counts matches on cursor pages."""
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        first = client.get("/api/v1/admin/coupons?size=2&is_active=true", headers=headers).json()
+        assert [item["code"] for item in first["items"]] == ["SAVE4", "SAVE2"]
+        
+        response = client.get(
+            "/api/v1/admin/coupons",
+            headers=headers,
+            params={
+                "size": 2,
+                "is_active": True,
+                "cursor": first["next_cursor"],
+                "include_total": True,
+            },
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [item["code"] for item in data["items"]] == ["SAVE0"]
+        assert data["total"] == 3
+        assert data["pages"] == 2
+        assert data["next_cursor"] is None
+    
+    def test_list_coupons_invalid_cursor(self, client, admin_token):
+        """Test that a malformed cursor is rejected."""
+        response = client.get(
+            "/api/v1/admin/coupons?cursor=not-a-cursor",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST